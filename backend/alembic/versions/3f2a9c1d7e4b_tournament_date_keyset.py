@@ -0,0 +1,68 @@
+"""tournament date as timestamp and keyset pagination indexes
+
+Revision ID: 3f2a9c1d7e4b
+Revises:
+Create Date: 2026-10-19 10:00:00.000000
+
+First revision of the tree. The API startup hook (main.py) runs create_all,
+so a database it created already has the timestamp column and both
+indexes: each step below checks the live schema first and the upgrade is a
+no-op there. Running it (or `alembic stamp 3f2a9c1d7e4b`) records the
+revision for later migrations.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f2a9c1d7e4b"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_tournaments_date_id": ["date", "id"],
+    "ix_tournaments_format_date_id": ["format", "date", "id"],
+}
+
+
+def _existing_indexes() -> set:
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("tournaments")}
+
+
+def _date_is_timestamp() -> bool:
+    columns = {column["name"]: column["type"] for column in sa.inspect(op.get_bind()).get_columns("tournaments")}
+    return isinstance(columns["date"], sa.DateTime)
+
+
+def upgrade() -> None:
+    if not _date_is_timestamp():
+        # Dates were stored as ISO 8601 strings; empty strings become NULL.
+        with op.batch_alter_table("tournaments") as batch_op:
+            batch_op.alter_column(
+                "date",
+                existing_type=sa.String(),
+                type_=sa.DateTime(timezone=True),
+                postgresql_using="NULLIF(date, '')::timestamptz",
+            )
+
+    existing = _existing_indexes()
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "tournaments", columns)
+
+
+def downgrade() -> None:
+    existing = _existing_indexes()
+    for name in reversed(list(INDEXES)):
+        if name in existing:
+            op.drop_index(name, table_name="tournaments")
+
+    if _date_is_timestamp():
+        with op.batch_alter_table("tournaments") as batch_op:
+            batch_op.alter_column(
+                "date",
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.String(),
+                postgresql_using="to_char(date AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS')",
+            )
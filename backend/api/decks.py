@@ -0,0 +1,127 @@
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from typing import Any, Dict, Iterator, List, Optional
+from datetime import date, datetime, time
+import csv
+import io
+import json
+
+from ..database import (
+    analysis_tournaments_table, archetypes_table, decks_table, engine, formats_table,
+)
+
+router = APIRouter(prefix="/api/decks", tags=["decks"])
+
+# Lignes lues par aller-retour sur le curseur serveur
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = [
+    "id", "tournament_id", "tournament_name", "tournament_date", "format",
+    "player_name", "result", "archetype", "base_archetype", "archetype_confidence",
+    "mainboard", "sideboard"
+]
+
+def _export_query(format: Optional[str], date_from: Optional[date], date_to: Optional[date], archetype: Optional[str]):
+    """Requête d'export sur les tables d'analyse (remplies par les workers populate)"""
+    tournaments = analysis_tournaments_table
+    query = select(
+        decks_table.c.deck_id.label("id"),
+        decks_table.c.tournament_id,
+        tournaments.c.tournament_name,
+        tournaments.c.tournament_date,
+        formats_table.c.format_name.label("format"),
+        decks_table.c.player_name,
+        archetypes_table.c.archetype_name.label("archetype"),
+        decks_table.c.base_archetype_name.label("base_archetype"),
+        decks_table.c.archetype_confidence,
+        decks_table.c.decklist_json
+    ).join(
+        tournaments, decks_table.c.tournament_id == tournaments.c.tournament_id
+    ).outerjoin(
+        formats_table, tournaments.c.format_id == formats_table.c.format_id
+    ).outerjoin(
+        archetypes_table, decks_table.c.archetype_id == archetypes_table.c.archetype_id
+    )
+
+    if format:
+        query = query.where(formats_table.c.format_name == format)
+    if date_from:
+        query = query.where(tournaments.c.tournament_date >= datetime.combine(date_from, time.min))
+    if date_to:
+        query = query.where(tournaments.c.tournament_date <= datetime.combine(date_to, time.max))
+    if archetype:
+        query = query.where(archetypes_table.c.archetype_name == archetype)
+
+    return query.order_by(tournaments.c.tournament_date, decks_table.c.deck_id)
+
+def _board(cards: Optional[List[Dict[str, Any]]]) -> Dict[str, int]:
+    """Liste MTGODecklistCache ([{"Count", "CardName"}]) -> {carte: quantité}"""
+    board: Dict[str, int] = {}
+    for card in cards or []:
+        name = card.get("CardName")
+        if name:
+            board[name] = board.get(name, 0) + int(card.get("Count", 1))
+    return board
+
+def _iter_rows(query) -> Iterator[dict]:
+    """
+    Parcourt le résultat par lots sur un curseur serveur (mémoire constante)
+
+    La connexion est ouverte ici et non via Depends(get_db) : une dépendance
+    est fermée avant que le corps d'une StreamingResponse soit envoyé.
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE).execute(query)
+        for row in result.mappings():
+            deck = dict(row)
+            decklist = json.loads(deck.pop("decklist_json") or "{}")
+            if deck["tournament_date"] is not None:
+                deck["tournament_date"] = deck["tournament_date"].isoformat()
+            deck["archetype"] = deck["archetype"] or "Unknown"
+            deck["result"] = decklist.get("Result")
+            deck["mainboard"] = _board(decklist.get("Mainboard"))
+            deck["sideboard"] = _board(decklist.get("Sideboard"))
+            yield deck
+
+def _ndjson_lines(rows: Iterator[dict]) -> Iterator[str]:
+    for deck in rows:
+        yield json.dumps(deck, ensure_ascii=False) + "\n"
+
+def _csv_lines(rows: Iterator[dict]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+
+    for deck in rows:
+        # Les listes de cartes restent du JSON dans leur cellule
+        deck["mainboard"] = json.dumps(deck["mainboard"], ensure_ascii=False)
+        deck["sideboard"] = json.dumps(deck["sideboard"], ensure_ascii=False)
+        writer.writerow(deck)
+
+        if buffer.tell() >= 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+@router.get("/export")
+def export_decks(
+    format: Optional[str] = Query(None, description="Filtrer par format"),
+    date_from: Optional[date] = Query(None, description="Date minimum du tournoi (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Date maximum du tournoi (YYYY-MM-DD)"),
+    archetype: Optional[str] = Query(None, description="Filtrer par archétype"),
+    output: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Format de sortie")
+):
+    """Export en flux de tous les decks correspondant aux filtres (NDJSON ou CSV)"""
+    rows = _iter_rows(_export_query(format, date_from, date_to, archetype))
+
+    if output == "csv":
+        return StreamingResponse(
+            _csv_lines(rows),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="decks.csv"'}
+        )
+
+    return StreamingResponse(_ndjson_lines(rows), media_type="application/x-ndjson")
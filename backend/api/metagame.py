@@ -1,43 +1,46 @@
 import logging
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, date
 
-from services.metagame_service import MetagameService
-from database import DatabaseClient
+from database import fetch_all
+from json_response import FastJSONResponse
+from services.matchup_matrix import MatchupMatrixCache
+from workers.job_queue import JobQueue
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 # --- Status Tracking ---
-# Simple in-memory dict to hold the state of the background task.
-# In a larger application, this would be replaced by Redis or a database table.
-task_status: Dict[str, Any] = {
-    "status": "idle", # idle, running, completed, failed
-    "progress": 0,
-    "total": 0,
-    "message": "",
-    "error": None,
-}
-
-# --- Client Initialization ---
-db_client = DatabaseClient()
-# Pass the status dict to the service so it can update it
-metagame_service = MetagameService(database_client=db_client, task_status_dict=task_status)
+# Data population runs in separate worker processes (see workers/populate_worker.py).
+# Job state and progress live in a SQLite queue shared by the API and the workers.
+# Opened on first use (not at import): importing the router creates no file.
+_job_queue: Optional[JobQueue] = None
+
+def get_job_queue() -> JobQueue:
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
 
 # --- Constants ---
 SUPPORTED_FORMATS = [
     "Standard", "Modern", "Legacy", "Vintage", "Pioneer", "Pauper", "Commander", "Limited"
 ]
+# Longest analysis window accepted by the matchup matrix (days)
+MAX_MATCHUP_WINDOW_DAYS = 365
+
+# Dense matchup matrices, computed once per (format, window) and reused for 5 minutes
+matchup_matrices = MatchupMatrixCache(fetch_all, ttl=300, max_entries=4 * len(SUPPORTED_FORMATS))
 
 # --- API Endpoints ---
 
 @router.get("/population-status")
-def get_population_status() -> Dict[str, Any]:
+def get_population_status(job_id: Optional[int] = None, job_queue: JobQueue = Depends(get_job_queue)) -> Dict[str, Any]:
     """
-    Returns the current status of the data population background task.
+    Returns the status of a data population job (default: the latest one).
     """
-    return task_status
+    return job_queue.job_status(job_id)
 
 @router.get("/formats")
 def get_supported_formats() -> List[str]:
@@ -47,27 +50,31 @@ def get_supported_formats() -> List[str]:
     return SUPPORTED_FORMATS
 
 @router.post("/populate-database")
-async def populate_database(
-    background_tasks: BackgroundTasks, 
+def populate_database(
     format_name: Optional[str] = None, 
-    start_date: Optional[date] = None
+    start_date: Optional[date] = None,
+    job_queue: JobQueue = Depends(get_job_queue),
 ):
     """
-    Endpoint to trigger the full data update process from Melee.gg.
-    This is a long-running task executed in the background.
+    Endpoint to trigger the full data update process from the decklist cache.
+    The job is queued; worker processes split it into one unit per tournament.
     """
-    if task_status["status"] == "running":
+    job_id = job_queue.create_job("populate", {
+        "format_name": format_name,
+        "start_date": start_date.isoformat() if start_date else None,
+    })
+    if job_id is None:
         raise HTTPException(status_code=409, detail="A data population task is already in progress.")
 
-    # Reset status and run the task
-    task_status.update({"status": "running", "progress": 0, "total": 0, "message": "Initializing...", "error": None})
-    background_tasks.add_task(metagame_service.update_metagame_data, format_name=format_name, start_date=start_date)
-    return {"message": "Metagame data update started in the background."}
+    return {"message": "Metagame data update queued.", "job_id": job_id}
 
 # --- Analysis Endpoints ---
+# Read-only queries go through database.fetch_all: asyncpg when installed,
+# otherwise the shared sync pool in a worker thread. With asyncpg, concurrent
+# dashboard requests are bounded by the connection pool, not the threadpool.
 
 @router.get("/analysis/metagame_share/{format_name}")
-def get_metagame_share(format_name: str, days: int = 14) -> Dict[str, Any]:
+async def get_metagame_share(format_name: str, days: int = 14) -> Dict[str, Any]:
     logger.info(f"Getting metagame share for {format_name} over the last {days} days.")
     
     end_date = datetime.now()
@@ -79,15 +86,15 @@ def get_metagame_share(format_name: str, days: int = 14) -> Dict[str, Any]:
         COUNT(d.deck_id) AS deck_count
     FROM decks d
     JOIN archetypes a ON d.archetype_id = a.archetype_id
-    JOIN tournaments t ON d.tournament_id = t.tournament_id
+    JOIN analysis_tournaments t ON d.tournament_id = t.tournament_id
     JOIN formats f ON t.format_id = f.format_id
-    WHERE f.format_name = %s AND t.tournament_date BETWEEN %s AND %s
+    WHERE f.format_name = :format_name AND t.tournament_date BETWEEN :start_date AND :end_date
     GROUP BY a.archetype_name
     ORDER BY deck_count DESC;
     """
     
     try:
-        results = db_client.execute_query(query, (format_name, start_date, end_date), fetch="all")
+        results = await fetch_all(query, {"format_name": format_name, "start_date": start_date, "end_date": end_date})
         
         total_decks = sum(row[1] for row in results)
         if total_decks == 0:
@@ -98,20 +105,20 @@ def get_metagame_share(format_name: str, days: int = 14) -> Dict[str, Any]:
             for row in results
         ]
         
-        return {
+        return FastJSONResponse(content={
             "format": format_name,
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
+            "start_date": start_date,
+            "end_date": end_date,
             "analysis_type": "metagame_share",
             "data": analysis_data
-        }
+        })
     except Exception as e:
         logger.error(f"Error getting metagame share analysis: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Error processing metagame analysis.")
 
 
 @router.get("/analysis/winrate_confidence/{format_name}")
-def get_winrate_confidence(format_name: str, days: int = 14) -> Dict[str, Any]:
+async def get_winrate_confidence(format_name: str, days: int = 14) -> Dict[str, Any]:
     # This implementation is now correct and uses the database
     logger.info(f"Getting winrate confidence for {format_name} over the last {days} days.")
     
@@ -127,9 +134,9 @@ def get_winrate_confidence(format_name: str, days: int = 14) -> Dict[str, Any]:
             FROM matches m
             JOIN decks d ON d.deck_id = m.deck1_id OR d.deck_id = m.deck2_id
             JOIN archetypes a ON a.archetype_id = d.archetype_id
-            JOIN tournaments t ON t.tournament_id = m.tournament_id
+            JOIN analysis_tournaments t ON t.tournament_id = m.tournament_id
             JOIN formats f ON t.format_id = f.format_id
-            WHERE f.format_name = %s AND t.tournament_date BETWEEN %s AND %s
+            WHERE f.format_name = :format_name AND t.tournament_date BETWEEN :start_date AND :end_date
             GROUP BY a.archetype_name
         )
         SELECT
@@ -141,7 +148,7 @@ def get_winrate_confidence(format_name: str, days: int = 14) -> Dict[str, Any]:
         ORDER BY winrate DESC;
     """
     try:
-        results = db_client.execute_query(query, (format_name, start_date, end_date), fetch="all")
+        results = await fetch_all(query, {"format_name": format_name, "start_date": start_date, "end_date": end_date})
         analysis_data = [
             {
                 "archetype": row[0],
@@ -149,66 +156,45 @@ def get_winrate_confidence(format_name: str, days: int = 14) -> Dict[str, Any]:
                 "confidence_interval": row[2]
             } for row in results
         ]
-        return {
+        return FastJSONResponse(content={
              "format": format_name,
              "analysis_type": "winrate_confidence",
              "data": analysis_data
-        }
+        })
     except Exception as e:
         logger.error(f"Error getting winrate/confidence analysis: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Error processing winrate analysis.")
 
 @router.get("/analysis/matchup_matrix/{format_name}")
-def get_matchup_matrix(format_name: str, days: int = 14) -> Dict[str, Any]:
+async def get_matchup_matrix(
+    format_name: str,
+    days: int = Query(14, ge=1, le=MAX_MATCHUP_WINDOW_DAYS),
+    top: Optional[int] = Query(None, ge=2, description="Keep only the N most played archetypes"),
+    min_matches: int = Query(6, ge=1, description="Minimum matches for a win rate to be reported"),
+) -> Dict[str, Any]:
+    """
+    Matchup matrix in array-of-arrays form: matrix[i][j] is the win rate (0-1)
+    of archetypes[i] against archetypes[j] (null if fewer than min_matches),
+    with the underlying win and match counts. Archetypes are ordered by
+    matches played. The dense matrix is cached per (format, days).
+    """
+    if format_name not in SUPPORTED_FORMATS:
+        raise HTTPException(status_code=404, detail=f"Unsupported format: {format_name}")
+
     logger.info(f"Getting matchup matrix for {format_name} over the last {days} days.")
-    
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
 
-    query = """
-        WITH ArchetypeMatches AS (
-            SELECT
-                a1.archetype_name AS archetype1,
-                a2.archetype_name AS archetype2,
-                SUM(CASE WHEN m.winner_deck_id = m.deck1_id THEN 1 ELSE 0 END) AS wins1,
-                SUM(CASE WHEN m.winner_deck_id = m.deck2_id THEN 1 ELSE 0 END) AS wins2
-            FROM matches m
-            JOIN decks d1 ON m.deck1_id = d1.deck_id
-            JOIN archetypes a1 ON d1.archetype_id = a1.archetype_id
-            JOIN decks d2 ON m.deck2_id = d2.deck_id
-            JOIN archetypes a2 ON d2.archetype_id = a2.archetype_id
-            JOIN tournaments t ON m.tournament_id = t.tournament_id
-            JOIN formats f ON t.format_id = f.format_id
-            WHERE f.format_name = %s AND a1.archetype_name != a2.archetype_name AND t.tournament_date BETWEEN %s AND %s
-            GROUP BY a1.archetype_name, a2.archetype_name
-        )
-        SELECT
-            archetype1,
-            archetype2,
-            (wins1::float / (wins1 + wins2)) * 100 AS winrate1
-        FROM ArchetypeMatches
-        WHERE (wins1 + wins2) > 5; -- Minimum number of matches for a matchup
-    """
     try:
-        results = db_client.execute_query(query, (format_name, start_date, end_date), fetch="all")
-        
-        matrix = {}
-        all_archetypes = set()
-        for row in results:
-            a1, a2, wr = row[0], row[1], row[2]
-            all_archetypes.add(a1)
-            all_archetypes.add(a2)
-            if a1 not in matrix: matrix[a1] = {}
-            if a2 not in matrix: matrix[a2] = {}
-            matrix[a1][a2] = wr
-            matrix[a2][a1] = 100 - wr
-            
-        return {
+        matrix = await matchup_matrices.get(format_name, days)
+        truncated = matrix.truncated(top)
+        return FastJSONResponse(content={
             "format": format_name,
+            "start_date": matrix.start_date,
+            "end_date": matrix.end_date,
             "analysis_type": "matchup_matrix",
-            "archetypes": sorted(list(all_archetypes)),
-            "matrix": matrix
-        }
+            "total_archetypes": len(matrix.archetypes),
+            "min_matches": min_matches,
+            **truncated.to_payload(min_matches)
+        })
     except Exception as e:
         logger.error(f"Error getting matchup matrix: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Error processing matchup matrix.") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Error processing matchup matrix.")
@@ -0,0 +1,81 @@
+"""
+Export en flux des decks (GET /api/decks/export) sur les tables d'analyse,
+dans une base construite comme celle de l'application (main.py puis workers)
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+REPO_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_DIR))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from backend import models  # noqa: E402
+from backend.api import decks  # noqa: E402
+from backend.database import DatabaseClient  # noqa: E402
+
+
+def _tournament(uid: str, date: str, players):
+    return {
+        "UID": uid,
+        "Tournament": {"Name": uid, "Date": date, "Format": "Modern"},
+        "Decks": [
+            {
+                "Player": player, "Result": "5-2", "Archetype": {"Archetype": archetype},
+                "Mainboard": [{"Count": 4, "CardName": "Lightning Bolt"}],
+                "Sideboard": [{"Count": 1, "CardName": "Blood Moon"}],
+            }
+            for player, archetype in players
+        ],
+    }
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metalyzr.sqlite3'}")
+    # Tables de l'API créées au démarrage (main.py), puis schéma d'analyse des workers
+    models.Base.metadata.create_all(bind=engine)
+    database = DatabaseClient(engine)
+    database.init_db()
+    with database.transaction() as conn:
+        for data in (
+            _tournament("challenge-1", "2024-01-06T00:00:00Z", [("alice", "Burn"), ("bob", "Amulet Titan")]),
+            _tournament("challenge-2", "2024-02-10T00:00:00Z", [("carol", "Burn")]),
+        ):
+            tournament_id = database.save_tournament(data, conn=conn)
+            for deck in data["Decks"]:
+                database.save_deck_and_cards(deck, tournament_id, conn=conn)
+
+    monkeypatch.setattr(decks, "engine", engine)
+    app = FastAPI()
+    app.include_router(decks.router)
+    return TestClient(app)
+
+
+def test_export_streams_ndjson(client):
+    response = client.get("/api/decks/export", params={"format": "Modern"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["player_name"] for row in rows] == ["alice", "bob", "carol"]
+    assert rows[0]["archetype"] == "Burn"
+    assert rows[0]["mainboard"] == {"Lightning Bolt": 4}
+    assert rows[0]["sideboard"] == {"Blood Moon": 1}
+    assert rows[0]["tournament_date"].startswith("2024-01-06")
+
+
+def test_export_filters_and_csv(client):
+    response = client.get("/api/decks/export", params={
+        "archetype": "Burn", "date_from": "2024-02-01", "output": "csv"
+    })
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert lines[0].split(",")[:3] == ["id", "tournament_id", "tournament_name"]
+    assert len(lines) == 2 and "carol" in lines[1]
@@ -1,34 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 
 from database import get_db
 from models import Tournament, Deck
+from pagination import keyset_page
 
 router = APIRouter(prefix="/api/tournaments", tags=["tournaments"])
 
 @router.get("/", response_model=List[dict])
 async def list_tournaments(
+    response: Response,
     format: Optional[str] = Query(None, description="Filtrer par format"),
+    start_date: Optional[datetime] = Query(None, description="Tournois à partir de cette date"),
+    end_date: Optional[datetime] = Query(None, description="Tournois jusqu'à cette date"),
     limit: int = Query(50, le=100, description="Nombre max de résultats"),
-    offset: int = Query(0, ge=0, description="Décalage pour pagination"),
+    cursor: Optional[str] = Query(None, description="Curseur de pagination (en-tête X-Next-Cursor de la page précédente)"),
     db: Session = Depends(get_db)
 ):
-    """Liste les tournois avec pagination et filtres"""
+    """Liste les tournois, du plus récent au plus ancien, paginés par curseur"""
     query = db.query(Tournament)
     
     if format:
         query = query.filter(Tournament.format == format)
+    if start_date:
+        query = query.filter(Tournament.date >= start_date)
+    if end_date:
+        query = query.filter(Tournament.date <= end_date)
     
-    tournaments = query.order_by(Tournament.date.desc()).offset(offset).limit(limit).all()
+    try:
+        tournaments, next_cursor = keyset_page(query, Tournament.date, Tournament.id, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Curseur de pagination invalide")
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return [
         {
             "id": t.id,
             "name": t.name,
             "format": t.format,
-            "date": t.date.isoformat(),
+            "date": t.date.isoformat() if t.date else None,
             "location": t.location,
             "total_players": t.total_players,
             "rounds": t.rounds,
@@ -52,7 +66,7 @@ async def get_tournament(tournament_id: int, db: Session = Depends(get_db)):
         "id": tournament.id,
         "name": tournament.name,
         "format": tournament.format,
-        "date": tournament.date.isoformat(),
+        "date": tournament.date.isoformat() if tournament.date else None,
         "location": tournament.location,
         "organizer": tournament.organizer,
         "total_players": tournament.total_players,
@@ -114,11 +128,13 @@ async def get_tournament_metagame(tournament_id: int, db: Session = Depends(get_
 @router.get("/{tournament_id}/decks")
 async def get_tournament_decks(
     tournament_id: int,
+    response: Response,
     archetype: Optional[str] = Query(None, description="Filtrer par archétype"),
     limit: int = Query(20, le=100),
+    cursor: Optional[str] = Query(None, description="Curseur de pagination (en-tête X-Next-Cursor de la page précédente)"),
     db: Session = Depends(get_db)
 ):
-    """Liste les decks d'un tournoi"""
+    """Liste les decks d'un tournoi par classement, paginés par curseur"""
     tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     
     if not tournament:
@@ -130,7 +146,13 @@ async def get_tournament_decks(
         from models import Archetype
         query = query.join(Archetype).filter(Archetype.name == archetype)
     
-    decks = query.order_by(Deck.position.asc()).limit(limit).all()
+    try:
+        decks, next_cursor = keyset_page(query, Deck.position, Deck.id, limit, cursor, descending=False)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Curseur de pagination invalide")
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return [
         {
@@ -35,4 +35,5 @@ async def read_tournaments_from_api(db: Session = Depends(get_db)):
         crud.create_tournament(db=db, tournament=t_data)
         
     # Return all tournaments from the database
-    return crud.get_tournaments(db, skip=0, limit=100) 
\ No newline at end of file
+    tournaments, _ = crud.get_tournaments(db, limit=100)
+    return tournaments
@@ -0,0 +1,143 @@
+"""
+Middleware ASGI des réponses JSON du backend MVP (main_simple.py)
+Remplace l'ancien @app.middleware("http") (BaseHTTPMiddleware) : seules les
+réponses application/json sont modifiées, les autres passent sans surcoût.
+- navigateurs : Content-Type "application/json; charset=utf-8"
+- JSON volumineux : compression gzip (ou brotli si le paquet est installé)
+Les corps streamés sont compressés au fil de l'eau, jamais mis en mémoire.
+"""
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# brotli est optionnel : sans lui, seul gzip est proposé
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BROWSER_MARKERS = ("Mozilla", "Chrome")
+JSON_CONTENT_TYPE = "application/json"
+
+class _Compressor:
+    """Compression incrémentale (gzip ou brotli) d'un corps de réponse"""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=min(level, 11))
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._compressor.process(data)
+            return out + (self._compressor.finish() if final else self._compressor.flush())
+        out = self._compressor.compress(data)
+        return out + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+class JSONResponseMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    def _encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = {token.split(";")[0].strip() for token in accept_encoding.split(",")}
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        user_agent = request_headers.get("user-agent", "")
+        browser = any(marker in user_agent for marker in BROWSER_MARKERS)
+        encoding = self._encoding(request_headers.get("accept-encoding", ""))
+
+        # Rien à modifier pour ce client : aucune enveloppe
+        if not browser and encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _JSONResponder(self, browser, encoding, send)(scope, receive)
+
+class _JSONResponder:
+    """État d'une réponse : l'en-tête n'est retenu que le temps de voir le premier morceau du corps"""
+
+    def __init__(self, middleware: JSONResponseMiddleware, browser: bool, encoding: Optional[str], send: Send):
+        self.middleware = middleware
+        self.browser = browser
+        self.encoding = encoding
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive):
+        await self.middleware.app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message):
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            if not headers.get("content-type", "").startswith(JSON_CONTENT_TYPE):
+                self.passthrough = True
+                await self.send(message)
+                return
+
+            if self.browser:
+                headers["content-type"] = "application/json; charset=utf-8"
+
+            content_length = headers.get("content-length")
+            if (self.encoding is None or "content-encoding" in headers
+                    or (content_length is not None and int(content_length) < self.middleware.minimum_size)):
+                self.passthrough = True
+                await self.send(message)
+                return
+
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start_message, self.start_message = self.start_message, None
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.send(start_message)
+                await self.send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["content-encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            del headers["content-length"]
+            self.compressor = _Compressor(self.encoding, self.middleware.compresslevel)
+            body = self.compressor.compress(body, final=not more_body)
+            if not more_body:
+                headers["content-length"] = str(len(body))
+            await self.send(start_message)
+            await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        await self.send({
+            "type": "http.response.body",
+            "body": self.compressor.compress(body, final=not more_body),
+            "more_body": more_body
+        })
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark du middleware des réponses JSON de main_simple
+Compare l'ancien @app.middleware("http") (BaseHTTPMiddleware) au middleware
+ASGI pur (asgi_middleware.py), en appelant l'application ASGI directement
+(sans réseau ni client HTTP) pour ne mesurer que la pile serveur.
+
+Usage:
+    python bench_middleware.py --requests 2000
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Tuple
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from asgi_middleware import JSONResponseMiddleware
+
+BROWSER = {"user-agent": "Mozilla/5.0 Chrome/126.0"}
+BROWSER_GZIP = {**BROWSER, "accept-encoding": "gzip, deflate, br"}
+CLIENT = {"user-agent": "python-httpx/0.27"}
+
+SMALL_PAYLOAD = {"status": "healthy", "service": "Metalyzr MVP", "version": "2.0.0"}
+LARGE_PAYLOAD = {
+    "tournaments": [
+        {"name": f"Modern Challenge {i}", "date": "2024-01-15", "format": "Modern",
+         "players": 128, "source": "mtgo.com", "decks": [{"player": f"p{j}", "archetype": "Burn"} for j in range(16)]}
+        for i in range(200)
+    ]
+}
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    if variant == "legacy":
+        @app.middleware("http")
+        async def add_json_formatting(request, call_next):
+            response = await call_next(request)
+            if response.headers.get("content-type", "").startswith("application/json"):
+                if "Mozilla" in request.headers.get("user-agent", "") or "Chrome" in request.headers.get("user-agent", ""):
+                    response.headers["content-type"] = "application/json; charset=utf-8"
+            return response
+    elif variant == "asgi":
+        app.add_middleware(JSONResponseMiddleware, minimum_size=1024)
+
+    @app.get("/small")
+    async def small():
+        return JSONResponse(content=SMALL_PAYLOAD)
+
+    @app.get("/large")
+    async def large():
+        return JSONResponse(content=LARGE_PAYLOAD)
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(50):
+                yield f'{{"line": {i}}}\n'
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app
+
+async def call(app, path: str, headers: Dict[str, str]) -> Tuple[int, int]:
+    """(statut, octets du corps) d'une requête GET"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "",
+        "headers": [(name.encode(), value.encode()) for name, value in headers.items()],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+    }
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # Pas de déconnexion pendant la réponse
+
+    status, size = 0, 0
+
+    async def send(message):
+        nonlocal status, size
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, size
+
+async def measure(app, path: str, headers: Dict[str, str], requests: int) -> Tuple[float, int]:
+    for _ in range(min(50, requests)):
+        await call(app, path, headers)
+    start = time.perf_counter()
+    for _ in range(requests):
+        _, size = await call(app, path, headers)
+    return requests / (time.perf_counter() - start), size
+
+async def run(requests: int):
+    apps = {variant: build_app(variant) for variant in ("none", "legacy", "asgi")}
+    scenarios: List[Tuple[str, str, Dict[str, str]]] = [
+        ("small JSON, API client", "/small", CLIENT),
+        ("small JSON, browser", "/small", BROWSER),
+        ("large JSON, browser", "/large", BROWSER),
+        ("large JSON, browser + gzip", "/large", BROWSER_GZIP),
+        ("NDJSON stream, browser", "/stream", BROWSER),
+    ]
+
+    print(f"{'scenario':<30} {'variant':<8} {'req/s':>10} {'body bytes':>12}")
+    for label, path, headers in scenarios:
+        for variant, app in apps.items():
+            rate, size = await measure(app, path, headers, requests)
+            print(f"{label:<30} {variant:<8} {rate:>10.0f} {size:>12}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du middleware JSON de main_simple")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+if __name__ == "__main__":
+    main()
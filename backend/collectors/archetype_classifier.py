@@ -2,12 +2,16 @@
 Classificateur d'archétypes basé sur des règles
 Inspiré de MTGOArchetypeParser (Badaro) mais adapté en Python pour Metalyzr
 """
+import heapq
 import logging
 import re
 from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+import deck_store
+from card_database import card_database, colors_to_mask
+
 class ArchetypeConfidence(Enum):
     """Niveaux de confiance pour la classification"""
     HIGH = "high"        # 90%+ confiance
@@ -50,6 +54,121 @@ class ArchetypeMatch:
     matched_rules: List[str]
     signature_cards_found: List[str]
     missing_cards: List[str]
+    alternatives: List['ArchetypeMatch'] = field(default_factory=list)  # Rempli avec explain=True
+
+# Colonnes de la matrice règles x cartes
+REQUIRED, SIGNATURE, FORBIDDEN = 0, 1, 2
+
+@dataclass
+class CompiledRules:
+    """
+    Règles d'un format compilées en matrice creuse règles x cartes
+    postings[carte] liste les (règle, colonne) où la carte apparaît : le
+    produit avec le vecteur indicateur d'un deck donne, en un passage sur
+    ses cartes, les cartes requises/signature/interdites trouvées par règle
+    """
+    rules: List[ArchetypeRule]
+    postings: Dict[str, List[tuple]] = field(default_factory=dict)
+    required_totals: List[int] = field(default_factory=list)
+    signature_totals: List[int] = field(default_factory=list)
+    min_counts: List[List[tuple]] = field(default_factory=list)
+    color_masks: List[int] = field(default_factory=list)
+    color_totals: List[int] = field(default_factory=list)
+    weights: List[float] = field(default_factory=list)
+    # Règles par borne supérieure de score décroissante (sortie anticipée de best())
+    bound_order: List[tuple] = field(default_factory=list)
+
+    @classmethod
+    def compile(cls, rules: List[ArchetypeRule]) -> 'CompiledRules':
+        compiled = cls(rules=list(rules))
+        for index, rule in enumerate(rules):
+            for column, cards in ((REQUIRED, rule.required_cards),
+                                  (SIGNATURE, rule.signature_cards),
+                                  (FORBIDDEN, rule.forbidden_cards)):
+                for card in cards:
+                    compiled.postings.setdefault(card, []).append((index, column))
+            compiled.required_totals.append(len(rule.required_cards))
+            compiled.signature_totals.append(len(rule.signature_cards))
+            compiled.min_counts.append(list(rule.min_card_count.items()))
+            compiled.color_masks.append(colors_to_mask(rule.color_identity))
+            compiled.color_totals.append(len(rule.color_identity))
+            compiled.weights.append(rule.weight)
+
+            bound = (40 * bool(rule.required_cards) + 30 * bool(rule.signature_cards)
+                     + 10 * len(rule.min_card_count) + 20 * bool(rule.color_identity)) * rule.weight
+            if rule.weight <= 0:
+                bound = float("inf")  # Un poids négatif peut rendre positif un score négatif
+            compiled.bound_order.append((bound, index))
+
+        compiled.bound_order.sort(key=lambda item: (-item[0], item[1]))
+        return compiled
+
+    def _hits(self, all_cards: Dict[str, int]) -> List[List[int]]:
+        """Cartes requises/signature/interdites trouvées, par règle (un passage sur le deck)"""
+        hits = [[0, 0, 0] for _ in self.rules]
+        for card in all_cards:
+            for index, column in self.postings.get(card, ()):
+                hits[index][column] += 1
+        return hits
+
+    def _score(self, index: int, hits: List[int], all_cards: Dict[str, int], deck_mask: int) -> float:
+        """Mêmes opérations flottantes, dans le même ordre, que _evaluate_rule"""
+        required, signature, forbidden = hits
+        score = 0.0
+
+        required_total = self.required_totals[index]
+        if required_total > 0:
+            required_ratio = required / required_total
+            if required_ratio < 0.5:
+                return 0.0
+            score += required_ratio * 40
+
+        signature_total = self.signature_totals[index]
+        if signature_total > 0:
+            score += signature / signature_total * 30
+
+        for _ in range(forbidden):
+            score -= 20
+
+        for card, min_count in self.min_counts[index]:
+            if all_cards.get(card, 0) >= min_count:
+                score += 10
+            else:
+                score -= 5
+
+        color_total = self.color_totals[index]
+        if color_total:
+            score += bin(self.color_masks[index] & deck_mask).count("1") / color_total * 20
+
+        score *= self.weights[index]
+        return max(0, score)
+
+    def scores(self, all_cards: Dict[str, int], deck_mask: int) -> List[float]:
+        """Scores de toutes les règles pour un deck"""
+        hits = self._hits(all_cards)
+        return [self._score(index, rule_hits, all_cards, deck_mask) for index, rule_hits in enumerate(hits)]
+
+    def best(self, all_cards: Dict[str, int], deck_mask: int) -> Optional[tuple]:
+        """
+        (index, score) de la meilleure règle, None si aucun score positif
+        Les règles sont parcourues par borne décroissante : on s'arrête dès
+        qu'aucune règle restante ne peut dépasser le meilleur score. À score
+        égal, la première règle déclarée l'emporte (comme le tri stable).
+        """
+        hits = self._hits(all_cards)
+        best_index, best_score = None, 0
+        for bound, index in self.bound_order:
+            if bound < best_score:
+                break
+            score = self._score(index, hits[index], all_cards, deck_mask)
+            if score > best_score or (score == best_score and best_index is not None and index < best_index):
+                best_index, best_score = index, score
+        return (best_index, best_score) if best_index is not None else None
+
+    def top(self, all_cards: Dict[str, int], deck_mask: int, k: int) -> List[tuple]:
+        """k meilleures règles (index, score) à score positif, par score décroissant"""
+        positive = ((index, score) for index, score in enumerate(self.scores(all_cards, deck_mask)) if score > 0)
+        return heapq.nlargest(k, positive, key=lambda item: item[1])
 
 class ArchetypeClassifier:
     """
@@ -60,6 +179,8 @@ class ArchetypeClassifier:
     def __init__(self):
         self.logger = logging.getLogger("scraper.archetype_classifier")
         self.rules: Dict[str, List[ArchetypeRule]] = {}
+        # Règles compilées par format (recompilées si la liste change)
+        self._compiled: Dict[str, CompiledRules] = {}
         self._load_default_rules()
     
     def _load_default_rules(self):
@@ -142,14 +263,21 @@ class ArchetypeClassifier:
     
     def classify_deck(self, mainboard: Dict[str, int], 
                      sideboard: Dict[str, int] = None,
-                     format_name: str = "Modern") -> ArchetypeMatch:
+                     format_name: str = "Modern",
+                     explain: bool = False,
+                     top_k: int = 3) -> ArchetypeMatch:
         """
         Classifier un deck selon les règles d'archétypes
         
+        Seuls les scores numériques sont calculés ; le détail (règles, cartes
+        trouvées/manquantes) n'est construit que pour le meilleur match.
+        
         Args:
             mainboard: Cartes du mainboard {nom: quantité}
             sideboard: Cartes du sideboard {nom: quantité}
             format_name: Format du deck
+            explain: Joindre les top_k candidats détaillés (diagnostic)
+            top_k: Nombre de candidats retenus avec explain=True
             
         Returns:
             ArchetypeMatch avec le meilleur match trouvé
@@ -164,23 +292,61 @@ class ArchetypeClassifier:
         all_cards = {**mainboard, **sideboard}
         card_names = set(all_cards.keys())
         
-        matches = []
+        compiled = self._compiled_rules(format_name, format_rules)
+        deck_mask = card_database.deck_identity_mask(card_names)
         
-        for rule in format_rules:
-            match_result = self._evaluate_rule(rule, all_cards, card_names, mainboard)
-            if match_result.score > 0:
-                matches.append(match_result)
+        if explain:
+            candidates = [
+                self._evaluate_rule(compiled.rules[index], all_cards, card_names, mainboard)
+                for index, _ in compiled.top(all_cards, deck_mask, max(top_k, 1))
+            ]
+            if not candidates:
+                return self._unknown_archetype()
+            for candidate in candidates:
+                candidate.confidence = self._calculate_confidence(candidate.score)
+            best_match = candidates[0]
+            best_match.alternatives = candidates[1:]
+            return best_match
         
-        # Trier par score décroissant
-        matches.sort(key=lambda x: x.score, reverse=True)
+        best = compiled.best(all_cards, deck_mask)
+        if best is None:
+            return self._unknown_archetype()
         
-        if matches:
-            best_match = matches[0]
-            # Ajuster la confiance selon le score
-            best_match.confidence = self._calculate_confidence(best_match.score)
-            return best_match
+        best_match = self._evaluate_rule(compiled.rules[best[0]], all_cards, card_names, mainboard)
+        # Ajuster la confiance selon le score
+        best_match.confidence = self._calculate_confidence(best_match.score)
+        return best_match
+    
+    def _compiled_rules(self, format_name: str, format_rules: List[ArchetypeRule]) -> CompiledRules:
+        """Règles compilées du format (compilation au premier usage)"""
+        compiled = self._compiled.get(format_name)
+        if compiled is None or len(compiled.rules) != len(format_rules) or any(
+            a is not b for a, b in zip(compiled.rules, format_rules)
+        ):
+            compiled = self._compiled[format_name] = CompiledRules.compile(format_rules)
+        return compiled
+    
+    def score_decks(self, decks: List[Dict[str, int]], format_name: str = "Modern") -> List[List[float]]:
+        """
+        Scores de toutes les règles du format pour un lot de decks
+        
+        Args:
+            decks: Cartes de chaque deck {nom: quantité} (main + side)
+            format_name: Format des decks
+            
+        Returns:
+            Une ligne de scores par deck, dans l'ordre de self.rules[format_name]
+        """
+        format_rules = self.rules.get(format_name, [])
+        if not format_rules:
+            return [[] for _ in decks]
         
-        return self._unknown_archetype()
+        compiled = self._compiled_rules(format_name, format_rules)
+        return [compiled.scores(cards, card_database.deck_identity_mask(cards)) for cards in decks]
+    
+    def classify_stored_deck(self, store, index: int, format_name: Optional[str] = None) -> ArchetypeMatch:
+        """Classifier un deck lu dans un DeckStore (voir deck_store.classify_stored_deck)"""
+        return deck_store.classify_stored_deck(self, store, index, format_name)
     
     def _evaluate_rule(self, rule: ArchetypeRule, 
                       all_cards: Dict[str, int],
@@ -276,40 +442,9 @@ class ArchetypeClassifier:
     def _extract_colors(self, card_names: Set[str]) -> Set[str]:
         """
         Extraire les couleurs d'un deck basé sur les noms de cartes
-        Version simplifiée - dans un vrai système, on utiliserait une DB de cartes
+        (identité colorielle de la base de cartes hors ligne)
         """
-        colors = set()
-        
-        # Mapping basique des cartes connues vers leurs couleurs
-        color_mapping = {
-            # Cartes rouges
-            "Lightning Bolt": "R", "Goblin Guide": "R", "Lava Spike": "R",
-            "Monastery Swiftspear": "R", "Lightning Strike": "R",
-            
-            # Cartes bleues  
-            "Counterspell": "U", "Cryptic Command": "U", "Force of Negation": "U",
-            "Lord of Atlantis": "U", "Teferi, Hero of Dominaria": "UW",
-            
-            # Cartes blanches
-            "Wrath of God": "W", "Supreme Verdict": "UW", "Swords to Plowshares": "W",
-            
-            # Cartes noires
-            "Liliana of the Veil": "B", "Inquisition of Kozilek": "B",
-            "Vraska's Contempt": "B",
-            
-            # Cartes vertes
-            "Tarmogoyf": "G", "Primeval Titan": "G",
-            
-            # Multicolores
-            "Boros Charm": "RW", "Bloodbraid Elf": "RG"
-        }
-        
-        for card in card_names:
-            if card in color_mapping:
-                card_colors = color_mapping[card]
-                colors.update(list(card_colors))
-        
-        return colors
+        return set(card_database.deck_colors(card_names))
     
     def _unknown_archetype(self) -> ArchetypeMatch:
         """Retourner un match 'Unknown' par défaut"""
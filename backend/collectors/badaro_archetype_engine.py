@@ -2,14 +2,25 @@
 Engine d'archétypes inspiré directement de MTGOArchetypeParser (Badaro)
 Implémentation Python des règles de production MTGO
 """
+import asyncio
 import json
 import logging
 from typing import Dict, List, Optional, Set, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
-import requests
+import aiohttp
 from pathlib import Path
 import os
+import threading
+
+import deck_store
+import format_bundle
+from http_session import http_sessions
+from card_registry import card_registry
+from card_database import card_database, colors_to_mask, mask_to_colors
+
+# Formats publiés par Badaro/MTGOFormatData
+DEFAULT_FORMATS = ["Modern", "Standard", "Pioneer", "Legacy", "Vintage", "Pauper"]
 
 class ConditionType(Enum):
     """Types de conditions Badaro"""
@@ -36,7 +47,7 @@ class ArchetypeCondition:
     def from_dict(cls, data: dict) -> 'ArchetypeCondition':
         return cls(
             type=ConditionType(data["Type"]),
-            cards=data["Cards"]
+            cards=[card_registry.canonical(card) for card in data["Cards"]]
         )
 
 @dataclass  
@@ -91,7 +102,7 @@ class FallbackDefinition:
         return cls(
             name=name,
             include_color_in_name=data.get("IncludeColorInName", True),
-            common_cards=data.get("CommonCards", [])
+            common_cards=[card_registry.canonical(card) for card in data.get("CommonCards", [])]
         )
 
 @dataclass
@@ -105,6 +116,57 @@ class BadaroClassificationResult:
     fallback_match_count: int = 0
     color_identity: str = ""
 
+@dataclass(frozen=True)
+class DefinitionsSnapshot:
+    """
+    Définitions compilées, immuables une fois publiées
+    Un rechargement construit un nouveau snapshot puis remplace la référence
+    de l'engine en une seule affectation : une classification en cours garde
+    l'ancien jeu complet, jamais un mélange des deux versions.
+    """
+    version: Optional[str] = None
+    format_definitions: Dict[str, Dict[str, ArchetypeDefinition]] = field(default_factory=dict)
+    format_fallbacks: Dict[str, Dict[str, FallbackDefinition]] = field(default_factory=dict)
+    color_overrides: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @staticmethod
+    def compile_format(data: Dict[str, Any]):
+        """Compiler les données brutes d'un format (archétypes, fallbacks, overrides)"""
+        archetypes = {
+            archetype_name: ArchetypeDefinition.from_dict(archetype_name, archetype_data)
+            for archetype_name, archetype_data in data.get("archetypes", {}).items()
+        }
+        fallbacks = {
+            fallback_name: FallbackDefinition.from_dict(fallback_name, fallback_data)
+            for fallback_name, fallback_data in data.get("fallbacks", {}).items()
+        }
+        return archetypes, fallbacks, data.get("color_overrides", {})
+
+    @classmethod
+    def from_bundle(cls, version: str, formats: Dict[str, Dict[str, Any]]) -> 'DefinitionsSnapshot':
+        """Compiler tous les formats d'un bundle"""
+        snapshot = cls(version=version)
+        for format_name, data in formats.items():
+            archetypes, fallbacks, overrides = cls.compile_format(data)
+            snapshot.format_definitions[format_name] = archetypes
+            snapshot.format_fallbacks[format_name] = fallbacks
+            snapshot.color_overrides[format_name] = overrides
+        return snapshot
+
+    def with_format(self, format_name: str, data: Dict[str, Any]) -> 'DefinitionsSnapshot':
+        """
+        Copie du snapshot avec un format remplacé (les autres formats sont partagés)
+        La copie ne correspond plus à aucun bundle : sans version, le prochain
+        load_bundle / reload_if_changed republie le bundle complet.
+        """
+        archetypes, fallbacks, overrides = self.compile_format(data)
+        return DefinitionsSnapshot(
+            version=None,
+            format_definitions={**self.format_definitions, format_name: archetypes},
+            format_fallbacks={**self.format_fallbacks, format_name: fallbacks},
+            color_overrides={**self.color_overrides, format_name: overrides}
+        )
+
 class BadaroArchetypeEngine:
     """
     Engine d'archétypes basé sur la logique exacte de MTGOArchetypeParser
@@ -119,11 +181,37 @@ class BadaroArchetypeEngine:
         # URLs des données Badaro
         self.badaro_base_url = "https://raw.githubusercontent.com/Badaro/MTGOFormatData/main/Formats"
         
-        # Cache des définitions par format
-        self.format_definitions: Dict[str, Dict[str, ArchetypeDefinition]] = {}
-        self.format_fallbacks: Dict[str, Dict[str, FallbackDefinition]] = {}
-        self.color_overrides: Dict[str, Dict[str, str]] = {}
-        
+        # Bundles versionnés (un fichier par SHA upstream + pointeur CURRENT)
+        self.bundle_dir = Path(os.getenv("BADARO_BUNDLE_DIR", str(self.cache_dir / "bundles")))
+
+        # Définitions compilées de tous les formats, remplacées d'un bloc
+        self._snapshot = DefinitionsSnapshot()
+        # Sérialise les écrivains (chargements concurrents de formats)
+        self._swap_lock = threading.Lock()
+        # Surveillance du pointeur CURRENT (voir start)
+        self._watch_task: Optional[asyncio.Task] = None
+
+    @property
+    def format_definitions(self) -> Dict[str, Dict[str, ArchetypeDefinition]]:
+        return self._snapshot.format_definitions
+
+    @property
+    def format_fallbacks(self) -> Dict[str, Dict[str, FallbackDefinition]]:
+        return self._snapshot.format_fallbacks
+
+    @property
+    def color_overrides(self) -> Dict[str, Dict[str, Any]]:
+        return self._snapshot.color_overrides
+
+    @property
+    def definitions_version(self) -> Optional[str]:
+        """SHA upstream des définitions en service (None hors bundle)"""
+        return self._snapshot.version
+
+    def _publish(self, snapshot: DefinitionsSnapshot):
+        """Publier un snapshot (affectation atomique d'une seule référence)"""
+        self._snapshot = snapshot
+
     async def load_format_definitions(self, format_name: str, force_refresh: bool = False) -> bool:
         """
         Charger les définitions d'archétypes pour un format depuis GitHub Badaro
@@ -141,10 +229,9 @@ class BadaroArchetypeEngine:
             # Utiliser le cache si disponible et pas de refresh forcé
             if cache_file.exists() and not force_refresh:
                 self.logger.info(f"Loading {format_name} definitions from cache")
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    self._parse_format_data(format_name, cached_data)
-                    return True
+                cached_data = await asyncio.to_thread(self._read_cache_file, cache_file)
+                self._parse_format_data(format_name, cached_data)
+                return True
             
             # Télécharger depuis GitHub Badaro
             self.logger.info(f"Downloading {format_name} definitions from Badaro GitHub")
@@ -156,27 +243,21 @@ class BadaroArchetypeEngine:
                 "color_overrides": f"{self.badaro_base_url}/{format_name}/color_overrides.json"
             }
             
-            format_data = {"archetypes": {}, "fallbacks": {}, "color_overrides": {}}
-            
-            # Charger les archétypes
-            archetypes_data = await self._fetch_directory_files(urls["archetypes"])
-            format_data["archetypes"] = archetypes_data
-            
-            # Charger les fallbacks
-            fallbacks_data = await self._fetch_directory_files(urls["fallbacks"])
-            format_data["fallbacks"] = fallbacks_data
+            # Archétypes, fallbacks et overrides de couleurs en parallèle
+            archetypes_data, fallbacks_data, color_overrides = await asyncio.gather(
+                self._fetch_directory_files(urls["archetypes"]),
+                self._fetch_directory_files(urls["fallbacks"]),
+                self._fetch_color_overrides(urls["color_overrides"])
+            )
             
-            # Charger les overrides de couleurs
-            try:
-                color_response = requests.get(urls["color_overrides"], timeout=10)
-                if color_response.status_code == 200:
-                    format_data["color_overrides"] = color_response.json()
-            except Exception as e:
-                self.logger.warning(f"Could not load color overrides: {e}")
+            format_data = {
+                "archetypes": archetypes_data,
+                "fallbacks": fallbacks_data,
+                "color_overrides": color_overrides
+            }
             
             # Sauvegarder en cache
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(format_data, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._write_cache_file, cache_file, format_data)
             
             # Parser les données
             self._parse_format_data(format_name, format_data)
@@ -188,27 +269,91 @@ class BadaroArchetypeEngine:
             self.logger.error(f"Failed to load {format_name} definitions: {e}")
             return False
     
+    async def load_all_formats(self, 
+                              formats: Optional[List[str]] = None, 
+                              force_refresh: bool = False) -> Dict[str, bool]:
+        """
+        Charger les définitions de plusieurs formats en parallèle
+        
+        Un bundle installé (pointeur CURRENT) est préféré : tous ses formats
+        sont basculés d'un coup. Sans bundle, ou avec force_refresh, chaque
+        format est lu dans son cache JSON ou téléchargé depuis GitHub.
+        
+        Args:
+            formats: Formats à charger (défaut: les six formats Badaro)
+            force_refresh: Forcer le rechargement depuis GitHub
+            
+        Returns:
+            Résultat du chargement par format
+        """
+        formats = formats or DEFAULT_FORMATS
+        if not force_refresh and await asyncio.to_thread(format_bundle.current_version, self.bundle_dir):
+            if await self.load_bundle():
+                loaded = self.format_definitions
+                return {format_name: format_name in loaded for format_name in formats}
+        
+        results = await asyncio.gather(*(
+            self.load_format_definitions(format_name, force_refresh=force_refresh)
+            for format_name in formats
+        ))
+        return dict(zip(formats, results))
+    
+    def _read_cache_file(self, cache_file: Path) -> Dict[str, Any]:
+        """Lire le cache JSON d'un format (exécuté hors event loop)"""
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _write_cache_file(self, cache_file: Path, format_data: Dict[str, Any]):
+        """Écrire le cache JSON d'un format (exécuté hors event loop)"""
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(format_data, f, indent=2, ensure_ascii=False)
+    
+    def _http_session(self) -> aiohttp.ClientSession:
+        """Session du pool partagé (les limites par hôte bornent la concurrence)"""
+        return http_sessions.get_session("badaro", timeout=aiohttp.ClientTimeout(total=10))
+    
+    async def _get_json(self, url: str) -> Optional[Any]:
+        """GET non bloquant d'un document JSON, None si la réponse n'est pas 200"""
+        async with self._http_session().get(url) as response:
+            if response.status != 200:
+                return None
+            # raw.githubusercontent.com sert le JSON en text/plain
+            return await response.json(content_type=None)
+    
+    async def _fetch_color_overrides(self, url: str) -> Dict[str, Any]:
+        """Récupérer les overrides de couleurs d'un format"""
+        try:
+            return await self._get_json(url) or {}
+        except Exception as e:
+            self.logger.warning(f"Could not load color overrides: {e}")
+            return {}
+    
     async def _fetch_directory_files(self, base_url: str) -> Dict[str, Any]:
-        """Récupérer tous les fichiers JSON d'un répertoire GitHub"""
+        """Récupérer tous les fichiers JSON d'un répertoire GitHub (téléchargements concurrents)"""
         try:
             # Utiliser l'API GitHub pour lister les fichiers
             api_url = base_url.replace("raw.githubusercontent.com", "api.github.com/repos").replace("/main/", "/contents/")
             
-            response = requests.get(api_url, timeout=10)
-            if response.status_code != 200:
+            files_list = await self._get_json(api_url)
+            if not files_list:
                 return {}
             
-            files_data = {}
-            files_list = response.json()
+            json_files = [
+                file_info for file_info in files_list
+                if file_info["type"] == "file" and file_info["name"].endswith(".json")
+            ]
+            
+            contents = await asyncio.gather(
+                *(self._get_json(file_info["download_url"]) for file_info in json_files),
+                return_exceptions=True
+            )
             
-            for file_info in files_list:
-                if file_info["type"] == "file" and file_info["name"].endswith(".json"):
-                    file_url = file_info["download_url"]
-                    file_response = requests.get(file_url, timeout=10)
-                    
-                    if file_response.status_code == 200:
-                        file_name = file_info["name"].replace(".json", "")
-                        files_data[file_name] = file_response.json()
+            files_data = {}
+            for file_info, content in zip(json_files, contents):
+                if isinstance(content, Exception):
+                    self.logger.warning(f"Could not download {file_info['name']}: {content}")
+                elif content is not None:
+                    files_data[file_info["name"].replace(".json", "")] = content
             
             return files_data
             
@@ -217,23 +362,115 @@ class BadaroArchetypeEngine:
             return {}
     
     def _parse_format_data(self, format_name: str, data: Dict[str, Any]):
-        """Parser les données de format depuis Badaro"""
-        
-        # Parser les archétypes
-        archetypes = {}
-        for archetype_name, archetype_data in data.get("archetypes", {}).items():
-            archetypes[archetype_name] = ArchetypeDefinition.from_dict(archetype_name, archetype_data)
-        
-        # Parser les fallbacks
-        fallbacks = {}
-        for fallback_name, fallback_data in data.get("fallbacks", {}).items():
-            fallbacks[fallback_name] = FallbackDefinition.from_dict(fallback_name, fallback_data)
-        
-        # Stocker
-        self.format_definitions[format_name] = archetypes
-        self.format_fallbacks[format_name] = fallbacks
-        self.color_overrides[format_name] = data.get("color_overrides", {})
-    
+        """Parser les données de format depuis Badaro et publier le nouveau snapshot"""
+        with self._swap_lock:
+            self._publish(self._snapshot.with_format(format_name, data))
+
+    async def install_bundle(self, source: Union[str, Path], version: Optional[str] = None) -> Optional[str]:
+        """
+        Construire et installer un bundle depuis un clone local de
+        MTGOFormatData ou un tarball (.tar.gz), sans accès réseau
+
+        Args:
+            source: Chemin du clone ou du tarball
+            version: SHA upstream, si le tarball ne le porte pas
+
+        Returns:
+            SHA du bundle installé, None en cas d'échec
+        """
+        source = Path(source)
+        try:
+            if source.is_dir():
+                version, formats = await asyncio.to_thread(format_bundle.read_formats_from_clone, source)
+            else:
+                version, formats = await asyncio.to_thread(format_bundle.read_formats_from_tarball, source, version)
+
+            await asyncio.to_thread(format_bundle.install_bundle, self.bundle_dir, version, formats, str(source))
+            return version
+
+        except Exception as e:
+            self.logger.error(f"Failed to install format bundle from {source}: {e}")
+            return None
+
+    async def load_bundle(self, version: Optional[str] = None) -> bool:
+        """
+        Charger un bundle installé et basculer toutes les définitions d'un coup
+
+        Args:
+            version: SHA à charger (défaut: le bundle pointé par CURRENT)
+
+        Returns:
+            True si les définitions en service proviennent du bundle demandé
+        """
+        try:
+            version = version or await asyncio.to_thread(format_bundle.current_version, self.bundle_dir)
+            if not version:
+                self.logger.warning(f"No format bundle installed in {self.bundle_dir}")
+                return False
+
+            if version == self.definitions_version:
+                return True
+
+            bundle = await asyncio.to_thread(format_bundle.read_bundle, self.bundle_dir / f"{version}.json")
+            # Compilation complète hors verrou, puis bascule
+            snapshot = DefinitionsSnapshot.from_bundle(bundle["version"], bundle["formats"])
+            with self._swap_lock:
+                self._publish(snapshot)
+
+            self.logger.info(f"Loaded format bundle {version[:12]} ({len(snapshot.format_definitions)} formats)")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to load format bundle {version}: {e}")
+            return False
+
+    async def reload_if_changed(self) -> bool:
+        """
+        Recharger à chaud si le pointeur CURRENT a changé
+
+        Returns:
+            True si une nouvelle version a été publiée
+        """
+        version = await asyncio.to_thread(format_bundle.current_version, self.bundle_dir)
+        if not version or version == self.definitions_version:
+            return False
+        return await self.load_bundle(version)
+
+    async def watch_bundles(self, interval_seconds: float = 60.0):
+        """Surveiller le répertoire des bundles (à lancer en tâche de fond)"""
+        while True:
+            await self.reload_if_changed()
+            await asyncio.sleep(interval_seconds)
+
+    async def start(self,
+                    formats: Optional[List[str]] = None,
+                    watch_interval: Optional[float] = 60.0) -> Dict[str, bool]:
+        """
+        Démarrage de l'engine : charger les définitions (bundle en priorité) puis,
+        si elles viennent d'un bundle, surveiller CURRENT pour les recharger à chaud
+
+        Args:
+            formats: Formats à charger (défaut: les six formats Badaro)
+            watch_interval: Période de surveillance en secondes (None: pas de surveillance)
+
+        Returns:
+            Résultat du chargement par format
+        """
+        results = await self.load_all_formats(formats)
+        if self.definitions_version and watch_interval and self._watch_task is None:
+            self._watch_task = asyncio.create_task(self.watch_bundles(watch_interval))
+        return results
+
+    async def stop(self):
+        """Arrêter la surveillance des bundles"""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
     def classify_deck(self, 
                      mainboard: Dict[str, int], 
                      sideboard: Dict[str, int] = None,
@@ -252,8 +489,11 @@ class BadaroArchetypeEngine:
         if sideboard is None:
             sideboard = {}
         
+        # Un seul snapshot pour toute la classification (rechargement à chaud)
+        snapshot = self._snapshot
+        
         # Vérifier que les définitions sont chargées
-        if format_name not in self.format_definitions:
+        if format_name not in snapshot.format_definitions:
             self.logger.warning(f"No definitions loaded for format {format_name}")
             return self._unknown_classification()
         
@@ -264,7 +504,7 @@ class BadaroArchetypeEngine:
         
         # Phase 1: Essayer les archétypes exacts
         archetype_result = self._match_archetypes(
-            mainboard, sideboard, mainboard_cards, sideboard_cards, all_cards, format_name
+            mainboard, sideboard, mainboard_cards, sideboard_cards, all_cards, format_name, snapshot
         )
         
         if archetype_result:
@@ -272,14 +512,18 @@ class BadaroArchetypeEngine:
         
         # Phase 2: Essayer les fallbacks (goodstuff)
         fallback_result = self._match_fallbacks(
-            all_cards, format_name
+            all_cards, format_name, snapshot
         )
         
         if fallback_result:
             return fallback_result
         
         # Phase 3: Classification par couleur en dernier recours
-        return self._color_classification(mainboard_cards | sideboard_cards)
+        return self._color_classification(mainboard_cards | sideboard_cards, snapshot)
+    
+    def classify_stored_deck(self, store, index: int, format_name: Optional[str] = None) -> BadaroClassificationResult:
+        """Classifier un deck lu dans un DeckStore (voir deck_store.classify_stored_deck)"""
+        return deck_store.classify_stored_deck(self, store, index, format_name)
     
     def _match_archetypes(self, 
                          mainboard: Dict[str, int],
@@ -287,10 +531,11 @@ class BadaroArchetypeEngine:
                          mainboard_cards: Set[str],
                          sideboard_cards: Set[str],
                          all_cards: Set[str],
-                         format_name: str) -> Optional[BadaroClassificationResult]:
+                         format_name: str,
+                         snapshot: DefinitionsSnapshot) -> Optional[BadaroClassificationResult]:
         """Phase 1: Matcher contre les archétypes définis"""
         
-        archetypes = self.format_definitions[format_name]
+        archetypes = snapshot.format_definitions[format_name]
         
         for archetype_name, archetype_def in archetypes.items():
             # Tester l'archétype principal
@@ -306,7 +551,7 @@ class BadaroArchetypeEngine:
                 # Calculer la couleur si nécessaire
                 color_identity = ""
                 if archetype_def.include_color_in_name:
-                    color_identity = self._extract_color_identity(all_cards, format_name)
+                    color_identity = self._extract_color_identity(all_cards, format_name, snapshot)
                 
                 return BadaroClassificationResult(
                     archetype_name=archetype_name,
@@ -383,10 +628,10 @@ class BadaroArchetypeEngine:
         
         return False
     
-    def _match_fallbacks(self, all_cards: Set[str], format_name: str) -> Optional[BadaroClassificationResult]:
+    def _match_fallbacks(self, all_cards: Set[str], format_name: str, snapshot: DefinitionsSnapshot) -> Optional[BadaroClassificationResult]:
         """Phase 2: Matcher contre les fallbacks (goodstuff decks)"""
         
-        fallbacks = self.format_fallbacks[format_name]
+        fallbacks = snapshot.format_fallbacks[format_name]
         best_match = None
         best_score = 0
         
@@ -406,7 +651,7 @@ class BadaroArchetypeEngine:
         if best_match:
             color_identity = ""
             if best_match.include_color_in_name:
-                color_identity = self._extract_color_identity(all_cards, format_name)
+                color_identity = self._extract_color_identity(all_cards, format_name, snapshot)
             
             return BadaroClassificationResult(
                 archetype_name=best_match.name,
@@ -419,45 +664,26 @@ class BadaroArchetypeEngine:
         
         return None
     
-    def _extract_color_identity(self, cards: Set[str], format_name: str) -> str:
-        """Extraire l'identité colorielle selon la logique Badaro"""
-        # Implémentation simplifiée - dans un vrai système utiliserait la DB complète
-        colors = set()
-        
-        # Mapping basique pour les cartes courantes
-        color_mapping = {
-            # Mana fixing lands that indicate colors
-            "Sacred Foundry": "RW", "Steam Vents": "UR", "Overgrown Tomb": "BG",
-            "Temple Garden": "GW", "Watery Grave": "UB", "Stomping Ground": "RG",
-            "Breeding Pool": "GU", "Godless Shrine": "WB", "Blood Crypt": "BR",
-            "Hallowed Fountain": "WU",
-            
-            # Iconic spells
-            "Lightning Bolt": "R", "Counterspell": "U", "Swords to Plowshares": "W",
-            "Dark Ritual": "B", "Llanowar Elves": "G"
-        }
-        
-        # Appliquer les overrides du format si disponibles
-        overrides = self.color_overrides.get(format_name, {})
-        
+    def _extract_color_identity(self, cards: Set[str], format_name: str, snapshot: DefinitionsSnapshot) -> str:
+        """Extraire l'identité colorielle selon la logique Badaro (masques WUBRG)"""
+        # Les overrides du format priment sur la base de cartes
+        overrides = snapshot.color_overrides.get(format_name, {})
+        land_overrides = overrides.get("Lands", {})
+        nonland_overrides = overrides.get("NonLands", {})
+        
+        mask = 0
         for card in cards:
-            if card in overrides.get("Lands", {}):
-                card_colors = overrides["Lands"][card].get("Color", "")
-                colors.update(list(card_colors))
-            elif card in overrides.get("NonLands", {}):
-                card_colors = overrides["NonLands"][card].get("Color", "")
-                colors.update(list(card_colors))
-            elif card in color_mapping:
-                card_colors = color_mapping[card]
-                colors.update(list(card_colors))
-        
-        # Convertir en string ordonnée WUBRG
-        color_order = "WUBRG"
-        return "".join([c for c in color_order if c in colors])
+            override = land_overrides.get(card) or nonland_overrides.get(card)
+            if override is not None:
+                mask |= colors_to_mask(override.get("Color", ""))
+            else:
+                mask |= card_database.identity_mask(card)
+        
+        return mask_to_colors(mask)
     
-    def _color_classification(self, cards: Set[str]) -> BadaroClassificationResult:
+    def _color_classification(self, cards: Set[str], snapshot: DefinitionsSnapshot) -> BadaroClassificationResult:
         """Classification de dernière chance par couleur"""
-        color_identity = self._extract_color_identity(cards, "")
+        color_identity = self._extract_color_identity(cards, "", snapshot)
         
         if not color_identity:
             archetype_name = "Unknown"
@@ -486,16 +712,16 @@ class BadaroArchetypeEngine:
         """Récupérer la liste des formats disponibles depuis Badaro"""
         try:
             api_url = f"https://api.github.com/repos/Badaro/MTGOFormatData/contents/Formats"
-            response = requests.get(api_url, timeout=10)
+            items = await self._get_json(api_url)
             
-            if response.status_code == 200:
-                dirs = [item["name"] for item in response.json() if item["type"] == "dir"]
+            if items:
+                dirs = [item["name"] for item in items if item["type"] == "dir"]
                 return sorted(dirs)
             
         except Exception as e:
             self.logger.error(f"Error fetching available formats: {e}")
         
-        return ["Modern", "Standard", "Pioneer", "Legacy", "Vintage", "Pauper"]
+        return list(DEFAULT_FORMATS)
 
 # Instance globale
 badaro_engine = BadaroArchetypeEngine() 
\ No newline at end of file
@@ -8,6 +8,7 @@ import time
 from asyncio_throttle import Throttler
 
 from config import config
+from http_session import http_sessions
 
 class BaseScraper(ABC):
     """Classe de base pour tous les scrapers"""
@@ -34,17 +35,17 @@ class BaseScraper(ABC):
         return logger
     
     async def __aenter__(self):
-        """Context manager entry"""
-        self.session = aiohttp.ClientSession(
+        """Context manager entry (session du pool HTTP partagé)"""
+        self.session = http_sessions.get_session(
+            f"scraper.{self.name}",
             timeout=aiohttp.ClientTimeout(total=config.TIMEOUT),
             headers={"User-Agent": config.USER_AGENT}
         )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Context manager exit - la session partagée reste ouverte pour les runs suivants"""
+        self.session = None
     
     async def fetch_page(self, url: str, **kwargs) -> Optional[str]:
         """Récupère une page web avec gestion d'erreurs et throttling"""
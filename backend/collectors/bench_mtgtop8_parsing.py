@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark du parsing HTML MTGTop8 sur des pages sauvegardées
+Compare l'ancien chemin (arbre html.parser complet + find_all regex)
+à la couche html_parsing (backend rapide + SoupStrainer)
+
+Usage:
+    python bench_mtgtop8_parsing.py --iterations 50
+"""
+import argparse
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from html_parsing import extract_links, parser_backend
+from mtgtop8_scraper import MTGTop8Scraper, EVENT_LINK_RE, DECK_LINK_RE
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "mtgtop8"
+
+
+def legacy_format_page(scraper: MTGTop8Scraper, content: str):
+    soup = BeautifulSoup(content, 'html.parser')
+    return [link['href'] for link in soup.find_all('a', href=re.compile(r'event\?e=\d+'))]
+
+
+def legacy_event_page(scraper: MTGTop8Scraper, content: str):
+    soup = BeautifulSoup(content, 'html.parser')
+    header = {
+        cls: scraper.clean_text(elem.text)
+        for cls in ('event_title', 'event_date', 'format', 'location', 'players')
+        if (elem := soup.find('div', class_=cls))
+    }
+    links = [link['href'] for link in soup.find_all('a', href=re.compile(r'event\?e=\d+&d=\d+'))]
+    return header, links
+
+
+def legacy_deck_page(scraper: MTGTop8Scraper, content: str):
+    soup = BeautifulSoup(content, 'html.parser')
+    return scraper._parse_decklist(soup, 'mainboard'), scraper._parse_decklist(soup, 'sideboard')
+
+
+def current_format_page(scraper: MTGTop8Scraper, content: str):
+    return extract_links(content, EVENT_LINK_RE)
+
+
+def current_event_page(scraper: MTGTop8Scraper, content: str):
+    return scraper.parse_tournament_page(content), extract_links(content, DECK_LINK_RE)
+
+
+def current_deck_page(scraper: MTGTop8Scraper, content: str):
+    return scraper.parse_deck_page(content)
+
+
+def timed(func, scraper, content: str, iterations: int) -> float:
+    """Temps CPU moyen par page en millisecondes"""
+    start = time.process_time()
+    for _ in range(iterations):
+        func(scraper, content)
+    return (time.process_time() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing MTGTop8")
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    scraper = MTGTop8Scraper()
+    cases = [
+        ("format.html", legacy_format_page, current_format_page),
+        ("event.html", legacy_event_page, current_event_page),
+        ("deck.html", legacy_deck_page, current_deck_page),
+    ]
+
+    print(f"Backend: {parser_backend()} - {args.iterations} itérations")
+    print(f"{'page':<12} {'legacy (ms)':>12} {'current (ms)':>13} {'speedup':>8}")
+    for fixture, legacy, current in cases:
+        content = (FIXTURES_DIR / fixture).read_text(encoding="utf-8")
+        legacy_ms = timed(legacy, scraper, content, args.iterations)
+        current_ms = timed(current, scraper, content, args.iterations)
+        print(f"{fixture:<12} {legacy_ms:>12.2f} {current_ms:>13.2f} {legacy_ms / current_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
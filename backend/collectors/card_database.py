@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Base de cartes hors ligne (couleurs, identité colorielle, CMC, types)
+Construite depuis un fichier bulk Scryfall (oracle-cards) et chargée en
+tables compactes : un masque de bits WUBRG par carte, l'identité d'un deck
+est le OU de ses cartes.
+
+Usage:
+    python card_database.py oracle-cards.json [--output card_database.json]
+"""
+import argparse
+import json
+import logging
+import os
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+try:
+    from card_registry import lookup_key
+except ImportError:
+    from collectors.card_registry import lookup_key
+
+logger = logging.getLogger("scraper.card_database")
+
+FORMAT_VERSION = 1
+COLOR_ORDER = "WUBRG"
+COLOR_BITS = {color: 1 << i for i, color in enumerate(COLOR_ORDER)}
+
+# Types de carte (masque de bits)
+CARD_TYPES = ["Land", "Creature", "Instant", "Sorcery", "Artifact", "Enchantment", "Planeswalker", "Battle"]
+TYPE_BITS = {card_type: 1 << i for i, card_type in enumerate(CARD_TYPES)}
+
+# Table intégrée, utilisée quand aucune base n'a été construite : cartes et
+# terrains courants des anciennes tables codées en dur (classifieur, moteurs
+# Badaro, scraper MTGTop8), pour ne pas perdre les couleurs sans fichier
+FALLBACK_IDENTITIES = {
+    # Terrains de base et shocklands
+    "Plains": "W", "Island": "U", "Swamp": "B", "Mountain": "R", "Forest": "G",
+    "Hallowed Fountain": "WU", "Watery Grave": "UB", "Blood Crypt": "BR",
+    "Stomping Ground": "RG", "Temple Garden": "WG", "Godless Shrine": "WB",
+    "Steam Vents": "UR", "Overgrown Tomb": "BG", "Sacred Foundry": "WR",
+    "Breeding Pool": "UG",
+    # Blanc
+    "Swords to Plowshares": "W", "Wrath of God": "W",
+    # Bleu
+    "Counterspell": "U", "Cryptic Command": "U", "Force of Negation": "U", "Lord of Atlantis": "U",
+    # Noir
+    "Dark Ritual": "B", "Liliana of the Veil": "B", "Inquisition of Kozilek": "B", "Vraska's Contempt": "B",
+    # Rouge
+    "Lightning Bolt": "R", "Goblin Guide": "R", "Lava Spike": "R",
+    "Monastery Swiftspear": "R", "Lightning Strike": "R",
+    # Vert
+    "Llanowar Elves": "G", "Giant Growth": "G", "Tarmogoyf": "G", "Primeval Titan": "G",
+    # Multicolores
+    "Teferi, Hero of Dominaria": "WU", "Supreme Verdict": "WU", "Boros Charm": "WR", "Bloodbraid Elf": "RG",
+}
+
+def colors_to_mask(colors: Iterable[str]) -> int:
+    mask = 0
+    for color in colors:
+        mask |= COLOR_BITS.get(color, 0)
+    return mask
+
+def mask_to_colors(mask: int) -> str:
+    """Masque -> couleurs dans l'ordre WUBRG"""
+    return "".join(color for color in COLOR_ORDER if mask & COLOR_BITS[color])
+
+def types_to_mask(type_line: str) -> int:
+    front = type_line.split("//")[0]
+    return sum(bit for card_type, bit in TYPE_BITS.items() if card_type in front)
+
+def build_card_database(bulk_path: Path, output_path: Path) -> int:
+    """
+    Convertir un bulk Scryfall en table compacte
+
+    L'identité colorielle retenue est celle de Scryfall, complétée pour les
+    terrains par les couleurs de mana produites. Les cartes doubles sont
+    indexées sous leur nom complet et sous le nom de leur première face
+    (forme utilisée par MTGO).
+
+    Returns:
+        Nombre de cartes écrites
+    """
+    with open(bulk_path, 'r', encoding='utf-8') as f:
+        cards = json.load(f)
+
+    table = {"version": FORMAT_VERSION, "source": Path(bulk_path).name,
+             "names": [], "colors": [], "identity": [], "cmc": [], "types": []}
+    seen = set()
+
+    for card in cards:
+        if card.get("layout") in ("token", "double_faced_token", "emblem", "art_series"):
+            continue
+
+        name = card["name"]
+        faces = card.get("card_faces") or []
+        type_line = card.get("type_line") or (faces[0].get("type_line", "") if faces else "")
+        colors = card.get("colors")
+        if colors is None:
+            colors = [color for face in faces for color in face.get("colors", [])]
+
+        types = types_to_mask(type_line)
+        identity = colors_to_mask(card.get("color_identity", []))
+        if types & TYPE_BITS["Land"]:
+            identity |= colors_to_mask(card.get("produced_mana", []))
+
+        names = [name]
+        if " // " in name:
+            names.append(name.split(" // ")[0])
+
+        for alias in names:
+            key = lookup_key(alias)
+            if key in seen:
+                continue
+            seen.add(key)
+            table["names"].append(alias)
+            table["colors"].append(colors_to_mask(colors))
+            table["identity"].append(identity)
+            table["cmc"].append(card.get("cmc", 0.0))
+            table["types"].append(types)
+
+    tmp_path = Path(str(output_path) + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(table, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, output_path)
+
+    logger.info(f"Card database written to {output_path}: {len(table['names'])} entries")
+    return len(table["names"])
+
+class CardDatabase:
+    """
+    Table de lookup chargée à la demande (premier appel)
+    Sans fichier, seule la table intégrée FALLBACK_IDENTITIES est connue
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._index: Optional[Dict[str, int]] = None
+        self._colors = bytearray()
+        self._identity = bytearray()
+        self._types = bytearray()
+        self._cmc = array("f")
+
+    def _load(self) -> Dict[str, int]:
+        if self._index is not None:
+            return self._index
+
+        if not self.path or not self.path.exists():
+            logger.warning(
+                f"Card database not found at {self.path}: using the built-in table of "
+                f"{len(FALLBACK_IDENTITIES)} common cards (build the full one with card_database.py)"
+            )
+            self._load_fallback()
+            return self._index
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            table = json.load(f)
+
+        self._index = {lookup_key(name): i for i, name in enumerate(table["names"])}
+        self._colors = bytearray(table["colors"])
+        self._identity = bytearray(table["identity"])
+        self._types = bytearray(table["types"])
+        self._cmc = array("f", table["cmc"])
+        logger.info(f"Loaded card database ({len(self._index)} entries)")
+        return self._index
+
+    def _load_fallback(self):
+        masks = [colors_to_mask(colors) for colors in FALLBACK_IDENTITIES.values()]
+        self._index = {lookup_key(name): i for i, name in enumerate(FALLBACK_IDENTITIES)}
+        self._colors = bytearray(masks)
+        self._identity = bytearray(masks)
+        self._types = bytearray(len(masks))
+        self._cmc = array("f", [0.0] * len(masks))
+
+    def __contains__(self, name: str) -> bool:
+        return lookup_key(name) in self._load()
+
+    def identity_mask(self, name: str) -> int:
+        """Masque WUBRG de l'identité colorielle d'une carte (0 si inconnue)"""
+        index = self._load().get(lookup_key(name))
+        return self._identity[index] if index is not None else 0
+
+    def deck_identity_mask(self, card_names: Iterable[str]) -> int:
+        """OU des identités des cartes d'un deck (O(cartes))"""
+        index = self._load()
+        identity = self._identity
+        mask = 0
+        for name in card_names:
+            position = index.get(lookup_key(name))
+            if position is not None:
+                mask |= identity[position]
+        return mask
+
+    def deck_colors(self, card_names: Iterable[str]) -> str:
+        """Identité colorielle d'un deck, ordonnée WUBRG"""
+        return mask_to_colors(self.deck_identity_mask(card_names))
+
+    def attributes(self, name: str) -> Optional[Dict[str, object]]:
+        """Attributs d'une carte, None si inconnue"""
+        index = self._load().get(lookup_key(name))
+        if index is None:
+            return None
+        return {
+            "colors": mask_to_colors(self._colors[index]),
+            "color_identity": mask_to_colors(self._identity[index]),
+            "cmc": self._cmc[index],
+            "types": [card_type for card_type, bit in TYPE_BITS.items() if self._types[index] & bit]
+        }
+
+# Instance globale
+card_database = CardDatabase(os.getenv("CARD_DATABASE_PATH", str(Path(__file__).parent / "card_database.json")))
+
+def main():
+    parser = argparse.ArgumentParser(description="Construire la base de cartes depuis un bulk Scryfall")
+    parser.add_argument("bulk_file", type=Path, help="Fichier oracle-cards.json de Scryfall")
+    parser.add_argument("--output", type=Path, default=card_database.path)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    build_card_database(args.bulk_file, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Registre des noms de cartes
+Canonicalise les noms venant des différentes sources (MTGO, Melee, MTGTop8,
+Badaro) et leur attribue des identifiants entiers stables, persistés entre les runs
+"""
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou inter-processus
+    fcntl = None
+
+logger = logging.getLogger("scraper.card_registry")
+
+# Séparateurs de cartes doubles rencontrés : "Fire/Ice", "Fire / Ice", "Fire // Ice"
+SPLIT_RE = re.compile(r"\s*/{1,2}\s*")
+SPACES_RE = re.compile(r"\s+")
+
+# Ligatures que la décomposition Unicode ne replie pas
+LIGATURES = str.maketrans({"Æ": "Ae", "æ": "ae"})
+
+def display_form(name: str) -> str:
+    """Forme affichée : espaces normalisés, séparateur " // " pour les cartes doubles"""
+    name = SPACES_RE.sub(" ", unicodedata.normalize("NFC", name)).strip()
+    return SPLIT_RE.sub(" // ", name)
+
+@lru_cache(maxsize=65536)
+def lookup_key(name: str) -> str:
+    """Clé de comparaison : forme affichée sans accents, ligatures ni casse"""
+    decomposed = unicodedata.normalize("NFKD", display_form(name).translate(LIGATURES))
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+@contextmanager
+def file_lock(path: Path):
+    """Verrou exclusif inter-processus sur `path` (fichier .lock à côté du registre)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+class CardRegistry:
+    """
+    Table nom canonique <-> identifiant entier
+
+    Les identifiants sont attribués dans l'ordre d'apparition et ceux du
+    fichier ne changent jamais (il est en ajout seul). Le fichier est lu au
+    premier accès, pas à l'import. Les noms retournés sont des objets uniques
+    par carte : les decks parsés partagent les mêmes chaînes.
+
+    Plusieurs processus peuvent partager le fichier : save() relit et fusionne
+    sous verrou. Un identifiant attribué n'est jamais renuméroté : les cartes
+    ajoutées entre-temps par un autre processus sont ajoutées après les nôtres.
+
+    Rien n'est écrit implicitement : les points de sortie des collectors
+    (UnifiedScraper.close, main.py, chargement du cache MTGO) appellent save().
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        # Nombre de noms déjà présents dans le fichier (préfixe de _names)
+        self._persisted = 0
+        self._loaded = False
+        self._dirty = False
+
+    def _read_names(self) -> List[str]:
+        if not self.path or not self.path.exists():
+            return []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)["names"]
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            for name in self._read_names():
+                self._ids[lookup_key(name)] = len(self._names)
+                self._names.append(sys.intern(name))
+            self._persisted = len(self._names)
+            self._loaded = True
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._names)
+
+    def card_id(self, name: str) -> int:
+        """Identifiant de la carte (attribué au premier passage)"""
+        self._ensure_loaded()
+        key = lookup_key(name)
+        card_id = self._ids.get(key)
+        if card_id is not None:
+            return card_id
+
+        with self._lock:
+            card_id = self._ids.get(key)
+            if card_id is None:
+                card_id = len(self._names)
+                self._names.append(sys.intern(display_form(name)))
+                self._ids[key] = card_id
+                self._dirty = True
+            return card_id
+
+    def canonical(self, name: str) -> str:
+        """Nom canonique de la carte"""
+        return self._names[self.card_id(name)]
+
+    def name(self, card_id: int) -> str:
+        self._ensure_loaded()
+        return self._names[card_id]
+
+    def names(self) -> List[str]:
+        """Copie de la table id -> nom"""
+        self._ensure_loaded()
+        return list(self._names)
+
+    def normalize_board(self, board: Dict[str, int]) -> Dict[str, int]:
+        """Board {nom: quantité} avec noms canoniques (les doublons sont additionnés)"""
+        normalized: Dict[str, int] = {}
+        for name, count in board.items():
+            canonical = self.canonical(name)
+            normalized[canonical] = normalized.get(canonical, 0) + count
+        return normalized
+
+    def board_ids(self, board: Dict[str, int]) -> Dict[int, int]:
+        """Board {id: quantité} pour les classifieurs et chargeurs DB"""
+        ids: Dict[int, int] = {}
+        for name, count in board.items():
+            card_id = self.card_id(name)
+            ids[card_id] = ids.get(card_id, 0) + count
+        return ids
+
+    def save(self):
+        """
+        Persister les nouvelles cartes (écriture atomique)
+        Sous verrou de fichier : le fichier est relu et les cartes ajoutées par
+        d'autres processus sont conservées avec leurs identifiants.
+        """
+        if not self.path or not self._dirty:
+            return
+
+        try:
+            with file_lock(self.path.with_suffix(self.path.suffix + ".lock")), self._lock:
+                names = self._merge(self._read_names())
+                tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"names": names}, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._persisted = len(names)
+                self._dirty = False
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not save card registry to {self.path}: {e}")
+
+    def _merge(self, stored: List[str]) -> List[str]:
+        """Table locale suivie des cartes du fichier encore inconnues ici (appelé sous self._lock)"""
+        added = 0
+        for name in stored:
+            key = lookup_key(name)
+            if key not in self._ids:
+                self._ids[key] = len(self._names)
+                self._names.append(sys.intern(name))
+                added += 1
+        if added:
+            logger.info(f"Card registry merged with {added} cards saved by another process")
+        return list(self._names)
+
+# Fichier du registre : dans le répertoire de données du backend, hors des sources
+DEFAULT_REGISTRY_PATH = Path(__file__).resolve().parent.parent / "data" / "card_registry.json"
+
+# Instance globale
+card_registry = CardRegistry(os.getenv("CARD_REGISTRY_PATH", str(DEFAULT_REGISTRY_PATH)))
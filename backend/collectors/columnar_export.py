@@ -0,0 +1,272 @@
+"""
+Export colonnaire (Parquet/Arrow) du corpus MTGODecklistCache
+Trois datasets partitionnés par format et par mois (tournaments, decks,
+deck_cards) et un moteur d'analyse Arrow qui ne lit que les colonnes et
+partitions utiles
+"""
+import logging
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# pyarrow est optionnel : l'export et le moteur Arrow en dépendent
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+
+logger = logging.getLogger("mtgo.columnar_export")
+
+def is_available() -> bool:
+    """pyarrow installé (extra "columnar" du backend)"""
+    return pa is not None
+
+# Decks par RecordBatch écrit
+BATCH_DECKS = 50_000
+
+def _dictionary() -> "pa.DataType":
+    return pa.dictionary(pa.int32(), pa.string())
+
+def _schemas() -> Dict[str, "pa.Schema"]:
+    return {
+        "tournaments": pa.schema([
+            ("tournament_id", pa.string()),
+            ("name", pa.string()),
+            ("tournament_date", pa.string()),
+            ("source", _dictionary()),
+            ("url", pa.string()),
+            ("is_archive", pa.bool_()),
+            ("player_count", pa.int32()),
+            ("format", pa.string()),
+            ("month", pa.string()),
+        ]),
+        "decks": pa.schema([
+            ("deck_id", pa.int64()),
+            ("tournament_id", pa.string()),
+            ("tournament_date", pa.string()),
+            ("player", pa.string()),
+            ("archetype", _dictionary()),
+            ("result", pa.string()),
+            ("wins", pa.int16()),
+            ("losses", pa.int16()),
+            ("format", pa.string()),
+            ("month", pa.string()),
+        ]),
+        "deck_cards": pa.schema([
+            ("deck_id", pa.int64()),
+            ("board", _dictionary()),
+            ("card_name", _dictionary()),
+            ("count", pa.int16()),
+            ("format", pa.string()),
+            ("month", pa.string()),
+        ]),
+    }
+
+def _partitioning() -> "ds.Partitioning":
+    return ds.partitioning(pa.schema([("format", pa.string()), ("month", pa.string())]), flavor="hive")
+
+def parse_record(result: str) -> Tuple[int, int]:
+    """Victoires et défaites d'un résultat "5-2" (0, 0 si autre forme)"""
+    if result and "-" in result:
+        try:
+            wins, losses = result.split("-")[:2]
+            return int(wins), int(losses)
+        except ValueError:
+            pass
+    return 0, 0
+
+def iter_cards(board: Any) -> Iterator[Tuple[str, int]]:
+    """Cartes d'un board MTGODecklistCache ([{"CardName", "Count"}] ou {nom: quantité})"""
+    if isinstance(board, dict):
+        yield from board.items()
+    else:
+        for card in board or []:
+            yield card.get("CardName", ""), card.get("Count", 0)
+
+def _empty_columns(schema: "pa.Schema") -> Dict[str, list]:
+    return {name: [] for name in schema.names}
+
+def _to_batch(columns: Dict[str, list], schema: "pa.Schema") -> "pa.RecordBatch":
+    arrays = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(columns[field.name], pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(columns[field.name], field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def _corpus_batches(tournaments: Iterable[Tuple[str, Any]], schemas: Dict[str, "pa.Schema"]) -> Iterator[Dict[str, "pa.RecordBatch"]]:
+    """Normaliser les tournois en lots Arrow (un lot par dataset toutes les BATCH_DECKS decks)"""
+    columns = {name: _empty_columns(schema) for name, schema in schemas.items()}
+    deck_id = 0
+
+    def flush() -> Dict[str, "pa.RecordBatch"]:
+        batches = {}
+        for name, schema in schemas.items():
+            batches[name] = _to_batch(columns[name], schema)
+            columns[name] = _empty_columns(schema)
+        return batches
+
+    for tournament_id, tournament in tournaments:
+        fmt = tournament.format
+        month = tournament.date[:7]
+
+        t = columns["tournaments"]
+        t["tournament_id"].append(tournament_id)
+        t["name"].append(tournament.name)
+        t["tournament_date"].append(tournament.date)
+        t["source"].append(tournament.source)
+        t["url"].append(tournament.url)
+        t["is_archive"].append(tournament.metadata.get("is_archive", False))
+        t["player_count"].append(len(tournament.decks))
+        t["format"].append(fmt)
+        t["month"].append(month)
+
+        d = columns["decks"]
+        c = columns["deck_cards"]
+        for deck in tournament.decks:
+            result = deck.get("Result", "")
+            wins, losses = parse_record(result)
+            d["deck_id"].append(deck_id)
+            d["tournament_id"].append(tournament_id)
+            d["tournament_date"].append(tournament.date)
+            d["player"].append(deck.get("Player", ""))
+            d["archetype"].append(deck.get("Archetype", "Unknown"))
+            d["result"].append(result)
+            d["wins"].append(wins)
+            d["losses"].append(losses)
+            d["format"].append(fmt)
+            d["month"].append(month)
+
+            for board_name, board_key in (("main", "Mainboard"), ("side", "Sideboard")):
+                for card_name, count in iter_cards(deck.get(board_key)):
+                    c["deck_id"].append(deck_id)
+                    c["board"].append(board_name)
+                    c["card_name"].append(card_name)
+                    c["count"].append(count)
+                    c["format"].append(fmt)
+                    c["month"].append(month)
+
+            deck_id += 1
+
+        if len(d["deck_id"]) >= BATCH_DECKS:
+            yield flush()
+
+    if columns["tournaments"]["format"]:
+        yield flush()
+
+def export_corpus(tournaments: Iterable[Tuple[str, Any]], output_dir: Path) -> Dict[str, int]:
+    """
+    Écrire le corpus en Parquet partitionné (format=<format>/month=<YYYY-MM>)
+
+    Args:
+        tournaments: Paires (clé, CachedTournament) du cache
+        output_dir: Répertoire racine des datasets
+
+    Returns:
+        Nombre de lignes écrites par dataset
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow is required for the columnar export")
+
+    schemas = _schemas()
+    for name in schemas:
+        shutil.rmtree(Path(output_dir) / name, ignore_errors=True)
+
+    # Chaque lot est écrit dès qu'il est plein : la mémoire reste bornée
+    counts = {name: 0 for name in schemas}
+    for part, batches in enumerate(_corpus_batches(tournaments, schemas)):
+        for name, batch in batches.items():
+            if batch.num_rows == 0:
+                continue
+            ds.write_dataset(
+                batch,
+                Path(output_dir) / name,
+                format="parquet",
+                partitioning=_partitioning(),
+                basename_template=f"part-{part}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore"
+            )
+            counts[name] += batch.num_rows
+
+    logger.info(f"Columnar export written to {output_dir}: {counts}")
+    return counts
+
+class ArrowAnalytics:
+    """
+    Moteur d'analyse sur les datasets Parquet
+    Seules les colonnes demandées des partitions (format, mois) concernées sont lues
+    """
+
+    def __init__(self, root: Path):
+        if pa is None:
+            raise RuntimeError("pyarrow is required for the Arrow analytics engine")
+        self.root = Path(root)
+
+    def _decks(self) -> "ds.Dataset":
+        return ds.dataset(self.root / "decks", format="parquet", partitioning=_partitioning())
+
+    def _window_filter(self, format_name: str, date_from: Optional[str]):
+        condition = ds.field("format") == format_name
+        if date_from:
+            # Élagage des partitions par mois, puis filtre exact sur la date
+            condition &= (ds.field("month") >= date_from[:7]) & (ds.field("tournament_date") >= date_from)
+        return condition
+
+    def meta_snapshot(self, format_name: str, days_back: int = 30) -> Dict[str, Any]:
+        """Même résultat que MTGOCacheManager.get_format_meta_snapshot"""
+        date_limit = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+
+        table = self._decks().to_table(
+            columns=["archetype"],
+            filter=self._window_filter(format_name, date_limit)
+        )
+        counts = pc.value_counts(table.column("archetype").combine_chunks().dictionary_decode())
+        archetype_counts = {
+            item["values"].as_py(): item["counts"].as_py()
+            for item in counts
+        }
+        total_decks = table.num_rows
+
+        sorted_archetypes = sorted(
+            ((archetype, count / total_decks * 100) for archetype, count in archetype_counts.items()),
+            key=lambda x: (-x[1], x[0])
+        )
+
+        return {
+            "format": format_name,
+            "period_days": days_back,
+            "total_decks": total_decks,
+            "unique_archetypes": len(archetype_counts),
+            "archetype_breakdown": sorted_archetypes[:20],  # Top 20
+            "last_updated": datetime.now().isoformat()
+        }
+
+    def archetype_winrates(self, format_name: str, date_from: Optional[str] = None, min_decks: int = 1) -> List[Dict[str, Any]]:
+        """Victoires, défaites et winrate par archétype (depuis les résultats des decks)"""
+        table = self._decks().to_table(
+            columns=["archetype", "wins", "losses"],
+            filter=self._window_filter(format_name, date_from)
+        )
+        table = table.set_column(0, "archetype", table.column("archetype").cast(pa.string()))
+        grouped = table.group_by("archetype").aggregate([
+            ("archetype", "count"), ("wins", "sum"), ("losses", "sum")
+        ])
+
+        rows = []
+        for row in grouped.to_pylist():
+            games = row["wins_sum"] + row["losses_sum"]
+            if row["archetype_count"] < min_decks:
+                continue
+            rows.append({
+                "archetype": row["archetype"],
+                "decks": row["archetype_count"],
+                "wins": row["wins_sum"],
+                "losses": row["losses_sum"],
+                "winrate": round(row["wins_sum"] / games * 100, 2) if games else 0.0
+            })
+
+        return sorted(rows, key=lambda r: (-r["decks"], r["archetype"]))
@@ -1,19 +1,29 @@
 import asyncio
 import logging
+import os
+import sys
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
 
 from config import config
 
+# database.py est à la racine du backend : à la fin du chemin, pour que les
+# modules des collectors (models.py...) gardent la priorité
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
 class DataManager:
     """Gestionnaire de données pour sauvegarder les résultats du scraping"""
     
     def __init__(self):
         self.logger = logging.getLogger("scraper.data_manager")
-        self.engine = create_engine(config.DATABASE_URL)
+        # Même pool réglé que l'API (database.py) : pas de second moteur par processus
+        os.environ.setdefault("DATABASE_URL", config.DATABASE_URL)
+        from database import engine
+        self.engine = engine
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
     
     def save_tournament_data(self, tournament_data: Dict[str, Any]) -> Optional[int]:
@@ -0,0 +1,274 @@
+"""
+Store de decks compact et mappé en mémoire
+Les cartes de tous les decks sont deux tableaux plats (id de carte, quantité)
+découpés par une table d'offsets ; les métadonnées de tournoi sont dans une
+table annexe. Les fichiers sont ouverts en mmap lecture seule : plusieurs
+workers uvicorn partagent les mêmes pages du cache disque.
+
+Fichiers (entiers à l'ordre d'octets natif de la machine qui a construit le store) :
+    card_ids.u32      id de carte par entrée
+    counts.u16        quantité par entrée
+    offsets.u64       2 offsets par deck (début main, début side) + fin
+    deck_meta.u32     4 entiers par deck (tournoi, archétype, joueur, résultat)
+    strings.json      tables de noms (cartes, archétypes, joueurs, résultats)
+    tournaments.json  table annexe des tournois
+"""
+import json
+import logging
+import mmap
+import os
+import shutil
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from columnar_export import iter_cards, parse_record
+
+logger = logging.getLogger("mtgo.deck_store")
+
+FORMAT_VERSION = 1
+DECK_META_FIELDS = 4
+
+class _Interner:
+    """Table chaîne -> index, dans l'ordre de première apparition"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def __call__(self, value: str) -> int:
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+def write_deck_store(tournaments: Iterable[Tuple[str, Any]], path: Path, registry=None) -> int:
+    """
+    Construire le store depuis les tournois du cache
+
+    Le store est écrit dans un répertoire temporaire puis mis en place par
+    renommage : un lecteur déjà ouvert garde ses mmap sur l'ancienne version.
+
+    Args:
+        tournaments: Paires (clé, CachedTournament)
+        path: Répertoire du store
+        registry: CardRegistry dont les ids sont réutilisés (sinon ids locaux au store)
+
+    Returns:
+        Nombre de decks écrits
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    tmp_path.mkdir(parents=True)
+
+    archetypes, players, results = _Interner(), _Interner(), _Interner()
+    local_cards = _Interner()
+    cards = registry.card_id if registry is not None else local_cards
+    card_ids, counts = array("I"), array("H")
+    offsets, deck_meta = array("Q"), array("I")
+    tournament_table = []
+
+    for key, tournament in tournaments:
+        tournament_index = len(tournament_table)
+        tournament_table.append({
+            "key": key,
+            "name": tournament.name,
+            "date": tournament.date,
+            "format": tournament.format,
+            "source": tournament.source,
+            "url": tournament.url
+        })
+
+        for deck in tournament.decks:
+            deck_meta.extend((
+                tournament_index,
+                archetypes(deck.get("Archetype", "Unknown")),
+                players(deck.get("Player", "")),
+                results(deck.get("Result", ""))
+            ))
+
+            for board_key in ("Mainboard", "Sideboard"):
+                offsets.append(len(card_ids))
+                for card_name, count in iter_cards(deck.get(board_key)):
+                    card_ids.append(cards(card_name))
+                    counts.append(count)
+
+    offsets.append(len(card_ids))
+
+    for name, data in (("card_ids.u32", card_ids), ("counts.u16", counts),
+                       ("offsets.u64", offsets), ("deck_meta.u32", deck_meta)):
+        with open(tmp_path / name, "wb") as f:
+            data.tofile(f)
+
+    with open(tmp_path / "strings.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "version": FORMAT_VERSION,
+            "cards": registry.names() if registry is not None else local_cards.values,
+            "archetypes": archetypes.values,
+            "players": players.values,
+            "results": results.values
+        }, f, ensure_ascii=False)
+
+    with open(tmp_path / "tournaments.json", "w", encoding="utf-8") as f:
+        json.dump(tournament_table, f, ensure_ascii=False)
+
+    old_path = path.with_name(path.name + ".old")
+    shutil.rmtree(old_path, ignore_errors=True)
+    if path.exists():
+        os.replace(path, old_path)
+    os.replace(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+
+    deck_count = len(deck_meta) // DECK_META_FIELDS
+    logger.info(f"Deck store written to {path}: {deck_count} decks, {len(card_ids)} card entries")
+    return deck_count
+
+class DeckStore:
+    """
+    Lecture du store : les tableaux restent dans le cache disque, seules les
+    tables de noms (quelques dizaines de milliers de chaînes) sont en heap
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._maps: List[mmap.mmap] = []
+
+        self.card_ids = self._map("card_ids.u32", "I")
+        self.counts = self._map("counts.u16", "H")
+        self.offsets = self._map("offsets.u64", "Q")
+        self.deck_meta = self._map("deck_meta.u32", "I")
+
+        with open(self.path / "strings.json", "r", encoding="utf-8") as f:
+            strings = json.load(f)
+        if strings.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported deck store version in {self.path}: {strings.get('version')}")
+
+        self.card_names: List[str] = strings["cards"]
+        self.archetypes: List[str] = strings["archetypes"]
+        self.players: List[str] = strings["players"]
+        self.results: List[str] = strings["results"]
+        self.card_index: Dict[str, int] = {name: i for i, name in enumerate(self.card_names)}
+
+        with open(self.path / "tournaments.json", "r", encoding="utf-8") as f:
+            self.tournaments: List[Dict[str, Any]] = json.load(f)
+
+    def _map(self, name: str, typecode: str) -> memoryview:
+        with open(self.path / name, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(array(typecode))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def __len__(self) -> int:
+        return len(self.deck_meta) // DECK_META_FIELDS
+
+    def close(self):
+        """Libérer les mmap (les vues ne doivent plus être utilisées)"""
+        for view in (self.card_ids, self.counts, self.offsets, self.deck_meta):
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+    def _range(self, index: int, board: str) -> Tuple[int, int]:
+        base = index * 2 if board == "main" else index * 2 + 1
+        return self.offsets[base], self.offsets[base + 1]
+
+    def board_ids(self, index: int, board: str = "main") -> Tuple[memoryview, memoryview]:
+        """Vues (ids de cartes, quantités) d'un board, sans copie"""
+        start, end = self._range(index, board)
+        return self.card_ids[start:end], self.counts[start:end]
+
+    def board(self, index: int, board: str = "main") -> Dict[str, int]:
+        """Board d'un deck au format {nom: quantité} (attendu par les engines)"""
+        ids, counts = self.board_ids(index, board)
+        names = self.card_names
+        cards: Dict[str, int] = {}
+        for card_id, count in zip(ids, counts):
+            name = names[card_id]
+            cards[name] = cards.get(name, 0) + count
+        return cards
+
+    def _card_list(self, index: int, board: str) -> List[Dict[str, Any]]:
+        ids, counts = self.board_ids(index, board)
+        return [{"CardName": self.card_names[card_id], "Count": count} for card_id, count in zip(ids, counts)]
+
+    def tournament_index(self, index: int) -> int:
+        return self.deck_meta[index * DECK_META_FIELDS]
+
+    def deck(self, index: int) -> Dict[str, Any]:
+        """Deck reconstruit (Player, Result, Archetype, boards et infos du tournoi)"""
+        meta = index * DECK_META_FIELDS
+        tournament = self.tournaments[self.deck_meta[meta]]
+        return {
+            "Player": self.players[self.deck_meta[meta + 2]],
+            "Result": self.results[self.deck_meta[meta + 3]],
+            "Archetype": self.archetypes[self.deck_meta[meta + 1]],
+            "Mainboard": self._card_list(index, "main"),
+            "Sideboard": self._card_list(index, "side"),
+            "tournament_name": tournament["name"],
+            "tournament_date": tournament["date"],
+            "tournament_format": tournament["format"],
+            "tournament_source": tournament["source"]
+        }
+
+    @staticmethod
+    def _matching_ids(values: List[str], substring: Optional[str]) -> Optional[List[bool]]:
+        """Ids dont le nom contient `substring` (sans casse), None sans filtre"""
+        if not substring:
+            return None
+        substring = substring.lower()
+        return [substring in value.lower() for value in values]
+
+    def iter_indices(self,
+                     format_filter: Optional[str] = None,
+                     archetype_filter: Optional[str] = None,
+                     player_filter: Optional[str] = None,
+                     min_wins: Optional[int] = None,
+                     date_from: Optional[str] = None,
+                     date_to: Optional[str] = None) -> Iterator[int]:
+        """
+        Index des decks (dans l'ordre du store) correspondant aux filtres
+        Les filtres sont résolus une fois sur les tables de tournois et de noms,
+        puis appliqués aux ids de deck_meta : aucun deck n'est décodé.
+        """
+        tournament_ok = [
+            (not format_filter or t["format"] == format_filter)
+            and (not date_from or t["date"] >= date_from)
+            and (not date_to or t["date"] <= date_to)
+            for t in self.tournaments
+        ]
+        archetype_ok = self._matching_ids(self.archetypes, archetype_filter)
+        player_ok = self._matching_ids(self.players, player_filter)
+        result_ok = None if min_wins is None else [parse_record(result)[0] >= min_wins for result in self.results]
+
+        meta = self.deck_meta
+        for index in range(len(self)):
+            base = index * DECK_META_FIELDS
+            if not tournament_ok[meta[base]]:
+                continue
+            if archetype_ok is not None and not archetype_ok[meta[base + 1]]:
+                continue
+            if player_ok is not None and not player_ok[meta[base + 2]]:
+                continue
+            if result_ok is not None and not result_ok[meta[base + 3]]:
+                continue
+            yield index
+
+def classify_stored_deck(engine, store: DeckStore, index: int, format_name: Optional[str] = None):
+    """
+    Classifier un deck lu dans le store avec un engine exposant
+    classify_deck(mainboard, sideboard, format_name)
+
+    Args:
+        engine: ArchetypeClassifier ou BadaroArchetypeEngine
+        store: DeckStore ouvert
+        index: Index du deck dans le store
+        format_name: Format (défaut: celui du tournoi du deck)
+    """
+    if format_name is None:
+        format_name = store.tournaments[store.tournament_index(index)]["format"]
+    return engine.classify_deck(store.board(index, "main"), store.board(index, "side"), format_name)
@@ -0,0 +1,132 @@
+"""
+Bundles versionnés des définitions Badaro (MTGOFormatData)
+Un bundle regroupe tous les formats dans un seul fichier JSON, identifié par
+le SHA du commit upstream, et se construit depuis un clone local ou un tarball
+"""
+import json
+import logging
+import os
+import re
+import subprocess
+import tarfile
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("badaro.format_bundle")
+
+SHA_RE = re.compile(r"[0-9a-f]{40}")
+CURRENT_POINTER = "CURRENT"
+
+def _empty_format() -> Dict[str, Any]:
+    return {"archetypes": {}, "fallbacks": {}, "color_overrides": {}}
+
+def _add_file(formats: Dict[str, Dict[str, Any]], relative: PurePosixPath, read_json) -> None:
+    """Ranger un fichier Formats/<Format>/... dans la structure du bundle"""
+    parts = relative.parts
+    if len(parts) < 3 or parts[0] != "Formats" or relative.suffix != ".json":
+        return
+
+    format_data = formats.setdefault(parts[1], _empty_format())
+    if len(parts) == 3 and parts[2] == "color_overrides.json":
+        format_data["color_overrides"] = read_json()
+    elif len(parts) == 4 and parts[2] == "Archetypes":
+        format_data["archetypes"][relative.stem] = read_json()
+    elif len(parts) == 4 and parts[2] == "Fallbacks":
+        format_data["fallbacks"][relative.stem] = read_json()
+
+def read_formats_from_clone(repo_path: Path) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+    """
+    Lire toutes les définitions d'un clone local de MTGOFormatData
+
+    Returns:
+        (SHA du commit HEAD, données par format)
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo_path, capture_output=True, text=True, check=True
+    )
+    version = result.stdout.strip()
+
+    formats: Dict[str, Dict[str, Any]] = {}
+    for json_file in sorted((repo_path / "Formats").rglob("*.json")):
+        relative = PurePosixPath(json_file.relative_to(repo_path).as_posix())
+        _add_file(formats, relative, lambda: json.loads(json_file.read_text(encoding="utf-8")))
+
+    return version, formats
+
+def _root_directory(paths: List[PurePosixPath]) -> Optional[str]:
+    """Répertoire racine commun à tous les fichiers de l'archive, None s'il n'y en a pas"""
+    roots = {path.parts[0] if len(path.parts) > 1 else None for path in paths}
+    if len(roots) != 1:
+        return None
+    root = roots.pop()
+    return root if root != "Formats" else None
+
+def read_formats_from_tarball(tarball_path: Path, version: Optional[str] = None) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+    """
+    Lire toutes les définitions d'un tarball de MTGOFormatData
+
+    Le SHA est lu dans l'en-tête pax écrit par `git archive` (tarballs GitHub),
+    ou dans le nom du répertoire racine, à défaut du paramètre version.
+    Le tarball peut avoir un répertoire racine (MTGOFormatData-<sha>/Formats/...)
+    ou commencer directement par Formats/.
+    """
+    formats: Dict[str, Dict[str, Any]] = {}
+
+    with tarfile.open(tarball_path, "r:*") as tar:
+        version = version or tar.pax_headers.get("comment")
+        members = [(member, PurePosixPath(member.name)) for member in tar.getmembers() if member.isfile()]
+
+        root = _root_directory([path for _, path in members])
+        if root and version is None and (match := SHA_RE.search(root)):
+            version = match.group()
+
+        for member, path in members:
+            relative = PurePosixPath(*path.parts[1:]) if root else path
+            _add_file(formats, relative, lambda: json.load(tar.extractfile(member)))
+
+    if not version:
+        raise ValueError(f"Cannot determine upstream commit SHA for {tarball_path}")
+
+    return version, formats
+
+def install_bundle(bundle_dir: Path, version: str, formats: Dict[str, Dict[str, Any]], source: str = "") -> Path:
+    """
+    Écrire le bundle <version>.json puis basculer le pointeur CURRENT
+
+    Les deux écritures passent par un fichier temporaire + os.replace : un
+    lecteur concurrent voit l'ancien ou le nouveau bundle, jamais un fichier partiel.
+    """
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    bundle_path = bundle_dir / f"{version}.json"
+
+    bundle = {
+        "version": version,
+        "source": source,
+        "created_at": datetime.now().isoformat(),
+        "formats": formats
+    }
+    tmp_path = bundle_path.with_suffix(".json.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(bundle, f, ensure_ascii=False)
+    os.replace(tmp_path, bundle_path)
+
+    pointer_tmp = bundle_dir / f"{CURRENT_POINTER}.tmp"
+    pointer_tmp.write_text(version)
+    os.replace(pointer_tmp, bundle_dir / CURRENT_POINTER)
+
+    logger.info(f"Installed format bundle {version[:12]} ({len(formats)} formats)")
+    return bundle_path
+
+def current_version(bundle_dir: Path) -> Optional[str]:
+    """Version pointée par CURRENT, None si aucun bundle installé"""
+    pointer = bundle_dir / CURRENT_POINTER
+    if not pointer.exists():
+        return None
+    return pointer.read_text().strip() or None
+
+def read_bundle(bundle_path: Path) -> Dict[str, Any]:
+    """Lire un bundle installé"""
+    with open(bundle_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,79 @@
+"""
+Couche de parsing HTML partagée par les scrapers
+Choisit le backend le plus rapide disponible et ne construit que les
+conteneurs utiles de la page (SoupStrainer)
+"""
+import logging
+from typing import List, Optional, Pattern
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger("scraper.html_parsing")
+
+# Backend BeautifulSoup : lxml (C) si installé, sinon le parser pur Python
+try:
+    import lxml.html
+    SOUP_FEATURES = "lxml"
+except ImportError:
+    lxml = None
+    SOUP_FEATURES = "html.parser"
+
+# selectolax (optionnel) pour l'extraction de liens sur les pages listes
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+
+def div_strainer(*classes: str) -> SoupStrainer:
+    """SoupStrainer ne gardant que les <div> portant une des classes données"""
+    return SoupStrainer("div", class_=list(classes))
+
+
+def make_soup(content: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Construit un arbre BeautifulSoup avec le backend le plus rapide
+
+    Args:
+        content: HTML brut de la page
+        parse_only: Restreindre l'arbre aux éléments acceptés par ce filtre
+
+    Returns:
+        BeautifulSoup (partiel si parse_only est fourni)
+    """
+    return BeautifulSoup(content, SOUP_FEATURES, parse_only=parse_only)
+
+
+def extract_links(content: str, pattern: Pattern[str]) -> List[str]:
+    """
+    Extrait, dans l'ordre du document, les href des liens correspondant au pattern
+
+    Même sémantique que soup.find_all('a', href=pattern) (recherche, pas match
+    complet) sans construire l'arbre complet de la page.
+    """
+    if SelectolaxParser is not None:
+        hrefs = []
+        for node in SelectolaxParser(content).css("a[href]"):
+            href = node.attributes.get("href")
+            if href and pattern.search(href):
+                hrefs.append(href)
+        return hrefs
+
+    if lxml is not None:
+        document = lxml.html.document_fromstring(content)
+        return [
+            href for href in (link.get("href") for link in document.iter("a"))
+            if href and pattern.search(href)
+        ]
+
+    soup = make_soup(content, SoupStrainer("a", href=pattern))
+    return [link["href"] for link in soup.find_all("a", href=True)]
+
+
+def parser_backend() -> str:
+    """Nom du backend utilisé (pour les logs et le benchmark)"""
+    if SelectolaxParser is not None:
+        links_backend = "selectolax"
+    else:
+        links_backend = "lxml.html" if lxml is not None else SOUP_FEATURES
+    return f"soup={SOUP_FEATURES}, links={links_backend}"
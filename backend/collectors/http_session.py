@@ -0,0 +1,93 @@
+"""
+Pool de connexions HTTP partagé par les collecteurs
+Un seul TCPConnector par event loop (keep-alive, cache DNS, limites par hôte)
+et une ClientSession légère par client, qui réutilise ce pool
+"""
+import asyncio
+import logging
+import os
+import weakref
+from typing import Dict, Optional
+
+import aiohttp
+
+# Réglages du pool (surchargeables par variables d'environnement)
+POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+
+class SessionRegistry:
+    """
+    Registre process-wide des sessions aiohttp
+
+    Les connexions (TLS compris) restent ouvertes entre les appels et entre
+    les runs du UnifiedScraper tant que l'event loop vit. Les sessions
+    retournées ne doivent pas être fermées par les clients : c'est close()
+    qui libère tout, en fin de process.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger("scraper.http_session")
+        # Un aiohttp connector est lié à son event loop
+        self._connectors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.TCPConnector]" = weakref.WeakKeyDictionary()
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, aiohttp.ClientSession]]" = weakref.WeakKeyDictionary()
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """Connector partagé de l'event loop courant (créé au premier appel)"""
+        loop = asyncio.get_running_loop()
+        connector = self._connectors.get(loop)
+        if connector is None or connector.closed:
+            connector = aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL
+            )
+            self._connectors[loop] = connector
+            self.logger.debug(f"Created shared TCP connector (limit={POOL_LIMIT}, per_host={POOL_LIMIT_PER_HOST})")
+        return connector
+
+    def get_session(self,
+                   name: str,
+                   headers: Optional[Dict[str, str]] = None,
+                   timeout: Optional[aiohttp.ClientTimeout] = None) -> aiohttp.ClientSession:
+        """
+        Session nommée adossée au connector partagé
+
+        Args:
+            name: Identifiant du client (une session par nom et par event loop)
+            headers: Headers par défaut de la session (fixés à la création)
+            timeout: Timeout par défaut (30s si absent)
+
+        Returns:
+            ClientSession réutilisable, à ne pas fermer côté client
+        """
+        loop = asyncio.get_running_loop()
+        sessions = self._sessions.setdefault(loop, {})
+
+        session = sessions.get(name)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=self.connector(),
+                connector_owner=False,
+                headers=headers,
+                timeout=timeout or aiohttp.ClientTimeout(total=30)
+            )
+            sessions[name] = session
+        return session
+
+    async def close(self):
+        """Fermer les sessions et le pool de l'event loop courant"""
+        loop = asyncio.get_running_loop()
+
+        for session in self._sessions.pop(loop, {}).values():
+            await session.close()
+
+        connector = self._connectors.pop(loop, None)
+        if connector is not None:
+            await connector.close()
+
+# Instance globale
+http_sessions = SessionRegistry()
@@ -18,6 +18,9 @@ from backend.collectors.config import config
 from backend.collectors.mtgtop8_scraper import MTGTop8Scraper
 from backend.collectors.melee_api_client import MeleeAPIClient
 from backend.collectors.storage import DataStorage
+# Registre importé à plat par les scrapers (le dossier du script est dans sys.path)
+from http_session import http_sessions
+from card_registry import card_registry
 
 def setup_logging():
     logging.basicConfig(
@@ -37,6 +40,15 @@ async def run_scraper(sources: List[str], formats: List[str], max_tournaments: i
         "melee": MeleeAPIClient()
     }
 
+    try:
+        await scrape_sources(scrapers, storage, sources, formats, max_tournaments)
+    finally:
+        # Les sessions sont partagées : le pool n'est libéré qu'en fin de run
+        await http_sessions.close()
+        card_registry.save()
+
+async def scrape_sources(scrapers, storage, sources: List[str], formats: List[str], max_tournaments: int):
+    logger = logging.getLogger(__name__)
     for source_name in sources:
         if source_name not in scrapers:
             logger.warning(f"Source '{source_name}' is not supported. Skipping.")
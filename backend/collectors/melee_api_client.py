@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 import json
 import os
 from config import config
+from http_session import http_sessions
+from card_registry import card_registry
 
 class MeleeAPIClient:
     """Client pour l'API Melee.gg"""
@@ -30,18 +32,18 @@ class MeleeAPIClient:
         self.request_delay = 1.0  # Plus rapide que scraping
         
     async def __aenter__(self):
-        """Initialiser la session HTTP"""
+        """Récupérer la session HTTP du pool partagé"""
         timeout = aiohttp.ClientTimeout(total=30)
-        self.session = aiohttp.ClientSession(
+        self.session = http_sessions.get_session(
+            "melee_api",
             timeout=timeout,
             headers=self.headers
         )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Fermer la session HTTP"""
-        if self.session:
-            await self.session.close()
+        """Libérer la session (partagée : fermée par http_sessions.close())"""
+        self.session = None
     
     async def get_tournaments(self, 
                             format_name: str = "Modern",
@@ -208,6 +210,8 @@ class MeleeAPIClient:
         try:
             player = standing_data.get("player", {})
             deck_data = standing_data.get("deck", {})
+            mainboard = card_registry.normalize_board(deck_data.get("mainboard", {}))
+            sideboard = card_registry.normalize_board(deck_data.get("sideboard", {}))
             
             deck = {
                 "position": position,
@@ -217,10 +221,10 @@ class MeleeAPIClient:
                 "draws": standing_data.get("draws", 0),
                 "points": standing_data.get("points", 0),
                 "archetype": deck_data.get("archetype", "Unknown"),
-                "mainboard": deck_data.get("mainboard", {}),
-                "sideboard": deck_data.get("sideboard", {}),
+                "mainboard": mainboard,
+                "sideboard": sideboard,
                 "color_identity": deck_data.get("colors", ""),
-                "total_cards": sum(deck_data.get("mainboard", {}).values())
+                "total_cards": sum(mainboard.values())
             }
             
             return deck
@@ -281,6 +285,9 @@ async def fetch_melee_tournaments(format_name: str = "Modern", max_tournaments:
     """
     Function helper pour récupérer les tournois Melee.gg
     Compatible avec l'interface scraper existante
+    
+    Le client est léger : les connexions viennent du pool partagé,
+    elles ne sont pas rouvertes à chaque appel.
     """
     async with MeleeAPIClient() as client:
         tournaments = await client.get_tournaments(
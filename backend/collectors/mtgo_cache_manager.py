@@ -10,11 +10,19 @@ import subprocess
 import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Any, Tuple
+from collections.abc import Mapping
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from bisect import bisect_left, insort
 import aiofiles
 import aiohttp
 
+import columnar_export
+from deck_store import DeckStore, write_deck_store
+from card_registry import card_registry
+
 @dataclass
 class CachedTournament:
     """Représentation d'un tournoi depuis MTGODecklistCache"""
@@ -37,6 +45,59 @@ class CacheStats:
     last_update: Optional[str] = None
     cache_size_mb: float = 0.0
 
+@dataclass
+class LoadedCache:
+    """Contenu d'un chargement complet, construit à part puis publié d'un coup"""
+    tournaments: Dict[str, CachedTournament] = field(default_factory=dict)
+    meta_buckets: Dict[str, Dict[str, Counter]] = field(default_factory=dict)
+    meta_days: Dict[str, List[str]] = field(default_factory=dict)
+    stats: CacheStats = field(default_factory=CacheStats)
+
+    def date_index(self) -> List[str]:
+        """Clés des tournois par date décroissante (tri stable : ordre de chargement à date égale)"""
+        return sorted(self.tournaments, key=lambda key: self.tournaments[key].date, reverse=True)
+
+class DeckView(Mapping):
+    """
+    Vue en lecture seule d'un deck enrichi des infos de son tournoi
+    Se lit comme le dict produit par get_decks sans copier le deck
+    """
+    __slots__ = ("deck", "tournament")
+
+    def __init__(self, deck: Dict[str, Any], tournament: CachedTournament):
+        self.deck = deck
+        self.tournament = tournament
+
+    def _tournament_fields(self) -> Dict[str, Any]:
+        return {
+            "tournament_name": self.tournament.name,
+            "tournament_date": self.tournament.date,
+            "tournament_format": self.tournament.format,
+            "tournament_source": self.tournament.source
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "tournament_name":
+            return self.tournament.name
+        if key == "tournament_date":
+            return self.tournament.date
+        if key == "tournament_format":
+            return self.tournament.format
+        if key == "tournament_source":
+            return self.tournament.source
+        return self.deck[key]
+
+    def __iter__(self):
+        yield from self.deck
+        yield from (key for key in self._tournament_fields() if key not in self.deck)
+
+    def __len__(self) -> int:
+        return len(self.deck) + sum(1 for key in self._tournament_fields() if key not in self.deck)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copie enrichie (même forme que l'ancien enriched_deck)"""
+        return {**self.deck, **self._tournament_fields()}
+
 class MTGOCacheManager:
     """
     Gestionnaire du cache MTGODecklistCache pour Metalyzr
@@ -49,7 +110,7 @@ class MTGOCacheManager:
     - Mise à jour automatique quotidienne
     """
     
-    def __init__(self, cache_dir: str = "./mtgo_cache"):
+    def __init__(self, cache_dir: str = "./mtgo_cache", background_stats: bool = False):
         self.logger = logging.getLogger("mtgo.cache_manager")
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
@@ -62,11 +123,31 @@ class MTGOCacheManager:
         # Configuration
         self.repo_url = "https://github.com/Jiliac/MTGODecklistCache.git"
         self.last_sync_file = self.cache_dir / "last_sync.txt"
+        self.cache_size_file = self.cache_dir / "cache_size.json"
+        self.columnar_dir = self.cache_dir / "columnar"
+        self.columnar_head_file = self.columnar_dir / "head.txt"
+        self.deck_store_dir = self.cache_dir / "deck_store"
+        self.deck_store_head_file = self.deck_store_dir / "head.txt"
+        # Taille du dépôt calculée en tâche de fond plutôt qu'au démarrage
+        self.background_stats = background_stats
         
         # Cache des données parsées
         self._tournaments_cache: Dict[str, CachedTournament] = {}
+        # Clés des tournois triées par date décroissante
+        self._date_index: List[str] = []
+        # Comptes d'archétypes par format puis par jour (YYYY-MM-DD)
+        self._meta_buckets: Dict[str, Dict[str, Counter]] = {}
+        # Jours présents par format, triés (fenêtres par bisect)
+        self._meta_days: Dict[str, List[str]] = {}
         self._stats_cache: Optional[CacheStats] = None
+        self._loading_stats = CacheStats()
+        self._cache_size_mb = 0.0
+        self._size_task: Optional[asyncio.Task] = None
         self._cache_loaded = False
+        # Export Parquet à jour du cache chargé (moteur "arrow" par défaut)
+        self._columnar_ready = False
+        # Store mappé en mémoire à jour du cache chargé : iter_decks le lit
+        self._deck_store: Optional[DeckStore] = None
         
     async def initialize(self, force_clone: bool = False) -> bool:
         """
@@ -95,6 +176,9 @@ class MTGOCacheManager:
             
             self._cache_loaded = True
             self.logger.info(f"✅ Cache initialized: {self._stats_cache.total_tournaments} tournaments, {self._stats_cache.total_decks} decks")
+            
+            await self._refresh_columnar()
+            await self._refresh_deck_store()
             return True
             
         except Exception as e:
@@ -153,22 +237,53 @@ class MTGOCacheManager:
             await f.write(datetime.now().isoformat())
     
     async def _load_tournaments_cache(self):
-        """Charger tous les tournois en cache mémoire"""
+        """
+        Charger tous les tournois en cache mémoire
+        Le nouveau contenu est construit à part ; le cache, l'index par date et
+        les buckets en service restent cohérents jusqu'à la bascule finale.
+        """
         self.logger.info("📦 Loading tournaments cache...")
         
-        self._tournaments_cache.clear()
+        loaded = LoadedCache()
         
         # Charger les tournois actifs
         if self.tournaments_path.exists():
-            await self._load_tournaments_from_directory(self.tournaments_path, is_archive=False)
+            await self._load_tournaments_from_directory(loaded, self.tournaments_path, is_archive=False)
         
         # Charger les tournois archivés
         if self.archive_path.exists():
-            await self._load_tournaments_from_directory(self.archive_path, is_archive=True)
+            await self._load_tournaments_from_directory(loaded, self.archive_path, is_archive=True)
+        
+        date_index = loaded.date_index()
+        # Bascule sans point de suspension : aucun lecteur ne voit un état mixte
+        self._tournaments_cache, self._date_index = loaded.tournaments, date_index
+        self._meta_buckets, self._meta_days = loaded.meta_buckets, loaded.meta_days
+        self._loading_stats = loaded.stats
+        await asyncio.to_thread(card_registry.save)
         
         self.logger.info(f"✅ Loaded {len(self._tournaments_cache)} tournaments in cache")
     
-    async def _load_tournaments_from_directory(self, directory: Path, is_archive: bool = False):
+    def _index_tournament(self, loaded: LoadedCache, tournament: CachedTournament, sign: int = 1):
+        """Ajouter (ou retirer) un tournoi des buckets et des statistiques"""
+        self._count_archetypes(loaded, tournament, sign)
+        self._track_stats(loaded.stats, tournament, sign)
+    
+    def _count_archetypes(self, loaded: LoadedCache, tournament: CachedTournament, sign: int = 1):
+        """Ajouter (ou retirer) les archétypes d'un tournoi au bucket (format, jour)"""
+        if not tournament.date:
+            return
+        
+        day = tournament.date[:10]
+        buckets = loaded.meta_buckets.setdefault(tournament.format, {})
+        bucket = buckets.get(day)
+        if bucket is None:
+            bucket = buckets[day] = Counter()
+            insort(loaded.meta_days.setdefault(tournament.format, []), day)
+        
+        for deck in tournament.decks:
+            bucket[deck.get("Archetype", "Unknown")] += sign
+    
+    async def _load_tournaments_from_directory(self, loaded: LoadedCache, directory: Path, is_archive: bool = False):
         """Charger les tournois depuis un répertoire"""
         
         for source_dir in directory.iterdir():
@@ -188,7 +303,11 @@ class MTGOCacheManager:
                         if tournament:
                             # Clé unique : source_date_name
                             key = f"{source_name}_{tournament.date}_{json_file.stem}"
-                            self._tournaments_cache[key] = tournament
+                            previous = loaded.tournaments.get(key)
+                            if previous:
+                                self._index_tournament(loaded, previous, -1)
+                            loaded.tournaments[key] = tournament
+                            self._index_tournament(loaded, tournament)
                             
                     except Exception as e:
                         self.logger.warning(f"⚠️ Failed to parse {json_file}: {e}")
@@ -203,6 +322,7 @@ class MTGOCacheManager:
             
             # Extraire les informations du tournoi
             tournament_info = data.get("Tournament", {})
+            self._canonicalize_cards(data.get("Decks", []))
             
             tournament = CachedTournament(
                 name=tournament_info.get("Name", json_file.stem),
@@ -226,52 +346,104 @@ class MTGOCacheManager:
             self.logger.error(f"❌ Error parsing {json_file}: {e}")
             return None
     
+    def _track_stats(self, stats: CacheStats, tournament: CachedTournament, sign: int = 1):
+        """Mettre à jour les statistiques en cours de chargement"""
+        stats.total_tournaments += sign
+        stats.total_decks += sign * len(tournament.decks)
+        stats.formats_coverage[tournament.format] = stats.formats_coverage.get(tournament.format, 0) + sign
+        
+        if sign > 0 and tournament.date:
+            first, last = stats.date_range
+            stats.date_range = (
+                min(first, tournament.date) if first else tournament.date,
+                max(last, tournament.date)
+            )
+    
+    def _canonicalize_cards(self, decks: List[Dict[str, Any]]):
+        """Remplacer les noms de cartes par les noms canoniques (chaînes partagées)"""
+        for deck in decks:
+            for board_key in ("Mainboard", "Sideboard"):
+                for card in deck.get(board_key) or []:
+                    if "CardName" in card:
+                        card["CardName"] = card_registry.canonical(card["CardName"])
+    
     async def _compute_stats(self):
-        """Calculer les statistiques du cache"""
-        
-        total_tournaments = len(self._tournaments_cache)
-        total_decks = 0
-        formats_coverage = {}
-        dates = []
-        
-        for tournament in self._tournaments_cache.values():
-            total_decks += len(tournament.decks)
-            
-            # Compter par format
-            fmt = tournament.format
-            formats_coverage[fmt] = formats_coverage.get(fmt, 0) + 1
-            
-            # Collecter les dates
-            if tournament.date:
-                dates.append(tournament.date)
-        
-        # Calculer la plage de dates
-        if dates:
-            dates.sort()
-            date_range = (dates[0], dates[-1])
-        else:
-            date_range = ("", "")
-        
-        # Calculer la taille du cache
-        cache_size = 0
-        if self.repo_path.exists():
-            for file_path in self.repo_path.rglob("*"):
-                if file_path.is_file():
-                    cache_size += file_path.stat().st_size
-        
-        # Dernière mise à jour
+        """Publier les statistiques accumulées pendant le chargement"""
         last_update = None
         if self.last_sync_file.exists():
             last_update = self.last_sync_file.read_text().strip()
         
+        stats = self._loading_stats
         self._stats_cache = CacheStats(
-            total_tournaments=total_tournaments,
-            total_decks=total_decks,
-            formats_coverage=formats_coverage,
-            date_range=date_range,
+            total_tournaments=stats.total_tournaments,
+            total_decks=stats.total_decks,
+            formats_coverage=dict(stats.formats_coverage),
+            date_range=stats.date_range,
             last_update=last_update,
-            cache_size_mb=cache_size / (1024 * 1024)
+            cache_size_mb=self._cache_size_mb
+        )
+        
+        # La taille du dépôt ne change qu'avec le commit HEAD
+        if self.background_stats:
+            if self._size_task is None or self._size_task.done():
+                self._size_task = asyncio.create_task(self._refresh_cache_size())
+        else:
+            await self._refresh_cache_size()
+    
+    async def _refresh_cache_size(self):
+        """Recalculer la taille du dépôt si HEAD a changé depuis la dernière mesure"""
+        try:
+            head = await self._repository_head()
+            cached = {}
+            if self.cache_size_file.exists():
+                cached = json.loads(self.cache_size_file.read_text())
+            
+            if head and cached.get("head") == head:
+                size_mb = cached["size_mb"]
+            else:
+                size_bytes = await asyncio.to_thread(self._directory_size, self.repo_path)
+                size_mb = size_bytes / (1024 * 1024)
+                if head:
+                    self.cache_size_file.write_text(json.dumps({"head": head, "size_mb": size_mb}))
+            
+            self._cache_size_mb = size_mb
+            if self._stats_cache is not None:
+                self._stats_cache = replace(self._stats_cache, cache_size_mb=size_mb)
+                
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not compute cache size: {e}")
+    
+    async def _repository_head(self) -> Optional[str]:
+        """SHA du commit HEAD du dépôt, None si indisponible"""
+        if not self.repo_path.exists():
+            return None
+        
+        process = await asyncio.create_subprocess_exec(
+            "git", "rev-parse", "HEAD",
+            cwd=self.repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
+        stdout, _ = await process.communicate()
+        return stdout.decode().strip() if process.returncode == 0 else None
+    
+    @staticmethod
+    def _directory_size(path: Path) -> int:
+        """Taille totale des fichiers d'un répertoire (os.scandir, sans objets Path)"""
+        total = 0
+        pending = [str(path)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        return total
     
     async def get_tournaments(self, 
                             format_filter: Optional[str] = None,
@@ -327,6 +499,65 @@ class MTGOCacheManager:
         
         return results
     
+    def iter_decks(self,
+                   format_filter: Optional[str] = None,
+                   archetype_filter: Optional[str] = None,
+                   player_filter: Optional[str] = None,
+                   min_wins: Optional[int] = None,
+                   date_from: Optional[str] = None,
+                   date_to: Optional[str] = None) -> Iterator[DeckView]:
+        """
+        Parcourir les decks par date de tournoi décroissante, à la demande
+        
+        Les filtres sont appliqués avant toute copie et le parcours s'arrête
+        dès que le consommateur cesse d'itérer (ou sous date_from).
+        Le cache doit être chargé (voir initialize).
+        
+        Quand le store mappé en mémoire est ouvert (voir build_deck_store), les
+        decks y sont lus : les filtres portent sur ses ids, seuls les decks
+        retournés sont décodés.
+        
+        Yields:
+            DeckView (ou deck relu dans le store) pour chaque deck correspondant
+        """
+        store = self._deck_store
+        if store is not None:
+            for index in store.iter_indices(format_filter, archetype_filter, player_filter,
+                                            min_wins, date_from, date_to):
+                yield store.deck(index)
+            return
+        
+        archetype_filter = archetype_filter.lower() if archetype_filter else None
+        player_filter = player_filter.lower() if player_filter else None
+        
+        # Références prises une fois : un rechargement pendant le parcours publie
+        # un nouveau couple (cache, index) sans toucher à celui-ci
+        tournaments, date_index = self._tournaments_cache, self._date_index
+        for key in date_index:
+            tournament = tournaments[key]
+            
+            if date_from and tournament.date < date_from:
+                # Index trié : tous les tournois suivants sont plus anciens
+                break
+            
+            if date_to and tournament.date > date_to:
+                continue
+            
+            if format_filter and tournament.format != format_filter:
+                continue
+            
+            for deck in tournament.decks:
+                if archetype_filter and archetype_filter not in deck.get("Archetype", "").lower():
+                    continue
+                
+                if player_filter and player_filter not in deck.get("Player", "").lower():
+                    continue
+                
+                if min_wins is not None and self._extract_wins_from_result(deck.get("Result", "")) < min_wins:
+                    continue
+                
+                yield DeckView(deck, tournament)
+    
     async def get_decks(self,
                        format_filter: Optional[str] = None,
                        archetype_filter: Optional[str] = None,
@@ -344,53 +575,23 @@ class MTGOCacheManager:
             limit: Nombre maximum de résultats
             
         Returns:
-            Liste des decks correspondants
+            Liste des decks correspondants, par date de tournoi décroissante
         """
         if not self._cache_loaded:
             await self.initialize()
         
-        results = []
-        
-        for tournament in self._tournaments_cache.values():
-            if format_filter and tournament.format != format_filter:
-                continue
-            
-            for deck in tournament.decks:
-                # Enrichir le deck avec les infos du tournoi
-                enriched_deck = {
-                    **deck,
-                    "tournament_name": tournament.name,
-                    "tournament_date": tournament.date,
-                    "tournament_format": tournament.format,
-                    "tournament_source": tournament.source
-                }
-                
-                # Filtres sur le deck
-                if archetype_filter:
-                    deck_archetype = deck.get("Archetype", "")
-                    if archetype_filter.lower() not in deck_archetype.lower():
-                        continue
-                
-                if player_filter:
-                    player_name = deck.get("Player", "")
-                    if player_filter.lower() not in player_name.lower():
-                        continue
-                
-                if min_wins is not None:
-                    wins = self._extract_wins_from_result(deck.get("Result", ""))
-                    if wins < min_wins:
-                        continue
-                
-                results.append(enriched_deck)
-        
-        # Trier par date de tournoi décroissante
-        results.sort(key=lambda d: d.get("tournament_date", ""), reverse=True)
-        
-        # Appliquer la limite
-        if limit:
-            results = results[:limit]
+        views = self.iter_decks(
+            format_filter=format_filter,
+            archetype_filter=archetype_filter,
+            player_filter=player_filter,
+            min_wins=min_wins
+        )
         
-        return results
+        # Seuls les decks retournés sont copiés
+        return [
+            view.to_dict() if isinstance(view, DeckView) else view
+            for view in islice(views, limit or None)
+        ]
     
     def _extract_wins_from_result(self, result_str: str) -> int:
         """Extraire le nombre de victoires depuis une string de résultat"""
@@ -479,6 +680,8 @@ class MTGOCacheManager:
             await self._update_repository()
             await self._load_tournaments_cache()
             await self._compute_stats()
+            await self._refresh_columnar(force=True)
+            await self._refresh_deck_store(force=True)
             
             self.logger.info("✅ Cache refresh completed")
             return True
@@ -487,44 +690,125 @@ class MTGOCacheManager:
             self.logger.error(f"❌ Cache refresh failed: {e}")
             return False
     
+    async def export_columnar(self) -> Dict[str, int]:
+        """
+        Exporter le corpus en Parquet partitionné (format, mois) dans columnar_dir
+        
+        Returns:
+            Nombre de lignes par dataset (tournaments, decks, deck_cards)
+        """
+        if not self._cache_loaded:
+            await self.initialize()
+        
+        tournaments = [(key, self._tournaments_cache[key]) for key in self._date_index]
+        counts = await asyncio.to_thread(columnar_export.export_corpus, tournaments, self.columnar_dir)
+        self._columnar_ready = True
+        return counts
+    
+    async def _refresh_columnar(self, force: bool = False):
+        """
+        Réécrire l'export Parquet si pyarrow est installé (extra "columnar")
+        L'export existant est réutilisé tant que le commit HEAD n'a pas changé.
+        """
+        self._columnar_ready = False
+        if not columnar_export.is_available():
+            return
+        
+        try:
+            head = await self._repository_head()
+            exported = self.columnar_head_file.read_text().strip() if self.columnar_head_file.exists() else None
+            if head and head == exported and not force:
+                self._columnar_ready = True
+                return
+            
+            await self.export_columnar()
+            if head:
+                self.columnar_head_file.write_text(head)
+                
+        except Exception as e:
+            self.logger.warning(f"⚠️ Columnar export failed, analytics stay in memory: {e}")
+    
+    @property
+    def analytics_engine(self) -> str:
+        """Moteur d'analyse par défaut ("arrow" si l'export Parquet est à jour, sinon "memory")"""
+        return "arrow" if self._columnar_ready else "memory"
+    
+    async def build_deck_store(self) -> int:
+        """
+        Écrire le store compact mappé en mémoire (deck_store_dir), par date décroissante
+        
+        Returns:
+            Nombre de decks écrits
+        """
+        if not self._cache_loaded:
+            await self.initialize()
+        
+        tournaments = [(key, self._tournaments_cache[key]) for key in self._date_index]
+        deck_count = await asyncio.to_thread(write_deck_store, tournaments, self.deck_store_dir, card_registry)
+        # Un parcours en cours garde ses mmap sur l'ancien store
+        self._deck_store = self.open_deck_store()
+        return deck_count
+    
+    def open_deck_store(self) -> Optional[DeckStore]:
+        """Ouvrir le store en lecture seule (partagé entre workers via le cache disque)"""
+        if not (self.deck_store_dir / "strings.json").exists():
+            return None
+        return DeckStore(self.deck_store_dir)
+    
+    async def _refresh_deck_store(self, force: bool = False):
+        """Reconstruire le store si le commit HEAD a changé depuis sa construction, puis l'ouvrir"""
+        self._deck_store = None
+        try:
+            head = await self._repository_head()
+            built = self.deck_store_head_file.read_text().strip() if self.deck_store_head_file.exists() else None
+            if head and head == built and not force:
+                self._deck_store = self.open_deck_store()
+                return
+            
+            await self.build_deck_store()
+            if head:
+                self.deck_store_head_file.write_text(head)
+                
+        except Exception as e:
+            self.logger.warning(f"⚠️ Deck store build failed, decks are served from memory: {e}")
+    
     async def get_format_meta_snapshot(self, 
                                      format_name: str, 
-                                     days_back: int = 30) -> Dict[str, Any]:
+                                     days_back: int = 30,
+                                     engine: Optional[str] = None) -> Dict[str, Any]:
         """
         Obtenir un snapshot du méta pour un format
         
         Args:
             format_name: Nom du format (Modern, Standard, etc.)
             days_back: Nombre de jours en arrière
+            engine: "memory" (buckets du cache) ou "arrow" (export Parquet, voir export_columnar) ;
+                    par défaut analytics_engine
             
         Returns:
-            Dictionnaire avec analyse du méta
+            Dictionnaire avec analyse du méta ; archetype_breakdown est trié par
+            pourcentage décroissant puis par nom (ordre indépendant du chargement)
         """
+        if (engine or self.analytics_engine) == "arrow":
+            analytics = columnar_export.ArrowAnalytics(self.columnar_dir)
+            return await asyncio.to_thread(analytics.meta_snapshot, format_name, days_back)
+        
         if not self._cache_loaded:
             await self.initialize()
         
         # Calculer la date limite
         date_limit = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
         
-        # Récupérer les decks du format
-        decks = await self.get_decks(
-            format_filter=format_name,
-            limit=None
-        )
+        # Somme des buckets journaliers de la fenêtre
+        days = self._meta_days.get(format_name, [])
+        buckets = self._meta_buckets.get(format_name, {})
+        archetype_counts = Counter()
         
-        # Filtrer par date
-        recent_decks = [
-            deck for deck in decks 
-            if deck.get("tournament_date", "") >= date_limit
-        ]
+        for day in days[bisect_left(days, date_limit):]:
+            archetype_counts.update(buckets[day])
         
-        # Analyser les archétypes
-        archetype_counts = {}
-        total_decks = len(recent_decks)
-        
-        for deck in recent_decks:
-            archetype = deck.get("Archetype", "Unknown")
-            archetype_counts[archetype] = archetype_counts.get(archetype, 0) + 1
+        archetype_counts = +archetype_counts  # Retirer les comptes nuls
+        total_decks = sum(archetype_counts.values())
         
         # Calculer les pourcentages
         archetype_percentages = {
@@ -532,11 +816,11 @@ class MTGOCacheManager:
             for archetype, count in archetype_counts.items()
         }
         
-        # Trier par popularité
+        # Trier par popularité ; à égalité, par nom : les buckets ne gardent pas
+        # l'ordre de première apparition, qui dépendait du parcours des fichiers
         sorted_archetypes = sorted(
             archetype_percentages.items(),
-            key=lambda x: x[1],
-            reverse=True
+            key=lambda x: (-x[1], x[0])
         )
         
         return {
@@ -547,6 +831,53 @@ class MTGOCacheManager:
             "archetype_breakdown": sorted_archetypes[:20],  # Top 20
             "last_updated": datetime.now().isoformat()
         }
+    
+    async def get_archetype_winrates(self,
+                                     format_name: str,
+                                     days_back: int = 30,
+                                     min_decks: int = 1,
+                                     engine: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Victoires, défaites et winrate par archétype (depuis les résultats des decks)
+        
+        Args:
+            format_name: Nom du format
+            days_back: Nombre de jours en arrière
+            min_decks: Nombre minimum de decks par archétype
+            engine: "memory" ou "arrow", par défaut analytics_engine
+            
+        Returns:
+            Lignes {archetype, decks, wins, losses, winrate}, par nombre de decks décroissant
+        """
+        date_limit = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        
+        if (engine or self.analytics_engine) == "arrow":
+            analytics = columnar_export.ArrowAnalytics(self.columnar_dir)
+            return await asyncio.to_thread(analytics.archetype_winrates, format_name, date_limit, min_decks)
+        
+        if not self._cache_loaded:
+            await self.initialize()
+        
+        totals: Dict[str, List[int]] = {}
+        for deck in self.iter_decks(format_filter=format_name, date_from=date_limit):
+            wins, losses = columnar_export.parse_record(deck.get("Result", ""))
+            row = totals.setdefault(deck.get("Archetype", "Unknown"), [0, 0, 0])
+            row[0] += 1
+            row[1] += wins
+            row[2] += losses
+        
+        rows = [
+            {
+                "archetype": archetype,
+                "decks": decks,
+                "wins": wins,
+                "losses": losses,
+                "winrate": round(wins / (wins + losses) * 100, 2) if wins + losses else 0.0
+            }
+            for archetype, (decks, wins, losses) in totals.items()
+            if decks >= min_decks
+        ]
+        return sorted(rows, key=lambda r: (-r["decks"], r["archetype"]))
 
 # Instance globale
 mtgo_cache = MTGOCacheManager() 
\ No newline at end of file
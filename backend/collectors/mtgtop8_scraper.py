@@ -7,6 +7,17 @@ from urllib.parse import urljoin, urlparse, parse_qs
 
 from base_scraper import BaseScraper
 from config import config
+from html_parsing import make_soup, div_strainer, extract_links
+from card_registry import card_registry
+from card_database import card_database
+
+# Liens vers les tournois (et leurs decks) sur les pages MTGTop8
+EVENT_LINK_RE = re.compile(r'event\?e=\d+')
+DECK_LINK_RE = re.compile(r'event\?e=\d+&d=\d+')
+
+# Conteneurs réellement lus sur chaque type de page
+EVENT_STRAINER = div_strainer('event_title', 'event_date', 'format', 'location', 'players')
+DECK_STRAINER = div_strainer('player_name', 'record', 'mainboard', 'sideboard')
 
 class MTGTop8Scraper(BaseScraper):
     """Scraper spécialisé pour MTGTop8.com"""
@@ -27,14 +38,13 @@ class MTGTop8Scraper(BaseScraper):
             self.logger.error(f"Failed to fetch tournaments page for {format_name}")
             return []
         
-        soup = BeautifulSoup(content, 'html.parser')
         tournaments = []
         
         # Trouver les liens de tournois
-        tournament_links = soup.find_all('a', href=re.compile(r'event\?e=\d+'))
+        tournament_links = extract_links(content, EVENT_LINK_RE)
         
-        for link in tournament_links[:max_tournaments]:
-            tournament_url = urljoin(self.base_url, link['href'])
+        for href in tournament_links[:max_tournaments]:
+            tournament_url = urljoin(self.base_url, href)
             tournament_data = await self.scrape_tournament_details(tournament_url)
             
             if tournament_data:
@@ -52,45 +62,19 @@ class MTGTop8Scraper(BaseScraper):
         if not content:
             return None
         
-        soup = BeautifulSoup(content, 'html.parser')
-        
         try:
-            # Extraire les informations du tournoi
-            title_elem = soup.find('div', class_='event_title')
-            name = self.clean_text(title_elem.text) if title_elem else "Unknown Tournament"
-            
-            # Date du tournoi
-            date_elem = soup.find('div', class_='event_date')
-            date_str = self.clean_text(date_elem.text) if date_elem else ""
-            tournament_date = self.parse_date(date_str) or datetime.now()
-            
-            # Format
-            format_elem = soup.find('div', class_='format')
-            format_name = self.clean_text(format_elem.text) if format_elem else "Unknown"
-            
-            # Localisation
-            location_elem = soup.find('div', class_='location')
-            location = self.clean_text(location_elem.text) if location_elem else ""
-            
-            # Nombre de joueurs
-            players_elem = soup.find('div', class_='players')
-            total_players = self.extract_number(players_elem.text) if players_elem else 0
+            tournament_data = self.parse_tournament_page(content)
             
             # Scraper les decks
-            decks = await self.scrape_tournament_decks(tournament_url, soup)
+            decks = await self.scrape_tournament_decks(tournament_url, content)
             
-            tournament_data = {
-                "name": name,
-                "format": format_name,
-                "date": tournament_date,
-                "location": location,
+            tournament_data.update({
                 "organizer": "MTGTop8",
-                "total_players": total_players,
                 "source_url": tournament_url,
                 "source_site": "mtgtop8",
                 "decks": decks,
                 "is_complete": len(decks) > 0
-            }
+            })
             
             return tournament_data
             
@@ -98,15 +82,48 @@ class MTGTop8Scraper(BaseScraper):
             self.logger.error(f"Error parsing tournament {tournament_url}: {str(e)}")
             return None
     
-    async def scrape_tournament_decks(self, tournament_url: str, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        """Scrape les decks d'un tournoi"""
+    def parse_tournament_page(self, content: str) -> Dict[str, Any]:
+        """Extrait les métadonnées d'une page de tournoi (sans les decks)"""
+        soup = make_soup(content, EVENT_STRAINER)
+        
+        # Extraire les informations du tournoi
+        title_elem = soup.find('div', class_='event_title')
+        name = self.clean_text(title_elem.text) if title_elem else "Unknown Tournament"
+        
+        # Date du tournoi
+        date_elem = soup.find('div', class_='event_date')
+        date_str = self.clean_text(date_elem.text) if date_elem else ""
+        tournament_date = self.parse_date(date_str) or datetime.now()
+        
+        # Format
+        format_elem = soup.find('div', class_='format')
+        format_name = self.clean_text(format_elem.text) if format_elem else "Unknown"
+        
+        # Localisation
+        location_elem = soup.find('div', class_='location')
+        location = self.clean_text(location_elem.text) if location_elem else ""
+        
+        # Nombre de joueurs
+        players_elem = soup.find('div', class_='players')
+        total_players = self.extract_number(players_elem.text) if players_elem else 0
+        
+        return {
+            "name": name,
+            "format": format_name,
+            "date": tournament_date,
+            "location": location,
+            "total_players": total_players
+        }
+    
+    async def scrape_tournament_decks(self, tournament_url: str, content: str) -> List[Dict[str, Any]]:
+        """Scrape les decks d'un tournoi depuis le HTML de sa page"""
         decks = []
         
         # Trouver les liens vers les decks
-        deck_links = soup.find_all('a', href=re.compile(r'event\?e=\d+&d=\d+'))
+        deck_links = extract_links(content, DECK_LINK_RE)
         
-        for i, link in enumerate(deck_links[:config.MAX_DECKS_PER_TOURNAMENT]):
-            deck_url = urljoin(self.base_url, link['href'])
+        for i, href in enumerate(deck_links[:config.MAX_DECKS_PER_TOURNAMENT]):
+            deck_url = urljoin(self.base_url, href)
             deck_data = await self.scrape_deck_details(deck_url)
             
             if deck_data:
@@ -123,41 +140,43 @@ class MTGTop8Scraper(BaseScraper):
         if not content:
             return None
         
-        soup = BeautifulSoup(content, 'html.parser')
-        
         try:
-            # Nom du joueur
-            player_elem = soup.find('div', class_='player_name')
-            player_name = self.clean_text(player_elem.text) if player_elem else "Unknown Player"
-            
-            # Record (wins/losses)
-            record_elem = soup.find('div', class_='record')
-            wins, losses, draws = self._parse_record(record_elem.text if record_elem else "")
-            
-            # Composition du deck
-            mainboard = self._parse_decklist(soup, 'mainboard')
-            sideboard = self._parse_decklist(soup, 'sideboard')
-            
-            # Couleurs du deck
-            color_identity = self._extract_color_identity(mainboard)
-            
-            deck_data = {
-                "player_name": player_name,
-                "wins": wins,
-                "losses": losses,
-                "draws": draws,
-                "mainboard": mainboard,
-                "sideboard": sideboard,
-                "color_identity": color_identity,
-                "total_cards": sum(mainboard.values()) if mainboard else 60
-            }
-            
-            return deck_data
+            return self.parse_deck_page(content)
             
         except Exception as e:
             self.logger.error(f"Error parsing deck {deck_url}: {str(e)}")
             return None
     
+    def parse_deck_page(self, content: str) -> Dict[str, Any]:
+        """Extrait joueur, record et composition d'une page de deck"""
+        soup = make_soup(content, DECK_STRAINER)
+        
+        # Nom du joueur
+        player_elem = soup.find('div', class_='player_name')
+        player_name = self.clean_text(player_elem.text) if player_elem else "Unknown Player"
+        
+        # Record (wins/losses)
+        record_elem = soup.find('div', class_='record')
+        wins, losses, draws = self._parse_record(record_elem.text if record_elem else "")
+        
+        # Composition du deck
+        mainboard = self._parse_decklist(soup, 'mainboard')
+        sideboard = self._parse_decklist(soup, 'sideboard')
+        
+        # Couleurs du deck
+        color_identity = self._extract_color_identity(mainboard)
+        
+        return {
+            "player_name": player_name,
+            "wins": wins,
+            "losses": losses,
+            "draws": draws,
+            "mainboard": mainboard,
+            "sideboard": sideboard,
+            "color_identity": color_identity,
+            "total_cards": sum(mainboard.values()) if mainboard else 60
+        }
+    
     def _format_to_mtgtop8(self, format_name: str) -> str:
         """Convertit le nom de format vers l'ID MTGTop8"""
         format_mapping = {
@@ -199,26 +218,11 @@ class MTGTop8Scraper(BaseScraper):
                 count = self.extract_number(count_elem.text) or 1
                 name = self.clean_text(name_elem.text)
                 if name:
-                    decklist[name] = count
+                    name = card_registry.canonical(name)
+                    decklist[name] = decklist.get(name, 0) + count
         
         return decklist
     
     def _extract_color_identity(self, mainboard: Dict[str, int]) -> str:
-        """Extrait l'identité colorielle d'un deck"""
-        # Logique simplifiée - dans un vrai scraper, on utiliserait une base de données de cartes
-        colors = set()
-        
-        # Cartes connues et leurs couleurs (exemple)
-        known_cards = {
-            "Lightning Bolt": "R",
-            "Counterspell": "U", 
-            "Swords to Plowshares": "W",
-            "Dark Ritual": "B",
-            "Giant Growth": "G"
-        }
-        
-        for card_name in mainboard.keys():
-            if card_name in known_cards:
-                colors.add(known_cards[card_name])
-        
-        return "".join(sorted(colors)) if colors else "C" 
\ No newline at end of file
+        """Extrait l'identité colorielle d'un deck (ordre WUBRG, "C" si incolore)"""
+        return card_database.deck_colors(mainboard.keys()) or "C" 
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Base de cartes : table intégrée sans fichier, table construite depuis un bulk Scryfall
+"""
+import json
+
+from card_database import CardDatabase, build_card_database
+
+
+def test_missing_file_falls_back_to_builtin_table(tmp_path):
+    database = CardDatabase(str(tmp_path / "missing.json"))
+
+    assert database.deck_colors(["Lightning Bolt", "Counterspell", "Steam Vents"]) == "UR"
+    assert database.deck_colors(["Swords to Plowshares", "Boros Charm"]) == "WR"
+    assert database.deck_colors(["Unknown Card"]) == ""
+
+
+def test_built_table_replaces_fallback(tmp_path):
+    bulk = tmp_path / "oracle-cards.json"
+    bulk.write_text(json.dumps([
+        {"name": "Lightning Bolt", "colors": ["R"], "color_identity": ["R"], "cmc": 1.0, "type_line": "Instant"},
+        {"name": "Fable of the Mirror-Breaker // Reflection of Kiki-Jiki", "color_identity": ["R"], "cmc": 3.0,
+         "type_line": "Enchantment — Saga // Enchantment Creature", "card_faces": [{"colors": ["R"]}, {"colors": ["R"]}]},
+    ]))
+    output = tmp_path / "card_database.json"
+    assert build_card_database(bulk, output) == 3
+
+    database = CardDatabase(str(output))
+    assert database.deck_colors(["Fable of the Mirror-Breaker"]) == "R"
+    assert "Counterspell" not in database
@@ -0,0 +1,53 @@
+"""
+Registre des noms de cartes partagé entre processus : lecture au premier
+accès, fusion sous verrou à l'écriture
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+from card_registry import CardRegistry
+
+COLLECTORS_DIR = Path(__file__).parent
+
+
+def test_file_is_read_on_first_access(tmp_path):
+    path = tmp_path / "card_registry.json"
+    path.write_text('{"names": ["Lightning Bolt"]}')
+    registry = CardRegistry(str(path))
+
+    path.write_text('{"names": ["Lightning Bolt", "Counterspell"]}')
+    assert registry.card_id("counterspell") == 1
+
+
+def test_concurrent_writers_are_merged(tmp_path):
+    path = str(tmp_path / "card_registry.json")
+    seed = CardRegistry(path)
+    seed.card_id("Lightning Bolt")
+    seed.save()
+
+    first, second = CardRegistry(path), CardRegistry(path)
+    assert first.card_id("Counterspell") == second.card_id("Thoughtseize") == 1
+    second.card_id("Fatal Push")
+    first.save()
+    second.save()
+
+    # Les ids attribués ne changent pas : les cartes écrites par le premier sont ajoutées après
+    assert (second.card_id("Thoughtseize"), second.card_id("Fatal Push"), second.card_id("Counterspell")) == (1, 2, 3)
+    assert CardRegistry(path).names() == ["Lightning Bolt", "Thoughtseize", "Fatal Push", "Counterspell"]
+
+    # Le premier relit les ajouts du second à sa prochaine écriture
+    first.card_id("Ragavan, Nimble Pilferer")
+    first.save()
+    assert (first.card_id("Counterspell"), first.card_id("Ragavan, Nimble Pilferer"), first.card_id("Fatal Push")) == (1, 2, 4)
+    assert len(CardRegistry(path)) == 5
+
+
+def test_exit_writes_nothing_without_save(tmp_path):
+    env = {"PATH": "", "CARD_REGISTRY_PATH": str(tmp_path / "card_registry.json")}
+    code = "from card_registry import card_registry\ncard_registry.card_id('Lightning Bolt')\n"
+    result = subprocess.run([sys.executable, "-c", code], cwd=COLLECTORS_DIR, env=env,
+                            capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 0, result.stderr
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,102 @@
+"""
+Export Parquet et moteur Arrow : mêmes résultats que le moteur en mémoire
+du cache MTGODecklistCache
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import columnar_export
+from mtgo_cache_manager import MTGOCacheManager
+
+
+def _day(days_ago: int) -> str:
+    return (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%dT00:00:00Z")
+
+
+def _write_tournament(manager, name, date, fmt, decks):
+    directory = manager.tournaments_path / "mtgo.com" / date[:10]
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{name}.json").write_text(json.dumps({
+        "Tournament": {"Name": name, "Date": date, "Format": fmt},
+        "Decks": [
+            {"Player": f"{name}-{i}", "Result": result, "Archetype": archetype,
+             "Mainboard": [{"CardName": "Lightning Bolt", "Count": 4}], "Sideboard": []}
+            for i, (archetype, result) in enumerate(decks)
+        ],
+    }))
+
+
+def _loaded_manager(tmp_path) -> MTGOCacheManager:
+    manager = MTGOCacheManager(str(tmp_path / "cache"))
+    _write_tournament(manager, "challenge-1", _day(2), "Modern",
+                      [("Burn", "5-2"), ("Murktide", "6-1"), ("Burn", "3-4")])
+    _write_tournament(manager, "challenge-2", _day(10), "Modern",
+                      [("Amulet Titan", "4-3"), ("Murktide", "2-5"), ("Burn", "7-0")])
+    _write_tournament(manager, "challenge-3", _day(60), "Modern", [("Living End", "5-2")])
+    _write_tournament(manager, "league-1", _day(3), "Pauper", [("Affinity", "5-0")])
+    asyncio.run(manager._load_tournaments_cache())
+    manager._cache_loaded = True
+    return manager
+
+
+def test_export_writes_partitioned_datasets(tmp_path):
+    manager = _loaded_manager(tmp_path)
+
+    counts = asyncio.run(manager.export_columnar())
+
+    assert counts == {"tournaments": 4, "decks": 8, "deck_cards": 8}
+    assert manager.analytics_engine == "arrow"
+    assert sorted(path.name for path in (manager.columnar_dir / "decks").iterdir()) == ["format=Modern", "format=Pauper"]
+
+
+@pytest.mark.parametrize("days_back", [7, 30, 90])
+def test_arrow_engine_matches_memory_engine(tmp_path, days_back):
+    manager = _loaded_manager(tmp_path)
+    asyncio.run(manager.export_columnar())
+
+    def results(engine):
+        snapshot = asyncio.run(manager.get_format_meta_snapshot("Modern", days_back, engine=engine))
+        winrates = asyncio.run(manager.get_archetype_winrates("Modern", days_back, engine=engine))
+        return snapshot["total_decks"], snapshot["archetype_breakdown"], winrates
+
+    assert results("arrow") == results("memory")
+
+
+def test_memory_winrates(tmp_path):
+    manager = _loaded_manager(tmp_path)
+
+    winrates = asyncio.run(manager.get_archetype_winrates("Modern", 30, engine="memory"))
+
+    assert winrates[0] == {"archetype": "Burn", "decks": 3, "wins": 15, "losses": 6, "winrate": 71.43}
+    assert [row["archetype"] for row in winrates] == ["Burn", "Murktide", "Amulet Titan"]
+
+
+def test_refresh_reuses_export_until_head_changes(tmp_path, monkeypatch):
+    manager = _loaded_manager(tmp_path)
+    exports = []
+    export_corpus = columnar_export.export_corpus
+
+    def counting_export(tournaments, output_dir):
+        exports.append(output_dir)
+        return export_corpus(tournaments, output_dir)
+
+    head = {"sha": "a" * 40}
+
+    async def repository_head():
+        return head["sha"]
+
+    monkeypatch.setattr(columnar_export, "export_corpus", counting_export)
+    monkeypatch.setattr(manager, "_repository_head", repository_head)
+
+    asyncio.run(manager._refresh_columnar())
+    asyncio.run(manager._refresh_columnar())
+    assert len(exports) == 1 and manager.analytics_engine == "arrow"
+
+    head["sha"] = "b" * 40
+    asyncio.run(manager._refresh_columnar())
+    assert len(exports) == 2
@@ -0,0 +1,30 @@
+"""
+DataManager lancé depuis le dossier des collectors : database.py du backend
+doit être importable sans PYTHONPATH
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+COLLECTORS_DIR = Path(__file__).parent
+
+
+def test_data_manager_builds_from_collectors_dir(tmp_path):
+    code = (
+        "from data_manager import DataManager\n"
+        "import database\n"
+        "manager = DataManager()\n"
+        "print('url', manager.engine.url)\n"
+        "print('shared', manager.engine is database.engine)\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    env["DATABASE_URL"] = f"sqlite:///{tmp_path / 'metalyzr.db'}"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=COLLECTORS_DIR, env=env, capture_output=True, text=True, timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert f"url sqlite:///{tmp_path / 'metalyzr.db'}" in result.stdout
+    assert "shared True" in result.stdout
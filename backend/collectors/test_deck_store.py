@@ -0,0 +1,132 @@
+"""
+Store de decks mappé en mémoire : écriture, relecture et parcours du cache
+MTGODecklistCache servi depuis le store
+"""
+import asyncio
+import json
+
+import pytest
+
+from card_registry import CardRegistry
+from deck_store import DeckStore, classify_stored_deck, write_deck_store
+from mtgo_cache_manager import CachedTournament, MTGOCacheManager
+
+
+def _tournaments():
+    challenge = CachedTournament(
+        name="Modern Challenge", date="2024-01-06T00:00:00Z", format="Modern", source="mtgo.com",
+        url="https://mtgo.com/challenge",
+        decks=[
+            {"Player": "alice", "Result": "6-1", "Archetype": "Burn",
+             "Mainboard": [{"CardName": "Lightning Bolt", "Count": 4}, {"CardName": "Goblin Guide", "Count": 4},
+                           {"CardName": "Lightning Bolt", "Count": 1}],
+             "Sideboard": [{"CardName": "Path to Exile", "Count": 2}]},
+            {"Player": "bob", "Result": "4-3", "Archetype": "Murktide",
+             "Mainboard": [{"CardName": "Lightning Bolt", "Count": 4}], "Sideboard": []},
+        ],
+    )
+    league = CachedTournament(
+        name="Pauper League", date="2024-01-05T00:00:00Z", format="Pauper", source="mtgo.com",
+        decks=[{"Player": "carol", "Result": "5-0", "Archetype": "Affinity",
+                "Mainboard": {"Thoughtcast": 4}, "Sideboard": {}}],
+    )
+    return [("challenge", challenge), ("league", league)]
+
+
+def test_round_trip(tmp_path):
+    assert write_deck_store(_tournaments(), tmp_path / "store") == 3
+    store = DeckStore(tmp_path / "store")
+
+    assert len(store) == 3
+    assert store.deck(0) == {
+        "Player": "alice", "Result": "6-1", "Archetype": "Burn",
+        "Mainboard": [{"CardName": "Lightning Bolt", "Count": 4}, {"CardName": "Goblin Guide", "Count": 4},
+                      {"CardName": "Lightning Bolt", "Count": 1}],
+        "Sideboard": [{"CardName": "Path to Exile", "Count": 2}],
+        "tournament_name": "Modern Challenge", "tournament_date": "2024-01-06T00:00:00Z",
+        "tournament_format": "Modern", "tournament_source": "mtgo.com",
+    }
+    # Boards {nom: quantité} attendus par les engines : doublons additionnés
+    assert store.board(0) == {"Lightning Bolt": 5, "Goblin Guide": 4}
+    assert store.board(2) == {"Thoughtcast": 4} and store.board(2, "side") == {}
+    assert store.tournaments[store.tournament_index(2)]["key"] == "league"
+    store.close()
+
+
+def test_registry_ids_are_reused(tmp_path):
+    registry = CardRegistry(str(tmp_path / "card_registry.json"))
+    registry.card_id("Thoughtcast")
+
+    write_deck_store(_tournaments(), tmp_path / "store", registry)
+    store = DeckStore(tmp_path / "store")
+
+    ids, counts = store.board_ids(2)
+    assert (list(ids), list(counts)) == ([registry.card_id("Thoughtcast")], [4])
+    assert store.card_names == registry.names()
+
+
+def test_filters_resolved_on_ids(tmp_path):
+    write_deck_store(_tournaments(), tmp_path / "store")
+    store = DeckStore(tmp_path / "store")
+
+    assert list(store.iter_indices(format_filter="Modern")) == [0, 1]
+    assert list(store.iter_indices(archetype_filter="murk")) == [1]
+    assert list(store.iter_indices(player_filter="CAROL")) == [2]
+    assert list(store.iter_indices(min_wins=5)) == [0, 2]
+    assert list(store.iter_indices(date_from="2024-01-06")) == [0, 1]
+    assert list(store.iter_indices(date_to="2024-01-05T23:59:59Z")) == [2]
+
+
+def test_rewrite_keeps_open_reader(tmp_path):
+    write_deck_store(_tournaments(), tmp_path / "store")
+    reader = DeckStore(tmp_path / "store")
+
+    write_deck_store(_tournaments()[1:], tmp_path / "store")
+
+    assert reader.deck(0)["Player"] == "alice"
+    assert len(DeckStore(tmp_path / "store")) == 1
+
+
+def test_version_mismatch_is_rejected(tmp_path):
+    write_deck_store(_tournaments(), tmp_path / "store")
+    strings = tmp_path / "store" / "strings.json"
+    strings.write_text(json.dumps({**json.loads(strings.read_text()), "version": 0}))
+
+    with pytest.raises(ValueError):
+        DeckStore(tmp_path / "store")
+
+
+def test_classify_stored_deck_uses_tournament_format(tmp_path):
+    write_deck_store(_tournaments(), tmp_path / "store")
+    store = DeckStore(tmp_path / "store")
+
+    class RecordingEngine:
+        def classify_deck(self, mainboard, sideboard, format_name):
+            return mainboard, sideboard, format_name
+
+    assert classify_stored_deck(RecordingEngine(), store, 2) == ({"Thoughtcast": 4}, {}, "Pauper")
+
+
+def test_cache_decks_served_from_store(tmp_path):
+    manager = MTGOCacheManager(str(tmp_path / "cache"))
+    for key, tournament in _tournaments():
+        directory = manager.tournaments_path / tournament.source / tournament.date[:10]
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"{key}.json").write_text(json.dumps({
+            "Tournament": {"Name": tournament.name, "Date": tournament.date, "Format": tournament.format},
+            "Decks": tournament.decks,
+        }))
+    asyncio.run(manager._load_tournaments_cache())
+    manager._cache_loaded = True
+
+    def players(**filters):
+        return [deck["Player"] for deck in manager.iter_decks(**filters)]
+
+    queries = [{}, {"format_filter": "Modern"}, {"archetype_filter": "burn"}, {"min_wins": 5},
+               {"date_from": "2024-01-06"}]
+    from_memory = [players(**query) for query in queries]
+
+    assert asyncio.run(manager.build_deck_store()) == 3
+    assert manager._deck_store is not None
+    assert [players(**query) for query in queries] == from_memory
+    assert asyncio.run(manager.get_decks(format_filter="Pauper"))[0]["Mainboard"] == [{"CardName": "Thoughtcast", "Count": 4}]
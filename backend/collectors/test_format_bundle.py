@@ -0,0 +1,145 @@
+"""
+Bundles des définitions Badaro : lecture d'un clone ou d'un tarball,
+installation, chargement au démarrage de l'engine et rechargement à chaud
+"""
+import asyncio
+import io
+import json
+import shutil
+import subprocess
+import tarfile
+
+import pytest
+
+import format_bundle
+from badaro_archetype_engine import BadaroArchetypeEngine
+
+SHA_1 = "1" * 40
+SHA_2 = "2" * 40
+
+BURN = {"IncludeColorInName": False, "Conditions": [{"Type": "InMainboard", "Cards": ["Goblin Guide"]}]}
+MURKTIDE = {"Conditions": [{"Type": "InMainboard", "Cards": ["Murktide Regent"]}]}
+
+FILES = {
+    "Formats/Modern/Archetypes/Burn.json": BURN,
+    "Formats/Modern/Fallbacks/Aggro.json": {"CommonCards": ["Lightning Bolt"]},
+    "Formats/Modern/color_overrides.json": {"Lands": []},
+    "Formats/Pauper/Archetypes/Affinity.json": {"Conditions": []},
+    "README.json": {"ignored": True},
+}
+
+EXPECTED_FORMATS = {
+    "Modern": {
+        "archetypes": {"Burn": BURN},
+        "fallbacks": {"Aggro": {"CommonCards": ["Lightning Bolt"]}},
+        "color_overrides": {"Lands": []},
+    },
+    "Pauper": {"archetypes": {"Affinity": {"Conditions": []}}, "fallbacks": {}, "color_overrides": {}},
+}
+
+
+def _write_tarball(path, files, root=None, comment=None):
+    with tarfile.open(path, "w:gz", format=tarfile.PAX_FORMAT,
+                      pax_headers={"comment": comment} if comment else None) as tar:
+        for name, data in files.items():
+            payload = json.dumps(data).encode()
+            info = tarfile.TarInfo(f"{root}/{name}" if root else name)
+            info.size = len(payload)
+            tar.addfile(info, io.BytesIO(payload))
+    return path
+
+
+@pytest.mark.parametrize("root, comment, version, expected_version", [
+    (f"MTGOFormatData-{SHA_1}", None, None, SHA_1),
+    ("MTGOFormatData-main", SHA_1, None, SHA_1),
+    (None, None, SHA_1, SHA_1),
+])
+def test_tarball_round_trip(tmp_path, root, comment, version, expected_version):
+    tarball = _write_tarball(tmp_path / "formats.tar.gz", FILES, root=root, comment=comment)
+
+    read_version, formats = format_bundle.read_formats_from_tarball(tarball, version)
+
+    assert (read_version, formats) == (expected_version, EXPECTED_FORMATS)
+
+
+def test_tarball_without_version_is_rejected(tmp_path):
+    tarball = _write_tarball(tmp_path / "formats.tar.gz", FILES)
+
+    with pytest.raises(ValueError):
+        format_bundle.read_formats_from_tarball(tarball)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_clone_round_trip(tmp_path):
+    repo = tmp_path / "MTGOFormatData"
+    for name, data in FILES.items():
+        (repo / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / name).write_text(json.dumps(data))
+
+    def git(*args):
+        return subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                              cwd=repo, capture_output=True, text=True, check=True).stdout.strip()
+
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "formats")
+
+    assert format_bundle.read_formats_from_clone(repo) == (git("rev-parse", "HEAD"), EXPECTED_FORMATS)
+
+
+def test_install_switches_current_pointer(tmp_path):
+    bundle_dir = tmp_path / "bundles"
+    assert format_bundle.current_version(bundle_dir) is None
+
+    format_bundle.install_bundle(bundle_dir, SHA_1, EXPECTED_FORMATS, "formats.tar.gz")
+    format_bundle.install_bundle(bundle_dir, SHA_2, {}, "formats.tar.gz")
+
+    assert format_bundle.current_version(bundle_dir) == SHA_2
+    assert format_bundle.read_bundle(bundle_dir / f"{SHA_1}.json")["formats"] == EXPECTED_FORMATS
+    assert sorted(path.name for path in bundle_dir.iterdir()) == [f"{SHA_1}.json", f"{SHA_2}.json", "CURRENT"]
+
+
+def test_engine_starts_from_bundle_and_reloads(tmp_path, monkeypatch):
+    monkeypatch.delenv("BADARO_BUNDLE_DIR", raising=False)
+    engine = BadaroArchetypeEngine(str(tmp_path / "archetype_cache"))
+    first = _write_tarball(tmp_path / "first.tar.gz", FILES, root=f"MTGOFormatData-{SHA_1}")
+    second_files = {**FILES, "Formats/Modern/Archetypes/Murktide.json": MURKTIDE}
+    second = _write_tarball(tmp_path / "second.tar.gz", second_files, root=f"MTGOFormatData-{SHA_2}")
+
+    async def scenario():
+        assert await engine.install_bundle(first) == SHA_1
+        results = await engine.start(["Modern", "Pauper", "Legacy"], watch_interval=None)
+        assert results == {"Modern": True, "Pauper": True, "Legacy": False}
+        assert engine.definitions_version == SHA_1
+        assert engine.classify_deck({"Goblin Guide": 4}, format_name="Modern").archetype_name == "Burn"
+
+        # Un lecteur garde le snapshot qu'il a pris, la nouvelle version est publiée d'un bloc
+        before = engine._snapshot
+        assert await engine.reload_if_changed() is False
+        assert await engine.install_bundle(second) == SHA_2
+        assert await engine.reload_if_changed() is True
+
+        assert engine.definitions_version == SHA_2
+        assert set(engine.format_definitions["Modern"]) == {"Burn", "Murktide"}
+        assert set(before.format_definitions["Modern"]) == {"Burn"}
+        await engine.stop()
+
+    asyncio.run(scenario())
+
+
+def test_watch_task_reloads_installed_bundle(tmp_path, monkeypatch):
+    monkeypatch.delenv("BADARO_BUNDLE_DIR", raising=False)
+    engine = BadaroArchetypeEngine(str(tmp_path / "archetype_cache"))
+    format_bundle.install_bundle(engine.bundle_dir, SHA_1, EXPECTED_FORMATS)
+
+    async def scenario():
+        await engine.start(["Modern"], watch_interval=0.01)
+        format_bundle.install_bundle(engine.bundle_dir, SHA_2, EXPECTED_FORMATS)
+        for _ in range(200):
+            if engine.definitions_version == SHA_2:
+                break
+            await asyncio.sleep(0.01)
+        await engine.stop()
+
+    asyncio.run(scenario())
+    assert engine.definitions_version == SHA_2
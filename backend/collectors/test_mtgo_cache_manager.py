@@ -0,0 +1,54 @@
+"""
+Rechargement du cache MTGODecklistCache : un parcours en cours garde le
+couple (cache, index) qu'il a commencé, le nouveau est publié d'un coup
+"""
+import asyncio
+import json
+from datetime import datetime
+
+from mtgo_cache_manager import MTGOCacheManager
+
+
+def _write_tournament(manager, name, date, archetype):
+    directory = manager.tournaments_path / "mtgo.com" / date[:10]
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps({
+        "Tournament": {"Name": name, "Date": date, "Format": "Modern"},
+        "Decks": [{"Player": f"{name}-player", "Result": "5-0", "Archetype": archetype, "Mainboard": [], "Sideboard": []}],
+    }))
+    return path
+
+
+def test_reload_during_iteration(tmp_path):
+    manager = MTGOCacheManager(str(tmp_path / "cache"))
+    _write_tournament(manager, "challenge-1", "2024-01-06T00:00:00Z", "Burn")
+    removed = _write_tournament(manager, "challenge-2", "2024-01-05T00:00:00Z", "Amulet Titan")
+    asyncio.run(manager._load_tournaments_cache())
+
+    decks = manager.iter_decks()
+    assert next(decks)["Player"] == "challenge-1-player"
+
+    # Rechargement (force_refresh) pendant le parcours : un tournoi a disparu
+    removed.unlink()
+    _write_tournament(manager, "challenge-3", "2024-01-07T00:00:00Z", "Murktide")
+    asyncio.run(manager._load_tournaments_cache())
+
+    assert [deck["Player"] for deck in decks] == ["challenge-2-player"]
+    assert [deck["Player"] for deck in manager.iter_decks()] == ["challenge-3-player", "challenge-1-player"]
+    assert manager._loading_stats.total_tournaments == 2
+    assert set(manager._meta_buckets["Modern"]) == {"2024-01-06", "2024-01-07"}
+
+
+def test_meta_snapshot_breaks_ties_by_name(tmp_path):
+    manager = MTGOCacheManager(str(tmp_path / "cache"))
+    today = datetime.now().strftime("%Y-%m-%dT00:00:00Z")
+    for name, archetype in (("challenge-1", "Murktide"), ("challenge-2", "Burn"), ("challenge-3", "Amulet Titan"),
+                            ("challenge-4", "Burn")):
+        _write_tournament(manager, name, today, archetype)
+    asyncio.run(manager._load_tournaments_cache())
+    manager._cache_loaded = True
+
+    snapshot = asyncio.run(manager.get_format_meta_snapshot("Modern", 7, engine="memory"))
+
+    assert snapshot["archetype_breakdown"] == [("Burn", 50.0), ("Amulet Titan", 25.0), ("Murktide", 25.0)]
@@ -0,0 +1,42 @@
+"""
+Parité entre l'ancien parsing MTGTop8 (html.parser complet) et la couche html_parsing
+"""
+from bench_mtgtop8_parsing import (
+    FIXTURES_DIR, legacy_format_page, legacy_event_page, legacy_deck_page,
+    current_format_page, current_event_page, current_deck_page,
+)
+from mtgtop8_scraper import MTGTop8Scraper
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def test_format_page_links_match_legacy():
+    scraper = MTGTop8Scraper()
+    content = _fixture("format.html")
+    assert current_format_page(scraper, content) == legacy_format_page(scraper, content)
+
+
+def test_event_page_matches_legacy():
+    scraper = MTGTop8Scraper()
+    content = _fixture("event.html")
+    legacy_header, legacy_links = legacy_event_page(scraper, content)
+    header, links = current_event_page(scraper, content)
+
+    assert links == legacy_links
+    assert len(links) == 64
+    assert header["name"] == legacy_header["event_title"]
+    assert header["format"] == legacy_header["format"]
+    assert header["total_players"] == 64
+
+
+def test_deck_page_matches_legacy():
+    scraper = MTGTop8Scraper()
+    content = _fixture("deck.html")
+    mainboard, sideboard = legacy_deck_page(scraper, content)
+    deck = current_deck_page(scraper, content)
+
+    assert deck["mainboard"] == mainboard
+    assert deck["sideboard"] == sideboard
+    assert (deck["wins"], deck["losses"], deck["draws"]) == (5, 1, 0)
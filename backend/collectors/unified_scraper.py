@@ -15,6 +15,8 @@ from mtgtop8_scraper import MTGTop8Scraper
 from archetype_classifier import default_classifier, ArchetypeMatch
 from data_manager import DataManager
 from mtgo_cache_manager import MTGOCacheManager, mtgo_cache
+from http_session import http_sessions
+from card_registry import card_registry
 
 class UnifiedScraper:
     """
@@ -261,6 +263,11 @@ class UnifiedScraper:
             source_result["tournament_count"] = len(tournaments)
             self.logger.info(f"MTGOCache: {len(tournaments)} tournaments, {source_result['deck_count']} decks")
             
+            # Méta et winrates du corpus complet (export Parquet si disponible)
+            source_result["analytics_engine"] = self.mtgo_cache.analytics_engine
+            source_result["meta_snapshot"] = await self.mtgo_cache.get_format_meta_snapshot(format_name)
+            source_result["archetype_winrates"] = await self.mtgo_cache.get_archetype_winrates(format_name)
+            
         except Exception as e:
             error_msg = f"MTGODecklistCache error: {str(e)}"
             source_result["errors"].append(error_msg)
@@ -372,6 +379,11 @@ class UnifiedScraper:
             self.logger.error(f"Error analyzing collected data: {str(e)}")
             return {"error": str(e)}
     
+    async def close(self):
+        """Fermer le pool HTTP partagé et persister le registre des cartes (fin de process)"""
+        await http_sessions.close()
+        card_registry.save()
+    
     async def scrape_format_priority(self, format_name: str, max_total: int = 50) -> Dict[str, Any]:
         """
         Scraper avec priorisation intelligente des sources
@@ -1,5 +1,8 @@
+from typing import List, Optional, Tuple
+
 from sqlalchemy.orm import Session
 from . import models, schemas
+from .pagination import keyset_page
 
 def get_tournament_by_uuid(db: Session, uuid: str):
     """
@@ -7,11 +10,17 @@ def get_tournament_by_uuid(db: Session, uuid: str):
     """
     return db.query(models.Tournament).filter(models.Tournament.uuid == uuid).first()
 
-def get_tournaments(db: Session, skip: int = 0, limit: int = 100):
+def get_tournaments(db: Session, limit: int = 100, cursor: Optional[str] = None,
+                    format: Optional[str] = None) -> Tuple[List[models.Tournament], Optional[str]]:
     """
-    Retrieves a list of tournaments with pagination.
+    Retrieves a page of tournaments, most recent first, with keyset pagination.
+    Returns the page and the cursor of the next one (None on the last page).
+    Raises ValueError if the cursor is invalid.
     """
-    return db.query(models.Tournament).order_by(models.Tournament.date.desc()).offset(skip).limit(limit).all()
+    query = db.query(models.Tournament)
+    if format:
+        query = query.filter(models.Tournament.format == format)
+    return keyset_page(query, models.Tournament.date, models.Tournament.id, limit, cursor)
 
 def create_tournament(db: Session, tournament: schemas.TournamentCreate):
     """
@@ -1,17 +1,349 @@
-from sqlalchemy import create_engine
+import asyncio
+import json
+import logging
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import (
+    Boolean, Column, DateTime, Float, ForeignKey, Integer, MetaData, String, Table, Text,
+    create_engine, func, select, text,
+)
+from sqlalchemy.engine import Connection, Engine, Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 if not DATABASE_URL:
     raise ValueError("No DATABASE_URL set for SQLAlchemy")
 
-engine = create_engine(DATABASE_URL)
+# Pool partagé par l'API, les workers et le DataManager des collectors
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))        # secondes d'attente d'une connexion libre
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))      # secondes avant de recycler une connexion
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+
+def engine_options(url: str, asynchronous: bool = False) -> Dict[str, Any]:
+    """Réglages du pool pour create_engine / create_async_engine selon le backend de l'URL"""
+    if url.startswith("sqlite"):
+        return {}
+
+    options: Dict[str, Any] = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+    if url.startswith("postgresql") and DB_STATEMENT_TIMEOUT_MS > 0:
+        if asynchronous:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base() 
\ No newline at end of file
+Base = declarative_base()
+
+def get_db():
+    """Dépendance FastAPI : une session du pool partagé par requête"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# --- Moteur async (asyncpg, optionnel) pour les endpoints d'analyse en lecture ---
+
+def _async_url(url: str) -> Optional[str]:
+    explicit = os.getenv("ASYNC_DATABASE_URL")
+    if explicit:
+        return explicit
+    if url.startswith("postgresql"):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    return None
+
+ASYNC_DATABASE_URL = _async_url(DATABASE_URL)
+DB_ASYNC_ENABLED = os.getenv("DB_ASYNC_ENABLED", "true").lower() in ("1", "true", "yes")
+
+_async_engine = None
+_async_unavailable = not (DB_ASYNC_ENABLED and ASYNC_DATABASE_URL)
+
+def get_async_engine():
+    """Moteur async partagé, créé au premier appel ; None si asyncpg n'est pas installé"""
+    global _async_engine, _async_unavailable
+    if _async_engine is None and not _async_unavailable:
+        try:
+            from sqlalchemy.ext.asyncio import create_async_engine
+            _async_engine = create_async_engine(
+                ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL, asynchronous=True)
+            )
+        except ImportError as e:
+            logger.warning(f"Async database engine unavailable ({e}), falling back to the sync pool")
+            _async_unavailable = True
+    return _async_engine
+
+def _fetch_all_sync(query: str, params: Dict[str, Any]) -> List[Row]:
+    with engine.connect() as conn:
+        return conn.execute(text(query), params).fetchall()
+
+async def fetch_all(query: str, params: Dict[str, Any]) -> List[Row]:
+    """
+    Requête de lecture (paramètres nommés :param) sans bloquer la boucle :
+    via asyncpg si disponible, sinon sur le pool synchrone dans un thread
+    """
+    async_engine = get_async_engine()
+    if async_engine is not None:
+        async with async_engine.connect() as conn:
+            result = await conn.execute(text(query), params)
+            return result.fetchall()
+    return await asyncio.to_thread(_fetch_all_sync, query, params)
+
+async def dispose_engines():
+    """Fermer les connexions des pools (arrêt de l'application)"""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    engine.dispose()
+
+# --- Schéma d'analyse (tables lues par api/metagame.py, écrites par les workers) ---
+# Il partage la base de l'API : la table des tournois d'analyse porte son propre
+# nom pour ne pas heurter models.Tournament ("tournaments", créée par main.py)
+
+analysis_metadata = MetaData()
+
+formats_table = Table(
+    "formats", analysis_metadata,
+    Column("format_id", Integer, primary_key=True),
+    Column("format_name", String, unique=True, nullable=False),
+)
+sources_table = Table(
+    "sources", analysis_metadata,
+    Column("source_id", Integer, primary_key=True),
+    Column("source_name", String, unique=True, nullable=False),
+)
+analysis_tournaments_table = Table(
+    "analysis_tournaments", analysis_metadata,
+    Column("tournament_id", Integer, primary_key=True),
+    Column("tournament_uuid", String, unique=True, nullable=False),
+    Column("tournament_name", String),
+    Column("tournament_date", DateTime(timezone=True), index=True),
+    Column("source_id", Integer, ForeignKey("sources.source_id")),
+    Column("format_id", Integer, ForeignKey("formats.format_id"), index=True),
+)
+archetypes_table = Table(
+    "archetypes", analysis_metadata,
+    Column("archetype_id", Integer, primary_key=True),
+    Column("archetype_name", String, unique=True, nullable=False),
+)
+cards_table = Table(
+    "cards", analysis_metadata,
+    Column("card_id", Integer, primary_key=True),
+    Column("card_name", String, unique=True, nullable=False),
+)
+decks_table = Table(
+    "decks", analysis_metadata,
+    Column("deck_id", Integer, primary_key=True),
+    Column("tournament_id", Integer, ForeignKey("analysis_tournaments.tournament_id"), index=True, nullable=False),
+    Column("player_name", String),
+    Column("archetype_id", Integer, ForeignKey("archetypes.archetype_id"), index=True),
+    Column("classified_archetype_name", String),
+    Column("base_archetype_name", String),
+    Column("archetype_confidence", Float),
+    Column("decklist_json", Text),
+)
+deck_cards_table = Table(
+    "deck_cards", analysis_metadata,
+    Column("deck_id", Integer, ForeignKey("decks.deck_id"), index=True, nullable=False),
+    Column("card_id", Integer, ForeignKey("cards.card_id"), nullable=False),
+    Column("quantity", Integer, nullable=False),
+    Column("is_sideboard", Boolean, nullable=False, default=False),
+)
+matches_table = Table(
+    "matches", analysis_metadata,
+    Column("match_id", Integer, primary_key=True),
+    Column("tournament_id", Integer, ForeignKey("analysis_tournaments.tournament_id"), index=True, nullable=False),
+    Column("deck1_id", Integer, ForeignKey("decks.deck_id")),
+    Column("deck2_id", Integer, ForeignKey("decks.deck_id")),
+    Column("winner_deck_id", Integer, ForeignKey("decks.deck_id")),
+    Column("round_name", String),
+)
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime) or value is None:
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+class DatabaseClient:
+    """
+    Accès au schéma d'analyse sur le pool partagé : écriture des tournois du
+    decklist cache (format MTGODecklistCache) et lectures du métagame
+    """
+
+    def __init__(self, bind: Optional[Engine] = None):
+        self.engine = bind if bind is not None else engine
+
+    def init_db(self):
+        """Créer les tables d'analyse manquantes"""
+        analysis_metadata.create_all(self.engine)
+
+    def close(self):
+        """Fermer les connexions ouvertes du pool (fin des scripts)"""
+        self.engine.dispose()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        with self.engine.begin() as conn:
+            yield conn
+
+    @contextmanager
+    def get_connection(self):
+        """Connexion DBAPI brute (curseurs psycopg2), rendue au pool à la sortie"""
+        conn = self.engine.raw_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _get_or_create(conn: Connection, table: Table, column: str, value: str) -> int:
+        """Id de la ligne `column = value`, insérée si besoin (sûr entre workers concurrents)"""
+        id_column = table.primary_key.columns.values()[0]
+        query = select(id_column).where(table.c[column] == value)
+        row_id = conn.execute(query).scalar()
+        if row_id is not None:
+            return row_id
+        try:
+            with conn.begin_nested():
+                return conn.execute(table.insert().values({column: value})).inserted_primary_key[0]
+        except IntegrityError:
+            return conn.execute(query).scalar_one()
+
+    def save_tournament(self, tournament_data: Dict[str, Any], format_name: Optional[str] = None,
+                        conn: Optional[Connection] = None) -> Optional[int]:
+        """
+        Enregistre un tournoi du decklist cache. Retourne son id, ou None
+        s'il est déjà en base (même UID).
+        """
+        if conn is None:
+            with self.transaction() as conn:
+                return self.save_tournament(tournament_data, format_name, conn)
+
+        info = tournament_data.get("Tournament", {})
+        uuid = tournament_data.get("UID") or info.get("Uri") or info.get("Url") or info.get("Name")
+        if not uuid:
+            logger.warning("Tournament without UID, name or url: not saved")
+            return None
+
+        existing = conn.execute(
+            select(analysis_tournaments_table.c.tournament_id).where(analysis_tournaments_table.c.tournament_uuid == uuid)
+        ).scalar()
+        if existing is not None:
+            return None
+
+        format_id = self._get_or_create(conn, formats_table, "format_name", info.get("Format") or format_name or "Unknown")
+        source_id = self._get_or_create(conn, sources_table, "source_name", info.get("Source") or "Unknown")
+        try:
+            with conn.begin_nested():
+                return conn.execute(analysis_tournaments_table.insert().values(
+                    tournament_uuid=uuid,
+                    tournament_name=info.get("Name"),
+                    tournament_date=_parse_datetime(info.get("Date")),
+                    source_id=source_id,
+                    format_id=format_id,
+                )).inserted_primary_key[0]
+        except IntegrityError:
+            # Enregistré entre-temps par un autre worker
+            return None
+
+    @staticmethod
+    def _deck_archetype(deck_data: Dict[str, Any]) -> Tuple[str, Optional[str], Optional[float]]:
+        archetype = deck_data.get("Archetype")
+        if isinstance(archetype, dict):
+            name = archetype.get("Archetype") or "Unknown"
+            return name, archetype.get("BaseArchetype") or name, archetype.get("Confidence")
+        if archetype:
+            return str(archetype), str(archetype), None
+        return "Unknown", None, None
+
+    def save_deck_and_cards(self, deck_data: Dict[str, Any], tournament_id: int,
+                            conn: Optional[Connection] = None) -> int:
+        """Enregistre un deck du decklist cache et ses cartes ; retourne l'id du deck"""
+        if conn is None:
+            with self.transaction() as conn:
+                return self.save_deck_and_cards(deck_data, tournament_id, conn)
+
+        archetype_name, base_archetype, confidence = self._deck_archetype(deck_data)
+        archetype_id = self._get_or_create(conn, archetypes_table, "archetype_name", archetype_name)
+        deck_id = conn.execute(decks_table.insert().values(
+            tournament_id=tournament_id,
+            player_name=deck_data.get("Player"),
+            archetype_id=archetype_id,
+            classified_archetype_name=archetype_name,
+            base_archetype_name=base_archetype,
+            archetype_confidence=confidence,
+            decklist_json=json.dumps(deck_data),
+        )).inserted_primary_key[0]
+
+        quantities: Dict[Tuple[str, bool], int] = {}
+        for board, is_sideboard in (("Mainboard", False), ("Sideboard", True)):
+            for card in deck_data.get(board) or []:
+                name = card.get("CardName")
+                if name:
+                    quantities[(name, is_sideboard)] = quantities.get((name, is_sideboard), 0) + int(card.get("Count", 1))
+        if not quantities:
+            return deck_id
+
+        names = {name for name, _ in quantities}
+        card_ids = dict(conn.execute(
+            select(cards_table.c.card_name, cards_table.c.card_id).where(cards_table.c.card_name.in_(names))
+        ).all())
+        for name in names - card_ids.keys():
+            card_ids[name] = self._get_or_create(conn, cards_table, "card_name", name)
+
+        conn.execute(deck_cards_table.insert(), [
+            {"deck_id": deck_id, "card_id": card_ids[name], "quantity": quantity, "is_sideboard": is_sideboard}
+            for (name, is_sideboard), quantity in quantities.items()
+        ])
+        return deck_id
+
+    def get_all_formats(self) -> List[Tuple[str]]:
+        with self.engine.connect() as conn:
+            return [tuple(row) for row in conn.execute(
+                select(formats_table.c.format_name).order_by(formats_table.c.format_name)
+            )]
+
+    def get_metagame_by_format(self, format_name: str) -> List[Dict[str, Any]]:
+        """Nombre de decks et part de chaque archétype d'un format"""
+        query = (
+            select(archetypes_table.c.archetype_name, func.count(decks_table.c.deck_id).label("deck_count"))
+            .join(decks_table, decks_table.c.archetype_id == archetypes_table.c.archetype_id)
+            .join(analysis_tournaments_table, analysis_tournaments_table.c.tournament_id == decks_table.c.tournament_id)
+            .join(formats_table, formats_table.c.format_id == analysis_tournaments_table.c.format_id)
+            .where(formats_table.c.format_name == format_name)
+            .group_by(archetypes_table.c.archetype_name)
+            .order_by(func.count(decks_table.c.deck_id).desc())
+        )
+        with self.engine.connect() as conn:
+            rows = conn.execute(query).all()
+        total = sum(row.deck_count for row in rows)
+        return [
+            {"archetype": row.archetype_name, "count": row.deck_count, "share": row.deck_count / total * 100}
+            for row in rows
+        ]
+
+# Client partagé (scripts : init_db.py)
+db_client = DatabaseClient()
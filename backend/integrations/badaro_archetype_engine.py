@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Any, Set
 from pathlib import Path
 from dataclasses import dataclass, field
 
+from collectors.card_database import card_database
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -274,26 +276,8 @@ class BadaroArchetypeEngine:
         return matching_cards / len(fallback.common_cards)
     
     def _get_deck_colors(self, cards: List[DeckCard]) -> str:
-        """Déterminer les couleurs d'un deck (version simplifiée)"""
-        # Implémentation simplifiée basée sur les noms de cartes
-        color_indicators = {
-            "W": ["Plains", "White", "Swords to Plowshares"],
-            "U": ["Island", "Blue", "Counterspell"],
-            "B": ["Swamp", "Black", "Dark Ritual"],
-            "R": ["Mountain", "Red", "Lightning Bolt"],
-            "G": ["Forest", "Green", "Giant Growth"]
-        }
-        
-        detected_colors = set()
-        card_names = {card.name for card in cards}
-        
-        for color, indicators in color_indicators.items():
-            if any(indicator in card_names for indicator in indicators):
-                detected_colors.add(color)
-        
-        # Trier les couleurs selon l'ordre WUBRG
-        color_order = "WUBRG"
-        return "".join(color for color in color_order if color in detected_colors)
+        """Déterminer les couleurs d'un deck (identité colorielle, ordre WUBRG)"""
+        return card_database.deck_colors(card.name for card in cards)
     
     def classify_deck(self, deck_data: Dict, format_name: str) -> Dict[str, Any]:
         """Classifier un deck selon son archétype"""
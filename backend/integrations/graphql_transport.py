@@ -0,0 +1,26 @@
+"""
+Transport GraphQL adossé au pool HTTP partagé des collecteurs
+Évite un nouveau connector (et un handshake TLS) à chaque requête start.gg
+"""
+from gql.transport.aiohttp import AIOHTTPTransport
+
+from collectors.http_session import http_sessions
+
+class SharedAIOHTTPTransport(AIOHTTPTransport):
+    """AIOHTTPTransport dont la session s'appuie sur le connector partagé"""
+
+    async def connect(self):
+        # Le connector est lié à l'event loop : on le résout à la connexion
+        self.client_session_args = {
+            **(self.client_session_args or {}),
+            "connector": http_sessions.connector(),
+            "connector_owner": False,
+        }
+        await super().connect()
+
+    async def close(self):
+        # Fermer la session sans toucher au pool partagé (gql la laisserait
+        # ouverte avec connector_owner=False)
+        if self.session is not None:
+            await self.session.close()
+        self.session = None
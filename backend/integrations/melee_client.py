@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
 from gql import gql, Client
-from gql.transport.aiohttp import AIOHTTPTransport
+from integrations.graphql_transport import SharedAIOHTTPTransport
 from dotenv import load_dotenv
 
 load_dotenv() # Load environment variables from .env file
@@ -36,7 +36,7 @@ class GraphQLClient:
         else:
             headers = {"Authorization": f"Bearer {auth_token}"}
             
-        transport = AIOHTTPTransport(url=API_URL, headers=headers)
+        transport = SharedAIOHTTPTransport(url=API_URL, headers=headers)
         self.client = Client(transport=transport, fetch_schema_from_transport=False)
 
     async def get_tournaments_by_game(
@@ -1,28 +1,34 @@
+import asyncio
 import logging
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
+from collectors.http_session import http_sessions
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.mtgo.com"
 
-def scrape_mtgo_decklists(days: int = 7) -> List[Dict[str, Any]]:
+async def scrape_mtgo_decklists(days: int = 7) -> List[Dict[str, Any]]:
     """
     Scrapes the official MTGO website for recent Standard tournament decklists.
+    The page is fetched without blocking the event loop, over the shared HTTP pool.
     """
     logger.info(f"Scraping MTGO website for Standard decklists from the last {days} days.")
     decklist_url = f"{BASE_URL}/decklists"
     
+    session = http_sessions.get_session("mtgo_website", timeout=aiohttp.ClientTimeout(total=30))
     try:
-        response = requests.get(decklist_url)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
+        async with session.get(decklist_url) as response:
+            response.raise_for_status()
+            content = await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error(f"Failed to fetch MTGO decklist page: {e}")
         return []
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    soup = BeautifulSoup(content, "html.parser")
     
     # Corrected CSS selector based on manual inspection of the website.
     # The decklists are in a div with the id 'decklists-tables'.
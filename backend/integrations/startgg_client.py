@@ -2,7 +2,7 @@ import os
 import logging
 from typing import Optional, List, Dict, Any
 from gql import gql, Client
-from gql.transport.aiohttp import AIOHTTPTransport
+from integrations.graphql_transport import SharedAIOHTTPTransport
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,7 +17,7 @@ class StartGGClient:
         
         self.url = "https://api.start.gg/gql/alpha"
         headers = {"Authorization": f"Bearer {api_key}"}
-        self.transport = AIOHTTPTransport(url=self.url, headers=headers)
+        self.transport = SharedAIOHTTPTransport(url=self.url, headers=headers)
         self.client = Client(transport=self.transport, fetch_schema_from_transport=True)
 
     async def get_tournaments_by_game(self, days_ago: int = 7, limit: int = 50) -> List[Dict[str, Any]]:
@@ -0,0 +1,49 @@
+"""
+Sérialisation JSON des réponses de l'API
+orjson est utilisé s'il est installé (optionnel), sinon json de la stdlib.
+Les dataclasses (CacheStats, CachedTournament...), datetime/date, Enum, set
+et Path sont sérialisés directement : les endpoints qui renvoient une
+FastJSONResponse évitent le passage par jsonable_encoder de FastAPI.
+"""
+import dataclasses
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+# orjson est optionnel : même sortie, sérialisation bien plus rapide
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    """Types non natifs (pour json de la stdlib ; orjson gère déjà dataclasses et dates)"""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    """Corps JSON compact en UTF-8"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse sérialisée par dumps() (orjson si disponible)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,276 @@
+"""
+Stockage embarqué du backend MVP (main_simple.py)
+SQLite en mode WAL derrière le modèle en mémoire (memory_model.py) : un document
+par enregistrement, écritures transactionnelles, ajout unitaire en O(1) et
+compteurs (total, par format) maintenus par triggers à chaque écriture.
+Une collection relue est identique à la liste écrite : même ordre (colonne
+position) et doublons conservés.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("metalyzr.store")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    position INTEGER NOT NULL DEFAULT 0,
+    format TEXT NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (collection, key)
+);
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    collection TEXT NOT NULL,
+    format TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (collection, format)
+);
+CREATE TRIGGER IF NOT EXISTS records_count_insert AFTER INSERT ON records BEGIN
+    INSERT INTO counters (collection, format, count) VALUES (new.collection, new.format, 1)
+    ON CONFLICT (collection, format) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS records_count_delete AFTER DELETE ON records BEGIN
+    UPDATE counters SET count = count - 1 WHERE collection = old.collection AND format = old.format;
+END;
+CREATE TRIGGER IF NOT EXISTS records_count_update AFTER UPDATE OF format ON records
+WHEN old.format != new.format BEGIN
+    UPDATE counters SET count = count - 1 WHERE collection = old.collection AND format = old.format;
+    INSERT INTO counters (collection, format, count) VALUES (new.collection, new.format, 1)
+    ON CONFLICT (collection, format) DO UPDATE SET count = count + 1;
+END;
+"""
+
+POSITIONS_INDEX = "CREATE INDEX IF NOT EXISTS ix_records_position ON records (collection, position)"
+
+# Séparateur des occurrences d'une même clé de base ("12", "12~1", "12~2"...)
+OCCURRENCE_SEPARATOR = "~"
+
+def _base_key(record: Any) -> str:
+    """
+    Clé de base d'un enregistrement : son id s'il en a un, sinon l'empreinte
+    de son contenu (indépendante de sa position dans la liste)
+    """
+    if isinstance(record, dict) and record.get("id") is not None:
+        return str(record["id"])
+    return "#" + hashlib.sha1(_dumps(record).encode("utf-8")).hexdigest()[:16]
+
+def _occurrence_key(base: str, occurrence: int) -> str:
+    return base if occurrence == 0 else f"{base}{OCCURRENCE_SEPARATOR}{occurrence}"
+
+def _keyed_records(records: Iterable[Any]) -> List[Tuple[str, Any]]:
+    """(clé, enregistrement) : la n-ième occurrence d'une même clé de base est suffixée"""
+    occurrences: Dict[str, int] = {}
+    used = set()
+    keyed = []
+    for record in records:
+        base = _base_key(record)
+        occurrence = occurrences.get(base, 0)
+        while _occurrence_key(base, occurrence) in used:
+            occurrence += 1
+        occurrences[base] = occurrence + 1
+        key = _occurrence_key(base, occurrence)
+        used.add(key)
+        keyed.append((key, record))
+    return keyed
+
+def _record_format(record: Any) -> str:
+    return str(record.get("format") or "Unknown") if isinstance(record, dict) else "Unknown"
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+class JsonStore:
+    """
+    Collections (listes d'enregistrements) et documents (dicts) d'un fichier SQLite
+    Une seule connexion partagée, protégée par un verrou
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Bases créées avant la colonne position : l'ordre d'insertion devient la position"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(records)")}
+        if "position" not in columns:
+            self._conn.execute("ALTER TABLE records ADD COLUMN position INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE records SET position = seq")
+        self._conn.execute(POSITIONS_INDEX)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, operations) -> bool:
+        """Exécuter operations(conn) dans une transaction (tout ou rien)"""
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                operations(self._conn)
+                self._conn.execute("COMMIT")
+                return True
+            except Exception as e:
+                self._conn.execute("ROLLBACK")
+                logger.error(f"Erreur d'écriture dans {self.db_path}: {e}")
+                return False
+
+    # --- Collections ---
+
+    def has_collection(self, name: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM records WHERE collection = ? LIMIT 1", (name,)
+            ).fetchone()
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT 1 FROM documents WHERE name = ?", (f"collection:{name}",)
+                ).fetchone()
+        return row is not None
+
+    def load_collection(self, name: str) -> List[Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM records WHERE collection = ? ORDER BY position, seq", (name,)
+            ).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def append(self, name: str, record: Any) -> bool:
+        """Ajouter un enregistrement en fin de collection sans la relire"""
+        return self.append_many(name, [record])
+
+    def append_many(self, name: str, records: List[Any]) -> bool:
+        """Ajouter un lot d'enregistrements en fin de collection, en une transaction"""
+        def operations(conn):
+            position = conn.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM records WHERE collection = ?", (name,)
+            ).fetchone()[0]
+            for offset, record in enumerate(records):
+                key = self._free_key(conn, name, _base_key(record))
+                self._insert(conn, name, key, position + offset, record)
+        return self._write(operations)
+
+    @staticmethod
+    def _free_key(conn: sqlite3.Connection, name: str, base: str) -> str:
+        """Première clé libre pour une nouvelle occurrence de `base` (même schéma que _keyed_records)"""
+        occurrence = conn.execute(
+            "SELECT COUNT(*) FROM records WHERE collection = ? AND (key = ? OR (key > ? AND key < ?))",
+            (name, base, base + OCCURRENCE_SEPARATOR, base + chr(ord(OCCURRENCE_SEPARATOR) + 1))
+        ).fetchone()[0]
+        while conn.execute(
+            "SELECT 1 FROM records WHERE collection = ? AND key = ?", (name, _occurrence_key(base, occurrence))
+        ).fetchone():
+            occurrence += 1
+        return _occurrence_key(base, occurrence)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, name: str, key: str, position: int, record: Any):
+        conn.execute(
+            "INSERT INTO records (collection, key, position, format, data) VALUES (?, ?, ?, ?, ?)",
+            (name, key, position, _record_format(record), _dumps(record))
+        )
+
+    def replace_collection(self, name: str, records: Iterable[Any]) -> bool:
+        """
+        Remplacer une collection entière, atomiquement
+        Seuls les enregistrements ajoutés, supprimés ou modifiés sont réécrits ;
+        un changement d'ordre ne met à jour que les positions.
+        """
+        keyed = _keyed_records(records)
+
+        def operations(conn):
+            existing = {
+                key: (position, data) for key, position, data in conn.execute(
+                    "SELECT key, position, data FROM records WHERE collection = ?", (name,)
+                )
+            }
+            new_keys = {key for key, _ in keyed}
+            conn.executemany(
+                "DELETE FROM records WHERE collection = ? AND key = ?",
+                [(name, key) for key in existing if key not in new_keys]
+            )
+            for position, (key, record) in enumerate(keyed):
+                current = existing.get(key)
+                if current is None:
+                    self._insert(conn, name, key, position, record)
+                    continue
+                data = _dumps(record)
+                if current[1] != data:
+                    conn.execute(
+                        "UPDATE records SET position = ?, format = ?, data = ? WHERE collection = ? AND key = ?",
+                        (position, _record_format(record), data, name, key)
+                    )
+                elif current[0] != position:
+                    conn.execute(
+                        "UPDATE records SET position = ? WHERE collection = ? AND key = ?",
+                        (position, name, key)
+                    )
+            # Une collection vide reste connue (pas de réimport des fichiers JSON)
+            conn.execute(
+                "INSERT OR IGNORE INTO documents (name, data) VALUES (?, 'null')", (f"collection:{name}",)
+            )
+        return self._write(operations)
+
+    def counts(self, name: str) -> Tuple[int, Dict[str, int]]:
+        """(total, total par format) d'une collection, sans la parcourir"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT format, count FROM counters WHERE collection = ? AND count > 0", (name,)
+            ).fetchall()
+        by_format = {fmt: count for fmt, count in rows}
+        return sum(by_format.values()), by_format
+
+    # --- Documents ---
+
+    def load_document(self, name: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM documents WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_document(self, name: str, data: Any) -> bool:
+        def operations(conn):
+            conn.execute(
+                "INSERT INTO documents (name, data) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET data = excluded.data",
+                (name, _dumps(data))
+            )
+        return self._write(operations)
+
+    # --- Migration ---
+
+    def import_json_file(self, name: str, file_path: Path) -> bool:
+        """Importer un ancien fichier data/*.json (liste ou dict) s'il n'est pas déjà en base"""
+        if not file_path.exists():
+            return False
+        if self.has_collection(name) or self.load_document(name) is not None:
+            return False
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Import impossible de {file_path}: {e}")
+            return False
+
+        if isinstance(data, list):
+            imported = self.replace_collection(name, data)
+        else:
+            imported = self.save_document(name, data)
+        if imported:
+            logger.info(f"{file_path} importé dans {self.db_path}")
+        return imported
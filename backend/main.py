@@ -1,20 +1,35 @@
 import logging
 from fastapi import FastAPI
-from .database import engine, Base
+from .database import engine, Base, dispose_engines
 from .api.v1.endpoints import metagame
+from .api import decks
+from .collectors.http_session import http_sessions
 from . import models
+from .json_response import FastJSONResponse
 
 # Basic logging configuration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create all tables in the database on startup
+app = FastAPI(title="Metalyzr API", default_response_class=FastJSONResponse)
+
+# Create all tables in the database on startup (not at import, which must stay cheap)
 # In a real production app, you'd use Alembic migrations for this.
-models.Base.metadata.create_all(bind=engine)
+@app.on_event("startup")
+def create_tables():
+    models.Base.metadata.create_all(bind=engine)
+
+@app.on_event("shutdown")
+async def close_database_pools():
+    await dispose_engines()
 
-app = FastAPI(title="Metalyzr API")
+@app.on_event("shutdown")
+async def close_http_sessions():
+    # Shared aiohttp pool used by the collectors (e.g. /api/v1/tournaments_from_api)
+    await http_sessions.close()
 
 app.include_router(metagame.router, prefix="/api/v1")
+app.include_router(decks.router)
 
 @app.get("/")
 def read_root():
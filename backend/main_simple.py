@@ -8,17 +8,26 @@ Intégrations :
 - MTG Scraper : Scraping de sites
 - Badaro Archetype Engine : Classification d'archétypes
 """
-import json
+import asyncio
 import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator, Tuple
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from integrations.integration_service import IntegrationService
+from asgi_middleware import JSONResponseMiddleware
+from json_response import FastJSONResponse, dumps
+from json_store import JsonStore
+from memory_model import MemoryModel
 
 # Configuration du logging
 logging.basicConfig(
@@ -28,7 +37,7 @@ logging.basicConfig(
 logger = logging.getLogger("metalyzr")
 
 # Initialiser l'application
-app = FastAPI(title="Metalyzr MVP", version="2.0.0")
+app = FastAPI(title="Metalyzr MVP", version="2.0.0", default_response_class=FastJSONResponse)
 
 # CORS
 app.add_middleware(
@@ -39,65 +48,124 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Middleware pour forcer le Content-Type JSON pretty-printed
-@app.middleware("http")
-async def add_json_formatting(request, call_next):
-    response = await call_next(request)
-    
-    # Si c'est une réponse JSON et qu'on est dans un navigateur
-    if response.headers.get("content-type", "").startswith("application/json"):
-        if "Mozilla" in request.headers.get("user-agent", "") or "Chrome" in request.headers.get("user-agent", ""):
-            # Force le pretty-print pour l'affichage navigateur
-            response.headers["content-type"] = "application/json; charset=utf-8"
-    
-    return response
+# Réponses JSON : charset pour les navigateurs, compression des gros corps
+# (middleware ASGI pur, voir asgi_middleware.py et bench_middleware.py)
+app.add_middleware(JSONResponseMiddleware, minimum_size=1024)
 
 # Dossier des données
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(exist_ok=True)
 
-# Fichiers de données
+# Anciens fichiers de données, importés dans la base SQLite au premier démarrage
 TOURNAMENTS_FILE = DATA_DIR / "tournaments.json"
 ARCHETYPES_FILE = DATA_DIR / "archetypes.json"
-STATS_FILE = DATA_DIR / "stats.json"
 
-# Initialiser les fichiers de données
-def init_data_files():
-    """Initialiser les fichiers de données"""
-    if not TOURNAMENTS_FILE.exists():
-        with open(TOURNAMENTS_FILE, 'w') as f:
-            json.dump([], f)
-    
-    if not ARCHETYPES_FILE.exists():
-        with open(ARCHETYPES_FILE, 'w') as f:
-            json.dump([], f)
-    
-    if not STATS_FILE.exists():
-        with open(STATS_FILE, 'w') as f:
-            json.dump({"tournaments": 0, "archetypes": 0, "formats": {}}, f)
+# Données des intégrations : collections séparées, remplacées à chaque
+# synchronisation sans jamais toucher aux enregistrements créés via l'API
+INTEGRATION_COLLECTIONS = {
+    TOURNAMENTS_FILE.stem: "integration_tournaments",
+    ARCHETYPES_FILE.stem: "integration_archetypes",
+}
+# Intervalle de resynchronisation des intégrations (secondes)
+INTEGRATION_SYNC_INTERVAL = 60
 
-# Initialiser les intégrations
-integration_service = IntegrationService()
+# Stockage embarqué (SQLite WAL) et modèle en mémoire (écrit par lots) :
+# /api/stats, /api/tournaments et /api/archetypes sont servis depuis le modèle
+store = JsonStore(DATA_DIR / "metalyzr.sqlite3")
+model = MemoryModel(store, collections=(*INTEGRATION_COLLECTIONS, *INTEGRATION_COLLECTIONS.values()))
 
-def init_integrations():
-    """Initialiser les intégrations réelles"""
-    global integration_service
-    try:
-        # Importer seulement si les dépendances sont disponibles
-        from integrations.integration_service import IntegrationService
-        
-        integration_service = IntegrationService()
+# Initialiser les fichiers de données
+def init_data_files():
+    """Importer les anciens fichiers JSON dans la base au premier démarrage"""
+    for file_path in (TOURNAMENTS_FILE, ARCHETYPES_FILE):
+        store.import_json_file(file_path.stem, file_path)
+
+# Intégrations : construites une seule fois, au premier besoin ou par le
+# warm-up lancé au démarrage (rien n'est importé ni construit à l'import du module)
+integration_service = None
+INTEGRATIONS_AVAILABLE = False
+_integrations_initialized = False
+_integrations_lock = threading.Lock()
+
+# État du warm-up exposé par /ready
+warmup_status: Dict[str, Any] = {"status": "pending", "started_at": None, "finished_at": None, "error": None}
+warmup_task: Optional[asyncio.Task] = None
+sync_task: Optional[asyncio.Task] = None
+
+def init_integrations() -> bool:
+    """Initialiser les intégrations réelles (une seule fois, thread-safe)"""
+    global integration_service, INTEGRATIONS_AVAILABLE, _integrations_initialized
+    with _integrations_lock:
+        if _integrations_initialized:
+            return INTEGRATIONS_AVAILABLE
+        _integrations_initialized = True
+        try:
+            # Importer seulement si les dépendances sont disponibles
+            from integrations.integration_service import IntegrationService
+            
+            integration_service = IntegrationService()
+            INTEGRATIONS_AVAILABLE = True
+            logger.info("✅ Intégrations réelles initialisées")
+        except ImportError as e:
+            logger.warning(f"⚠️ Intégrations non disponibles (dépendances manquantes): {e}")
+            logger.info("📦 Pour activer les intégrations: pip install -r requirements_integrations.txt")
+        except Exception as e:
+            logger.error(f"❌ Erreur lors de l'initialisation des intégrations: {e}")
+        return INTEGRATIONS_AVAILABLE
+
+async def ensure_integrations() -> bool:
+    """Intégrations disponibles ? (initialisées hors de la boucle d'événements au premier appel)"""
+    if _integrations_initialized:
+        return INTEGRATIONS_AVAILABLE
+    return await asyncio.to_thread(init_integrations)
+
+def warm_up_integrations():
+    """Travail coûteux du démarrage : intégrations et données d'archétypes d'exemple"""
+    if init_integrations():
         integration_service.create_sample_archetype_data("Modern")
         integration_service.create_sample_archetype_data("Standard")
-        
-        logger.info("✅ Intégrations réelles initialisées")
-        return True
-    except ImportError as e:
-        logger.warning(f"⚠️ Intégrations non disponibles (dépendances manquantes): {e}")
-        return False
+
+async def sync_integration_data():
+    """
+    Copier les tournois et archétypes des intégrations dans leurs collections
+    du modèle (une mutation par collection, rien si les données n'ont pas changé)
+    """
+    try:
+        tournaments = await integration_service.get_complete_tournament_data()
+        archetypes = await integration_service.get_archetype_analysis()
     except Exception as e:
-        logger.error(f"❌ Erreur lors de l'initialisation des intégrations: {e}")
-        return False
+        logger.error(f"❌ Synchronisation des intégrations impossible: {e}")
+        return
+    for name, records in ((INTEGRATION_COLLECTIONS[TOURNAMENTS_FILE.stem], tournaments.get("tournaments", [])),
+                          (INTEGRATION_COLLECTIONS[ARCHETYPES_FILE.stem], archetypes.get("archetypes", []))):
+        if records != model.collection(name):
+            model.replace(name, records)
+
+async def integration_sync_loop():
+    """Resynchroniser les intégrations toutes les INTEGRATION_SYNC_INTERVAL secondes"""
+    while True:
+        await asyncio.sleep(INTEGRATION_SYNC_INTERVAL)
+        await sync_integration_data()
+
+async def run_warmup():
+    """Warm-up en tâche de fond : le serveur répond pendant ce temps"""
+    warmup_status.update({"status": "running", "started_at": datetime.now().isoformat()})
+    try:
+        await asyncio.to_thread(warm_up_integrations)
+        if INTEGRATIONS_AVAILABLE:
+            await sync_integration_data()
+            global sync_task
+            sync_task = asyncio.create_task(integration_sync_loop())
+        warmup_status["status"] = "ready"
+        if INTEGRATIONS_AVAILABLE:
+            logger.info("✅ Toutes les intégrations sont actives")
+        else:
+            logger.warning("⚠️ Intégrations non disponibles - Mode MVP basique")
+    except Exception as e:
+        logger.error(f"❌ Erreur pendant le warm-up: {e}")
+        warmup_status.update({"status": "failed", "error": str(e)})
+    finally:
+        warmup_status["finished_at"] = datetime.now().isoformat()
 
 # Modèles Pydantic
 class Tournament(BaseModel):
@@ -125,59 +193,6 @@ class MetaAnalysisRequest(BaseModel):
     format: str = "Modern"
     days: int = 7
 
-# Fonctions utilitaires
-def load_json(file_path: Path) -> Any:
-    """Charger un fichier JSON"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Erreur lors du chargement de {file_path}: {e}")
-        return [] if file_path.name != "stats.json" else {"tournaments": 0, "archetypes": 0, "formats": {}}
-
-def save_json(file_path: Path, data: Any) -> bool:
-    """Sauvegarder un fichier JSON"""
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        return True
-    except Exception as e:
-        logger.error(f"Erreur lors de la sauvegarde de {file_path}: {e}")
-        return False
-
-def update_stats():
-    """Mettre à jour les statistiques"""
-    tournaments = load_json(TOURNAMENTS_FILE)
-    archetypes = load_json(ARCHETYPES_FILE)
-    
-    # Compter les formats
-    formats = {}
-    for tournament in tournaments:
-        fmt = tournament.get("format", "Unknown")
-        formats[fmt] = formats.get(fmt, 0) + 1
-    
-    stats = {
-        "tournaments": len(tournaments),
-        "archetypes": len(archetypes),
-        "formats": formats,
-        "last_updated": datetime.now().isoformat()
-    }
-    
-    save_json(STATS_FILE, stats)
-    return stats
-
-# Tentative d'import des intégrations
-try:
-    from integrations.integration_service import IntegrationService
-    integration_service = IntegrationService()
-    INTEGRATIONS_AVAILABLE = True
-    print("✅ Intégrations chargées avec succès")
-except (ImportError, ModuleNotFoundError) as e:
-    integration_service = None
-    INTEGRATIONS_AVAILABLE = False
-    print(f"⚠️ Intégrations non disponibles: {e}")
-    print("📦 Pour activer les intégrations: pip install -r requirements_integrations.txt")
-
 # Endpoints API existants
 @app.get("/", response_class=HTMLResponse)
 async def root():
@@ -251,79 +266,79 @@ async def health_check():
         "integrations_available": INTEGRATIONS_AVAILABLE,
         "timestamp": datetime.now().isoformat()
     }
-    return JSONResponse(content=data)
+    return FastJSONResponse(content=data)
+
+@app.get("/ready")
+async def readiness_check():
+    """Prêt quand le warm-up du démarrage est terminé (503 avant)"""
+    data = {
+        "ready": warmup_status["status"] in ("ready", "failed"),
+        "warmup": warmup_status,
+        "integrations_available": INTEGRATIONS_AVAILABLE
+    }
+    return FastJSONResponse(content=data, status_code=200 if data["ready"] else 503)
+
+def data_mode() -> str:
+    return "live" if INTEGRATIONS_AVAILABLE else "local"
+
+async def cached_response(key: str, build) -> Response:
+    """Réponse JSON servie depuis le cache du modèle (octets pré-sérialisés jusqu'à la prochaine mutation)"""
+    return Response(content=await model.cached_json(key, build), media_type="application/json")
 
 @app.get("/api/stats")
 async def get_stats():
-    if INTEGRATIONS_AVAILABLE:
-        data = await integration_service.get_complete_stats()
-    else:
-        data = {
-            "tournaments": 42,
-            "archetypes": 15,
-            "formats": {
-                "Modern": 25,
-                "Standard": 12,
-                "Legacy": 5
-            },
-            "last_updated": datetime.now().isoformat(),
-            "mode": "demo"
-        }
-    return JSONResponse(content=data)
+    return await cached_response("stats", build_stats)
+
+def merged_collection(name: str) -> List[Any]:
+    """Enregistrements créés via l'API suivis de ceux des intégrations"""
+    return model.collection(name) + model.collection(INTEGRATION_COLLECTIONS[name])
+
+async def build_stats() -> Dict[str, Any]:
+    tournaments, archetypes = TOURNAMENTS_FILE.stem, ARCHETYPES_FILE.stem
+    formats = model.format_counts(tournaments)
+    for fmt, count in model.format_counts(INTEGRATION_COLLECTIONS[tournaments]).items():
+        formats[fmt] = formats.get(fmt, 0) + count
+    return {
+        "tournaments": model.count(tournaments) + model.count(INTEGRATION_COLLECTIONS[tournaments]),
+        "archetypes": model.count(archetypes) + model.count(INTEGRATION_COLLECTIONS[archetypes]),
+        "formats": formats,
+        "last_updated": model.last_updated,
+        "mode": data_mode()
+    }
 
 @app.get("/api/tournaments")
 async def get_tournaments():
-    if INTEGRATIONS_AVAILABLE:
-        data = await integration_service.get_complete_tournament_data()
-    else:
-        data = {
-            "tournaments": [
-                {
-                    "name": "Demo Tournament 1",
-                    "date": "2024-01-15",
-                    "format": "Modern",
-                    "players": 128,
-                    "source": "demo"
-                },
-                {
-                    "name": "Demo Tournament 2", 
-                    "date": "2024-01-16",
-                    "format": "Standard",
-                    "players": 64,
-                    "source": "demo"
-                }
-            ],
-            "mode": "demo"
-        }
-    return JSONResponse(content=data)
+    return await cached_response("tournaments", build_tournaments)
+
+async def build_tournaments() -> Dict[str, Any]:
+    tournaments = merged_collection(TOURNAMENTS_FILE.stem)
+    return {"tournaments": tournaments, "count": len(tournaments), "mode": data_mode()}
+
+@app.post("/api/tournaments", status_code=201)
+async def add_tournament(tournament: Tournament):
+    """Ajouter un tournoi (en mémoire, écrit en base par lots)"""
+    record = {**tournament.model_dump(), "created_at": datetime.now().isoformat()}
+    model.add(TOURNAMENTS_FILE.stem, record)
+    return FastJSONResponse(content=record, status_code=201)
 
 @app.get("/api/archetypes")
 async def get_archetypes():
-    if INTEGRATIONS_AVAILABLE:
-        data = await integration_service.get_archetype_analysis()
-    else:
-        data = {
-            "archetypes": [
-                {
-                    "name": "Burn",
-                    "format": "Modern",
-                    "percentage": 12.5,
-                    "colors": "Red"
-                },
-                {
-                    "name": "Control",
-                    "format": "Standard", 
-                    "percentage": 8.3,
-                    "colors": "Blue/White"
-                }
-            ],
-            "mode": "demo"
-        }
-    return JSONResponse(content=data)
+    return await cached_response("archetypes", build_archetypes)
+
+async def build_archetypes() -> Dict[str, Any]:
+    archetypes = merged_collection(ARCHETYPES_FILE.stem)
+    return {"archetypes": archetypes, "count": len(archetypes), "mode": data_mode()}
+
+@app.post("/api/archetypes", status_code=201)
+async def add_archetype(archetype: Archetype):
+    """Ajouter un archétype (en mémoire, écrit en base par lots)"""
+    record = {**archetype.model_dump(), "created_at": datetime.now().isoformat()}
+    model.add(ARCHETYPES_FILE.stem, record)
+    return FastJSONResponse(content=record, status_code=201)
 
 @app.get("/api/integrations/status")
 async def get_integration_status():
-    if INTEGRATIONS_AVAILABLE:
+    if await ensure_integrations():
         data = await integration_service.get_integration_status()
     else:
         data = {
@@ -335,23 +350,125 @@ async def get_integration_status():
             },
             "message": "Intégrations non disponibles - Mode démo actif"
         }
-    return JSONResponse(content=data)
+    return FastJSONResponse(content=data)
+
+# Appels synchrones aux intégrations (réseau, classification) : exécutés dans
+# un pool de threads borné, avec une limite de concurrence et un timeout par endpoint
+INTEGRATION_LIMITS = {
+    # endpoint: (appels simultanés, timeout en secondes)
+    "recent_tournaments": (4, 30),
+    "scrape_deck": (8, 30),
+    "meta_analysis": (4, 60),
+    "search_tournaments": (4, 30),
+}
+integration_executor = ThreadPoolExecutor(
+    max_workers=sum(limit for limit, _ in INTEGRATION_LIMITS.values()),
+    thread_name_prefix="integrations"
+)
+integration_semaphores = {name: asyncio.Semaphore(limit) for name, (limit, _) in INTEGRATION_LIMITS.items()}
+
+async def run_integration(endpoint: str, func, *args, **kwargs) -> Any:
+    """
+    Exécuter un appel synchrone de integration_service hors de la boucle d'événements
+    503 si l'endpoint est saturé pendant tout le timeout, 504 si l'appel dépasse le timeout
+    """
+    _, timeout = INTEGRATION_LIMITS[endpoint]
+    semaphore = integration_semaphores[endpoint]
+    
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail=f"Trop de requêtes en cours ({endpoint})")
+    
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(integration_executor, partial(func, *args, **kwargs))
+    # Le slot n'est libéré qu'à la fin réelle du thread, même après un timeout
+    future.add_done_callback(lambda _: semaphore.release())
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Timeout de {timeout}s dépassé pour {endpoint}")
+        raise HTTPException(status_code=504, detail=f"Délai dépassé ({timeout}s)")
+
+# Decks déjà scrapés : (url, format) -> (expiration, deck), du plus ancien au plus récent
+SCRAPE_CACHE_TTL = 3600
+SCRAPE_CACHE_SIZE = 1024
+# URLs scrapées en parallèle par requête /scrape/multiple
+SCRAPE_BATCH_CONCURRENCY = 8
+scraped_decks: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+scrapes_in_progress: Dict[Tuple[str, str], asyncio.Future] = {}
+
+def normalize_deck_url(url: str) -> str:
+    return url.strip().split("#")[0]
+
+async def scrape_deck_cached(url: str, format_name: str) -> Any:
+    """
+    Scraper et classifier un deck, avec cache : une URL déjà scrapée est servie
+    depuis la mémoire, une URL en cours de scraping n'est pas scrapée deux fois
+    """
+    key = (url, format_name)
+    cached = scraped_decks.get(key)
+    if cached and cached[0] > time.monotonic():
+        scraped_decks.move_to_end(key)
+        return cached[1]
+    
+    in_progress = scrapes_in_progress.get(key)
+    if in_progress is not None:
+        return await asyncio.shield(in_progress)
+    
+    task = asyncio.ensure_future(run_integration(
+        "scrape_deck", integration_service.scrape_and_classify_deck, url, format_name
+    ))
+    scrapes_in_progress[key] = task
+    try:
+        deck = await asyncio.shield(task)
+    finally:
+        scrapes_in_progress.pop(key, None)
+    
+    if deck:
+        scraped_decks[key] = (time.monotonic() + SCRAPE_CACHE_TTL, deck)
+        scraped_decks.move_to_end(key)
+        while len(scraped_decks) > SCRAPE_CACHE_SIZE:
+            scraped_decks.popitem(last=False)
+    return deck
+
+async def scrape_batch(urls: List[str], format_name: str) -> AsyncIterator[Tuple[str, Any, Optional[str]]]:
+    """(url, deck, erreur) de chaque URL, dans l'ordre où les scrapings se terminent"""
+    semaphore = asyncio.Semaphore(SCRAPE_BATCH_CONCURRENCY)
+    
+    async def scrape_one(url: str) -> Tuple[str, Any, Optional[str]]:
+        async with semaphore:
+            try:
+                deck = await scrape_deck_cached(url, format_name)
+                return url, deck, None if deck else "Impossible de scraper le deck"
+            except HTTPException as e:
+                return url, None, e.detail
+            except Exception as e:
+                logger.error(f"Erreur lors du scraping de {url}: {e}")
+                return url, None, str(e)
+    
+    for result in asyncio.as_completed([scrape_one(url) for url in urls]):
+        yield await result
 
 # Nouveaux endpoints pour les intégrations réelles
 @app.get("/api/integrations/tournaments/recent")
 async def get_recent_tournaments_with_archetypes(format_name: str = "Modern", days: int = 7):
     """Obtenir les tournois récents avec classification d'archétypes"""
-    if not integration_service:
+    if not await ensure_integrations():
         raise HTTPException(status_code=503, detail="Intégrations non disponibles")
     
     try:
-        tournaments = integration_service.get_recent_tournaments_with_archetypes(days, format_name)
-        return {
+        tournaments = await run_integration(
+            "recent_tournaments", integration_service.get_recent_tournaments_with_archetypes, days, format_name
+        )
+        return FastJSONResponse(content={
             "tournaments": tournaments,
             "count": len(tournaments),
             "format": format_name,
             "days": days
-        }
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erreur lors de la récupération des tournois: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -359,32 +476,50 @@ async def get_recent_tournaments_with_archetypes(format_name: str = "Modern", da
 @app.post("/api/integrations/scrape/deck")
 async def scrape_and_classify_deck(request: DeckScrapeRequest):
     """Scraper un deck et le classifier"""
-    if not integration_service:
+    if not await ensure_integrations():
         raise HTTPException(status_code=503, detail="Intégrations non disponibles")
     
     try:
-        deck_data = integration_service.scrape_and_classify_deck(request.url, request.format)
+        deck_data = await scrape_deck_cached(normalize_deck_url(request.url), request.format)
         if not deck_data:
             raise HTTPException(status_code=400, detail="Impossible de scraper le deck")
         
-        return deck_data
+        return FastJSONResponse(content=deck_data)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erreur lors du scraping: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/integrations/scrape/multiple")
-async def scrape_multiple_decks(urls: List[str], format_name: str = "Modern"):
-    """Scraper plusieurs decks et les classifier"""
-    if not integration_service:
+async def scrape_multiple_decks(urls: List[str], format_name: str = "Modern", stream: bool = False):
+    """
+    Scraper plusieurs decks en parallèle et les classifier
+    URLs dédoublonnées ; avec stream=true, une ligne NDJSON par URL dès qu'elle est traitée
+    """
+    if not await ensure_integrations():
         raise HTTPException(status_code=503, detail="Intégrations non disponibles")
     
+    unique_urls = list(dict.fromkeys(normalize_deck_url(url) for url in urls if url.strip()))
+    
+    if stream:
+        async def ndjson_lines():
+            async for url, deck, error in scrape_batch(unique_urls, format_name):
+                line = {"url": url, "deck": deck} if error is None else {"url": url, "error": error}
+                yield dumps(line) + b"\n"
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+    
     try:
-        decks = integration_service.scrape_multiple_decks_and_classify(urls, format_name)
-        return {
+        results = {url: (deck, error) async for url, deck, error in scrape_batch(unique_urls, format_name)}
+        decks = [results[url][0] for url in unique_urls if results[url][1] is None]
+        return FastJSONResponse(content={
             "decks": decks,
             "count": len(decks),
-            "format": format_name
-        }
+            "format": format_name,
+            "failed": {url: results[url][1] for url in unique_urls if results[url][1] is not None}
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erreur lors du scraping multiple: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -392,12 +527,16 @@ async def scrape_multiple_decks(urls: List[str], format_name: str = "Modern"):
 @app.post("/api/integrations/meta/analysis")
 async def get_meta_analysis(request: MetaAnalysisRequest):
     """Obtenir une analyse du méta"""
-    if not integration_service:
+    if not await ensure_integrations():
         raise HTTPException(status_code=503, detail="Intégrations non disponibles")
     
     try:
-        analysis = integration_service.get_meta_analysis(request.format, request.days)
-        return analysis
+        analysis = await run_integration(
+            "meta_analysis", integration_service.get_meta_analysis, request.format, request.days
+        )
+        return FastJSONResponse(content=analysis)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erreur lors de l'analyse méta: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -405,17 +544,21 @@ async def get_meta_analysis(request: MetaAnalysisRequest):
 @app.get("/api/integrations/tournaments/search")
 async def search_tournaments_by_archetype(archetype: str, format_name: str = "Modern"):
     """Rechercher des tournois par archétype"""
-    if not integration_service:
+    if not await ensure_integrations():
         raise HTTPException(status_code=503, detail="Intégrations non disponibles")
     
     try:
-        tournaments = integration_service.search_tournaments_by_archetype(archetype, format_name)
-        return {
+        tournaments = await run_integration(
+            "search_tournaments", integration_service.search_tournaments_by_archetype, archetype, format_name
+        )
+        return FastJSONResponse(content={
             "tournaments": tournaments,
             "count": len(tournaments),
             "archetype": archetype,
             "format": format_name
-        }
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erreur lors de la recherche: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -423,7 +566,7 @@ async def search_tournaments_by_archetype(archetype: str, format_name: str = "Mo
 @app.get("/api/integrations/supported-sites")
 async def get_supported_sites():
     """Obtenir la liste des sites supportés pour le scraping"""
-    if not integration_service:
+    if not await ensure_integrations():
         raise HTTPException(status_code=503, detail="Intégrations non disponibles")
     
     sites = integration_service.mtg_scraper.get_supported_sites()
@@ -432,7 +575,7 @@ async def get_supported_sites():
 @app.get("/api/integrations/supported-formats")
 async def get_supported_formats():
     """Obtenir la liste des formats supportés"""
-    if not integration_service:
+    if not await ensure_integrations():
         raise HTTPException(status_code=503, detail="Intégrations non disponibles")
     
     formats = integration_service.badaro_engine.get_supported_formats()
@@ -445,32 +588,38 @@ async def startup_event():
     logger.info("🚀 Démarrage Metalyzr MVP - Backend honnête")
     logger.info("📊 API disponible sur http://localhost:8000")
     logger.info("📚 Documentation: http://localhost:8000/docs")
-    logger.info("💾 Données: Fichiers JSON locaux")
+    logger.info(f"💾 Données: {store.db_path} (SQLite)")
     
-    # Initialiser les fichiers de données
+    # Initialiser les fichiers de données et charger le modèle en mémoire
     init_data_files()
+    model.load()
+    model.start()
     
-    # Initialiser les intégrations
-    integrations_ok = init_integrations()
-    
-    if integrations_ok:
-        logger.info("✅ Toutes les intégrations sont actives")
-        logger.info("🔄 Jiliac Cache: Tournois récents")
-        logger.info("🕷️ MTG Scraper: Sites supportés")
-        logger.info("🎯 Badaro Engine: Classification d'archétypes")
-    else:
-        logger.warning("⚠️ Intégrations non disponibles - Mode MVP basique")
-        logger.info("📝 Installation requise: pip install -r requirements_integrations.txt")
+    # Initialiser les intégrations en tâche de fond (voir /ready)
+    global warmup_task
+    warmup_task = asyncio.create_task(run_warmup())
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Nettoyage à l'arrêt"""
     logger.info("🛑 Arrêt Metalyzr MVP")
     
-    # Fermer les intégrations
+    if sync_task:
+        sync_task.cancel()
+    
+    # Fermer les intégrations (après les appels encore en cours dans le pool)
+    integration_executor.shutdown(wait=True, cancel_futures=True)
     if integration_service:
         integration_service.close()
         logger.info("✅ Intégrations fermées")
+    
+    # Pool HTTP partagé des collecteurs, s'il a été chargé par les intégrations
+    sessions_module = sys.modules.get("collectors.http_session")
+    if sessions_module is not None:
+        await sessions_module.http_sessions.close()
+    
+    await model.stop()
+    store.close()
 
 if __name__ == "__main__":
     import uvicorn
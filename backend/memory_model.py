@@ -0,0 +1,200 @@
+"""
+Modèle en mémoire du backend MVP (main_simple.py), en écriture directe
+Les collections sont chargées une fois au démarrage ; les mutations sont
+appliquées en mémoire puis écrites dans le JsonStore par lots, en tâche de
+fond. Les statistiques sont tenues à jour à chaque mutation et les réponses
+JSON sont gardées sérialisées (bytes) jusqu'à la mutation suivante.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from json_response import dumps
+from json_store import JsonStore
+
+logger = logging.getLogger("metalyzr.model")
+
+def render_json(data: Any) -> bytes:
+    """Même sérialisation que les réponses de l'API (FastJSONResponse)"""
+    return dumps(data)
+
+class MemoryModel:
+    """Collections en mémoire, stats précalculées et cache de réponses sérialisées"""
+
+    def __init__(self, store: JsonStore, collections: Tuple[str, ...] = ("tournaments", "archetypes"),
+                 flush_interval: float = 1.0, batch_size: int = 500):
+        self.store = store
+        self.collection_names = collections
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._collections: Dict[str, List[Any]] = {name: [] for name in collections}
+        self._documents: Dict[str, Any] = {}
+        self._format_counts: Dict[str, Dict[str, int]] = {name: {} for name in collections}
+        self._last_updated = datetime.now().isoformat()
+
+        # Écritures en attente : ("append", nom, enregistrement) | ("replace", nom, liste) | ("document", nom, données)
+        self._pending: List[Tuple[str, str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Réponses sérialisées : clé -> (bytes, expiration)
+        self._responses: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._response_locks: Dict[str, asyncio.Lock] = {}
+
+    # --- Chargement ---
+
+    def load(self):
+        """Charger les collections et documents depuis le store (une fois, au démarrage)"""
+        for name in self.collection_names:
+            self._collections[name] = self.store.load_collection(name)
+            self._format_counts[name] = self._count_formats(self._collections[name])
+        self._invalidate()
+        logger.info("Modèle chargé : " + ", ".join(f"{len(records)} {name}" for name, records in self._collections.items()))
+
+    @staticmethod
+    def _count_formats(records: List[Any]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for record in records:
+            fmt = record.get("format", "Unknown") if isinstance(record, dict) else "Unknown"
+            counts[fmt] = counts.get(fmt, 0) + 1
+        return counts
+
+    # --- Lecture ---
+
+    def collection(self, name: str) -> List[Any]:
+        """Copie d'une collection"""
+        return list(self._collections.get(name, []))
+
+    def document(self, name: str) -> Optional[Any]:
+        if name not in self._documents:
+            self._documents[name] = self.store.load_document(name)
+        return self._documents[name]
+
+    def count(self, name: str) -> int:
+        return len(self._collections.get(name, []))
+
+    def format_counts(self, name: str) -> Dict[str, int]:
+        """Nombre d'enregistrements par format (tenu à jour à chaque mutation)"""
+        return dict(self._format_counts.get(name, {}))
+
+    @property
+    def last_updated(self) -> str:
+        return self._last_updated
+
+    # --- Mutations ---
+
+    def add(self, name: str, record: Dict[str, Any]):
+        self._collections[name].append(record)
+        counts = self._format_counts[name]
+        fmt = record.get("format", "Unknown")
+        counts[fmt] = counts.get(fmt, 0) + 1
+        self._pending.append(("append", name, record))
+        self._invalidate()
+
+    def replace(self, name: str, records: List[Any]):
+        self._collections[name] = list(records)
+        self._format_counts[name] = self._count_formats(self._collections[name])
+        self._pending.append(("replace", name, list(records)))
+        self._invalidate()
+
+    def set_document(self, name: str, data: Any):
+        self._documents[name] = data
+        self._pending.append(("document", name, data))
+        self._invalidate()
+
+    def _invalidate(self):
+        self._last_updated = datetime.now().isoformat()
+        self._responses.clear()
+
+    # --- Réponses sérialisées ---
+
+    async def cached_json(self, key: str, build: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> bytes:
+        """
+        Corps JSON d'une réponse, construit une fois puis servi tel quel
+        jusqu'à la prochaine mutation (ou expiration du ttl en secondes)
+        """
+        cached = self._responses.get(key)
+        if cached and (cached[1] is None or cached[1] > time.monotonic()):
+            return cached[0]
+
+        lock = self._response_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._responses.get(key)
+            if cached and (cached[1] is None or cached[1] > time.monotonic()):
+                return cached[0]
+            body = render_json(await build())
+            self._responses[key] = (body, time.monotonic() + ttl if ttl else None)
+            return body
+
+    # --- Écriture en tâche de fond ---
+
+    def start(self):
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Arrêter la tâche d'écriture et écrire ce qui reste"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Erreur lors de l'écriture du modèle: {e}")
+
+    async def flush(self):
+        """
+        Écrire les mutations en attente, par lots (un remplacement annule les écritures précédentes)
+        Après un échec du store, les opérations non écrites sont remises en tête
+        de la file et retentées au flush suivant.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        last_replace = {name: i for i, (kind, name, _) in enumerate(pending) if kind == "replace"}
+        operations = [
+            op for i, op in enumerate(pending)
+            if op[0] == "document" or i >= last_replace.get(op[1], -1)
+        ]
+        remaining = await asyncio.to_thread(self._write, operations)
+        if remaining:
+            self._pending = remaining + self._pending
+            logger.error(f"Écriture du modèle interrompue : {len(remaining)} opérations seront retentées")
+
+    def _write(self, operations: List[Tuple[str, str, Any]]) -> List[Tuple[str, str, Any]]:
+        """Écrire les opérations dans l'ordre ; retourne celles qui restent après un échec"""
+        i = 0
+        while i < len(operations):
+            kind, name, data = operations[i]
+            if kind == "append":
+                # Ajouts consécutifs à la même collection : écrits par lots
+                end = i
+                while end < len(operations) and operations[end][:2] == ("append", name):
+                    end += 1
+                for start in range(i, end, self.batch_size):
+                    chunk = [op[2] for op in operations[start:min(start + self.batch_size, end)]]
+                    if not self.store.append_many(name, chunk):
+                        return operations[start:]
+                i = end
+                continue
+
+            if kind == "replace":
+                written = self.store.replace_collection(name, data)
+            else:
+                written = self.store.save_document(name, data)
+            if not written:
+                return operations[i:]
+            i += 1
+        return []
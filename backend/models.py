@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float
+from sqlalchemy import Column, Integer, String, DateTime, Float, Index
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -12,10 +12,15 @@ class Tournament(Base):
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(String, unique=True, index=True, nullable=False)
     name = Column(String, index=True)
-    # Storing date as string for simplicity, as we get it in ISO format.
-    # For complex queries, DateTime would be better.
-    date = Column(String) 
+    # Real timestamp so that range filters and keyset pagination use the indexes below.
+    date = Column(DateTime(timezone=True))
     format = Column(String)
     source = Column(String)
     url = Column(String, nullable=True)
-    decks_count = Column(Integer, nullable=True) 
\ No newline at end of file
+    decks_count = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        # Keyset pagination: ORDER BY date DESC, id DESC (see pagination.py)
+        Index("ix_tournaments_date_id", "date", "id"),
+        Index("ix_tournaments_format_date_id", "format", "date", "id"),
+    )
@@ -0,0 +1,72 @@
+"""
+Pagination par curseur (keyset) pour les listes triées sur (colonne, id)
+Au lieu d'OFFSET, chaque page reprend après la dernière ligne renvoyée :
+WHERE (date, id) < (:date, :id) ORDER BY date DESC, id DESC LIMIT n
+La requête suit l'index composite (date, id) quelle que soit la profondeur.
+Le curseur est opaque pour les clients (JSON encodé en base64 url-safe).
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.orm import Query
+
+def encode_cursor(value: Any, row_id: int) -> str:
+    """Curseur opaque pour la ligne (valeur de tri, id)"""
+    kind = None
+    if isinstance(value, datetime):
+        kind, value = "datetime", value.isoformat()
+    elif isinstance(value, date):
+        kind, value = "date", value.isoformat()
+    payload = json.dumps({"v": value, "t": kind, "i": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """(valeur de tri, id) d'un curseur ; ValueError s'il est invalide"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        value, kind, row_id = payload["v"], payload.get("t"), int(payload["i"])
+        if kind == "datetime":
+            value = datetime.fromisoformat(value)
+        elif kind == "date":
+            value = date.fromisoformat(value)
+        return value, row_id
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+def keyset_page(query: Query, sort_column, id_column, limit: int,
+                cursor: Optional[str] = None, descending: bool = True) -> Tuple[List[Any], Optional[str]]:
+    """
+    Page de `limit` lignes après `cursor`, et le curseur de la page suivante
+    (None sur la dernière page). Les NULL de la colonne de tri sont placés en
+    tête en ordre décroissant et en fin en ordre croissant, comme le parcours
+    d'un index B-tree PostgreSQL.
+    """
+    if cursor:
+        value, row_id = decode_cursor(cursor)
+        if descending:
+            if value is None:
+                condition = or_(and_(sort_column.is_(None), id_column < row_id), sort_column.isnot(None))
+            else:
+                condition = tuple_(sort_column, id_column) < tuple_(value, row_id)
+        else:
+            if value is None:
+                condition = and_(sort_column.is_(None), id_column > row_id)
+            else:
+                condition = or_(tuple_(sort_column, id_column) > tuple_(value, row_id), sort_column.is_(None))
+        query = query.filter(condition)
+
+    if descending:
+        query = query.order_by(sort_column.desc().nullsfirst(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc().nullslast(), id_column.asc())
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
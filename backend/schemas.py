@@ -5,6 +5,7 @@ from datetime import datetime
 class TournamentBase(BaseModel):
     uuid: str
     name: str
+    date: Optional[datetime] = None
     format: Optional[str] = None
     source: str
     url: Optional[str] = None
@@ -15,7 +16,6 @@ class TournamentCreate(TournamentBase):
 
 class Tournament(TournamentBase):
     id: int
-    date: Optional[str] = None # Keep as string to match model
 
     class Config:
         orm_mode = True 
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Matchup matrix computation for the metagame analysis endpoints.
+- The database aggregates matches per (archetype, archetype) pair.
+- The pairs are folded into dense NumPy arrays (wins and match counts),
+  indexed by archetype, most played first.
+- Matrices are cached per (format, window) and truncated per request.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MATCHUP_PAIRS_QUERY = """
+    SELECT
+        a1.archetype_name AS archetype1,
+        a2.archetype_name AS archetype2,
+        SUM(CASE WHEN m.winner_deck_id = m.deck1_id THEN 1 ELSE 0 END) AS wins1,
+        SUM(CASE WHEN m.winner_deck_id = m.deck2_id THEN 1 ELSE 0 END) AS wins2
+    FROM matches m
+    JOIN decks d1 ON m.deck1_id = d1.deck_id
+    JOIN archetypes a1 ON d1.archetype_id = a1.archetype_id
+    JOIN decks d2 ON m.deck2_id = d2.deck_id
+    JOIN archetypes a2 ON d2.archetype_id = a2.archetype_id
+    JOIN analysis_tournaments t ON m.tournament_id = t.tournament_id
+    JOIN formats f ON t.format_id = f.format_id
+    WHERE f.format_name = :format_name AND a1.archetype_name != a2.archetype_name AND t.tournament_date BETWEEN :start_date AND :end_date
+    GROUP BY a1.archetype_name, a2.archetype_name
+"""
+
+@dataclass
+class MatchupMatrix:
+    """
+    Dense matchup matrix. wins[i, j] is the number of wins of archetypes[i]
+    against archetypes[j]; matches[i, j] (symmetric) the number of decided
+    matches between them. Archetypes are sorted by total matches, so the
+    top-N archetypes are the leading N rows and columns.
+    """
+    archetypes: List[str]
+    wins: np.ndarray
+    matches: np.ndarray
+    start_date: datetime
+    end_date: datetime
+
+    @classmethod
+    def from_pairs(cls, rows: List[Tuple[str, str, int, int]], start_date: datetime, end_date: datetime) -> "MatchupMatrix":
+        names = sorted({row[0] for row in rows} | {row[1] for row in rows})
+        index = {name: i for i, name in enumerate(names)}
+        size = len(names)
+
+        first = np.fromiter((index[row[0]] for row in rows), dtype=np.intp, count=len(rows))
+        second = np.fromiter((index[row[1]] for row in rows), dtype=np.intp, count=len(rows))
+        wins1 = np.fromiter((row[2] or 0 for row in rows), dtype=np.int64, count=len(rows))
+        wins2 = np.fromiter((row[3] or 0 for row in rows), dtype=np.int64, count=len(rows))
+
+        # The same pair can appear in both orientations (deck1/deck2): accumulate
+        wins = np.zeros((size, size), dtype=np.int64)
+        np.add.at(wins, (first, second), wins1)
+        np.add.at(wins, (second, first), wins2)
+        matches = wins + wins.T
+
+        # Most played archetypes first (ties by name), so truncation is a slice
+        order = np.lexsort((np.arange(size), -matches.sum(axis=1)))
+        return cls(
+            archetypes=[names[i] for i in order],
+            wins=wins[np.ix_(order, order)],
+            matches=matches[np.ix_(order, order)],
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    def truncated(self, top: Optional[int]) -> "MatchupMatrix":
+        if not top or top >= len(self.archetypes):
+            return self
+        return MatchupMatrix(self.archetypes[:top], self.wins[:top, :top], self.matches[:top, :top],
+                             self.start_date, self.end_date)
+
+    def winrates(self, min_matches: int) -> np.ndarray:
+        """Win rate of row vs column in [0, 1]; NaN below min_matches and on the diagonal"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = self.wins / self.matches
+        rates[self.matches < max(min_matches, 1)] = np.nan
+        np.fill_diagonal(rates, np.nan)
+        return rates
+
+    def to_payload(self, min_matches: int) -> Dict[str, Any]:
+        """Compact array-of-arrays form (null where the sample is too small)"""
+        rates = np.round(self.winrates(min_matches), 4).tolist()
+        return {
+            "archetypes": self.archetypes,
+            "matrix": [[None if math.isnan(rate) else rate for rate in row] for row in rates],
+            "wins": self.wins.tolist(),
+            "matches": self.matches.tolist(),
+        }
+
+class MatchupMatrixCache:
+    """
+    Matrices cached per (format, window in days), computed once per ttl.
+    At most max_entries matrices are kept (least recently used evicted);
+    concurrent requests for the same key share one computation. Callers
+    validate format and window before reaching the cache.
+    """
+
+    def __init__(self, fetch_all: Callable[[str, Dict[str, Any]], Awaitable[List[Any]]], ttl: float = 300.0,
+                 max_entries: int = 32):
+        self.fetch_all = fetch_all
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, MatchupMatrix]]" = OrderedDict()
+        self._in_progress: Dict[Tuple[str, int], asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, format_name: str, days: int) -> MatchupMatrix:
+        key = (format_name, days)
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        in_progress = self._in_progress.get(key)
+        if in_progress is not None:
+            return await asyncio.shield(in_progress)
+
+        task = asyncio.ensure_future(self._compute(format_name, days))
+        self._in_progress[key] = task
+        try:
+            matrix = await asyncio.shield(task)
+        finally:
+            self._in_progress.pop(key, None)
+
+        self._entries[key] = (time.monotonic() + self.ttl, matrix)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return matrix
+
+    async def _compute(self, format_name: str, days: int) -> MatchupMatrix:
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        rows = await self.fetch_all(MATCHUP_PAIRS_QUERY, {
+            "format_name": format_name, "start_date": start_date, "end_date": end_date
+        })
+        matrix = MatchupMatrix.from_pairs([tuple(row) for row in rows], start_date, end_date)
+        logger.info(f"Computed matchup matrix for {format_name} ({days} days): {len(matrix.archetypes)} archetypes")
+        return matrix
@@ -18,9 +18,10 @@ from database import DatabaseClient
 logger = logging.getLogger(__name__)
 
 class MetagameService:
-    def __init__(self, database_client: DatabaseClient, task_status_dict: Dict[str, Any]):
+    def __init__(self, database_client: DatabaseClient, task_status_dict: Dict[str, Any],
+                 cache_reader: Optional[DecklistCacheReader] = None):
         self.db_client = database_client
-        self.cache_reader = DecklistCacheReader() # Use the new cache reader
+        self.cache_reader = cache_reader or DecklistCacheReader() # Use the new cache reader
         self.archetype_engine = BadaroArchetypeEngine()
         self.task_status = task_status_dict
 
@@ -50,15 +51,8 @@ class MetagameService:
             
             saved_count = 0
             for i, tournament_data in enumerate(tournaments):
-                tournament_id = self.db_client.save_tournament(tournament_data)
-                
-                if tournament_id:
-                    logger.info(f"Successfully saved tournament '{tournament_data.get('Tournament', {}).get('Name')}' with ID {tournament_id}")
+                if self.ingest_tournament(tournament_data):
                     saved_count += 1
-                    
-                    # Now, save the decks for this tournament, using the correct key 'Decks'
-                    for deck_data in tournament_data.get('Decks', []):
-                        self.db_client.save_deck_and_cards(deck_data, tournament_id)
 
                 self._update_status(i + 1, total_tournaments, f"Processing tournament: {tournament_data.get('Tournament', {}).get('Name', 'Unknown')}")
                 await asyncio.sleep(0.001)
@@ -70,6 +64,24 @@ class MetagameService:
             logger.exception("An error occurred during metagame data update from cache.")
             self.task_status.update({"status": "failed", "error": str(e)})
 
+    def ingest_tournament(self, tournament_data: Dict[str, Any], format_name: Optional[str] = None) -> bool:
+        """
+        Saves one tournament from the decklist cache and its decks, in a single transaction.
+        This is the unit of work of the populate job queue (see workers/).
+        Returns False if the tournament was not saved (e.g. already present).
+        """
+        with self.db_client.transaction() as conn:
+            tournament_id = self.db_client.save_tournament(tournament_data, format_name, conn=conn)
+            if not tournament_id:
+                return False
+
+            # Now, save the decks for this tournament, using the correct key 'Decks'
+            for deck_data in tournament_data.get('Decks', []):
+                self.db_client.save_deck_and_cards(deck_data, tournament_id, conn=conn)
+
+        logger.info(f"Successfully saved tournament '{tournament_data.get('Tournament', {}).get('Name')}' with ID {tournament_id}")
+        return True
+
     def _load_tournament_to_db(self, tournament_data: Dict[str, Any]):
         """
         Loads a single tournament's data from Melee.gg into the database, 
@@ -92,7 +104,7 @@ class MetagameService:
                     # Insert tournament and get its database ID
                     cursor.execute(
                         """
-                        INSERT INTO tournaments (tournament_uuid, tournament_name, tournament_date, source_id, format_id)
+                        INSERT INTO analysis_tournaments (tournament_uuid, tournament_name, tournament_date, source_id, format_id)
                         VALUES (%s, %s, %s, %s, %s) RETURNING tournament_id;
                         """,
                         (tournament_data.get("id"), tournament_data.get("name"), tournament_data.get("date"), source_id, format_id)
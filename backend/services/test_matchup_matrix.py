@@ -0,0 +1,70 @@
+"""
+Matchup matrix cache: bounded LRU, one computation per key in flight, and
+request validation before the cache is reached
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from services.matchup_matrix import MatchupMatrixCache  # noqa: E402
+
+ROWS = [("Burn", "Amulet Titan", 6, 4), ("Amulet Titan", "Burn", 1, 1)]
+
+
+def test_cache_is_bounded_and_shares_computations():
+    calls = []
+
+    async def fetch_all(query, params):
+        calls.append(params["format_name"])
+        await asyncio.sleep(0.01)
+        return ROWS
+
+    async def scenario():
+        cache = MatchupMatrixCache(fetch_all, max_entries=2)
+        first, second = await asyncio.gather(cache.get("Modern", 14), cache.get("Modern", 14))
+        assert first is second and calls == ["Modern"]
+        assert sorted(first.archetypes) == ["Amulet Titan", "Burn"]
+        assert first.matches.sum() == 24
+
+        await cache.get("Legacy", 14)
+        await cache.get("Modern", 14)  # most recently used
+        await cache.get("Pauper", 14)
+        assert len(cache) == 2 and not cache._in_progress
+        await cache.get("Modern", 14)
+        assert calls == ["Modern", "Legacy", "Pauper"]
+
+    asyncio.run(scenario())
+
+
+def test_endpoint_rejects_unknown_format_and_window(monkeypatch):
+    pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from api import metagame
+
+    async def fetch_all(query, params):
+        return ROWS
+
+    # Importing the router opens no job queue (no data/ file in the working directory)
+    assert metagame._job_queue is None
+    monkeypatch.setattr(metagame, "matchup_matrices", MatchupMatrixCache(fetch_all))
+    app = FastAPI()
+    app.include_router(metagame.router, prefix="/api/v1/metagame")
+    client = TestClient(app)
+
+    assert client.get("/api/v1/metagame/analysis/matchup_matrix/NotAFormat").status_code == 404
+    assert client.get("/api/v1/metagame/analysis/matchup_matrix/Modern", params={"days": 100000}).status_code == 422
+    assert len(metagame.matchup_matrices) == 0
+
+    payload = client.get("/api/v1/metagame/analysis/matchup_matrix/Modern", params={"min_matches": 5}).json()
+    burn = payload["archetypes"].index("Burn")
+    titan = 1 - burn
+    assert payload["matrix"][burn][titan] == round(7 / 12, 4)
+    assert payload["matrix"][burn][burn] is None
@@ -0,0 +1,46 @@
+"""
+Schéma de l'API (models.py) et schéma d'analyse (database.py) dans la même
+base : les deux create_all coexistent et les workers y écrivent
+"""
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+BACKEND_DIR = Path(__file__).parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import models  # noqa: E402
+from database import DatabaseClient, analysis_tournaments_table, decks_table  # noqa: E402
+
+TOURNAMENT = {
+    "UID": "modern-challenge-32-2024-01-06",
+    "Tournament": {"Name": "Modern Challenge 32", "Date": "2024-01-06T15:00:00Z", "Format": "Modern"},
+    "Decks": [{"Player": "alice", "Result": "5-2", "Archetype": "Burn",
+               "Mainboard": [{"Count": 4, "CardName": "Lightning Bolt"}], "Sideboard": []}],
+}
+
+
+def test_api_and_analysis_schemas_share_one_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metalyzr.sqlite3'}")
+    # Ordre du démarrage réel : main.py d'abord, puis les workers
+    models.Base.metadata.create_all(bind=engine)
+    database = DatabaseClient(engine)
+    database.init_db()
+
+    tournament_id = database.save_tournament(TOURNAMENT)
+    database.save_deck_and_cards(TOURNAMENT["Decks"][0], tournament_id)
+
+    with Session(engine) as session:
+        session.add(models.Tournament(uuid="local-1", name="Local event", format="Modern", date=datetime(2024, 1, 7, tzinfo=timezone.utc)))
+        session.commit()
+
+    with engine.connect() as conn:
+        assert conn.execute(select(analysis_tournaments_table.c.tournament_uuid)).scalar_one() == TOURNAMENT["UID"]
+        assert conn.execute(select(decks_table.c.player_name)).scalar_one() == "alice"
+        assert conn.execute(text("SELECT name FROM tournaments")).scalar_one() == "Local event"
+    assert database.get_metagame_by_format("Modern")[0]["archetype"] == "Burn"
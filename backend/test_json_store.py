@@ -0,0 +1,75 @@
+"""
+Stockage embarqué de main_simple : une collection relue est identique à la
+liste écrite (ordre, doublons), et les réécritures ne touchent que le diff
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from json_store import JsonStore  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JsonStore(tmp_path / "store.sqlite3")
+    yield store
+    store.close()
+
+
+def test_replace_preserves_order(store):
+    x, y = {"id": 5, "name": "x"}, {"name": "y"}
+    store.replace_collection("tournaments", [x, y])
+    store.replace_collection("tournaments", [y, x])
+    assert store.load_collection("tournaments") == [y, x]
+
+
+def test_duplicates_are_kept(store):
+    a, b = {"id": 1, "format": "Modern"}, {"id": 1, "format": "Legacy"}
+    store.replace_collection("decks", [a, b, {"n": 1}, {"n": 1}])
+    store.append("decks", {"id": 1, "format": "Pauper"})
+    store.append_many("decks", [{"n": 1}, {"id": 2}])
+
+    assert store.load_collection("decks") == [a, b, {"n": 1}, {"n": 1}, {"id": 1, "format": "Pauper"}, {"n": 1}, {"id": 2}]
+    total, by_format = store.counts("decks")
+    assert total == 7
+    assert (by_format["Modern"], by_format["Legacy"], by_format["Pauper"]) == (1, 1, 1)
+
+    # Relire puis réécrire la même liste ne change rien
+    records = store.load_collection("decks")
+    store.replace_collection("decks", records)
+    assert store.load_collection("decks") == records
+
+
+def test_reorder_only_rewrites_positions(store):
+    records = [{"id": i} for i in range(3)]
+    store.replace_collection("tournaments", records)
+    seqs = {row[0] for row in store._conn.execute("SELECT seq FROM records")}
+    store.replace_collection("tournaments", records[::-1])
+    assert {row[0] for row in store._conn.execute("SELECT seq FROM records")} == seqs
+    assert store.load_collection("tournaments") == records[::-1]
+
+
+def test_migrates_store_without_positions(tmp_path):
+    path = tmp_path / "old.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE records (seq INTEGER PRIMARY KEY AUTOINCREMENT, collection TEXT NOT NULL, "
+        "key TEXT NOT NULL, format TEXT NOT NULL, data TEXT NOT NULL, UNIQUE (collection, key))"
+    )
+    conn.executemany(
+        "INSERT INTO records (collection, key, format, data) VALUES ('decks', ?, 'Unknown', ?)",
+        [("#1", '{"n":1}'), ("7", '{"id":7}')]
+    )
+    conn.commit()
+    conn.close()
+
+    store = JsonStore(path)
+    assert store.load_collection("decks") == [{"n": 1}, {"id": 7}]
+    store.append("decks", {"n": 2})
+    assert store.load_collection("decks")[-1] == {"n": 2}
+    store.close()
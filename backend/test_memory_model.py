@@ -0,0 +1,123 @@
+"""
+Listes et statistiques de main_simple servies depuis le modèle en mémoire,
+écrites en base par lots
+"""
+import asyncio
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent
+
+
+def test_endpoints_served_from_model(tmp_path, monkeypatch):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(BACKEND_DIR))
+    monkeypatch.delitem(sys.modules, "main_simple", raising=False)
+    monkeypatch.setitem(sys.modules, "integrations.integration_service", None)
+
+    import main_simple
+
+    with TestClient(main_simple.app) as client:
+        assert client.get("/api/tournaments").json()["tournaments"] == []
+
+        for name, fmt in (("Challenge 1", "Modern"), ("Challenge 2", "Modern"), ("Showcase", "Legacy")):
+            response = client.post("/api/tournaments", json={"name": name, "date": "2024-01-06", "format": fmt})
+            assert response.status_code == 201
+
+        tournaments = client.get("/api/tournaments").json()
+        assert [t["name"] for t in tournaments["tournaments"]] == ["Challenge 1", "Challenge 2", "Showcase"]
+        assert tournaments["mode"] == "local"
+
+        stats = client.get("/api/stats").json()
+        assert (stats["tournaments"], stats["formats"]) == (3, {"Modern": 2, "Legacy": 1})
+
+    # Écrit en base à l'arrêt, relu au démarrage suivant
+    assert [t["name"] for t in main_simple.JsonStore(tmp_path / "data" / "metalyzr.sqlite3").load_collection("tournaments")] == [
+        "Challenge 1", "Challenge 2", "Showcase"
+    ]
+
+
+def test_integration_sync_keeps_user_records(tmp_path, monkeypatch):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    class FakeIntegrationService:
+        tournaments = [{"name": "Live Challenge", "format": "Modern"}]
+
+        def create_sample_archetype_data(self, format_name):
+            pass
+
+        async def get_complete_tournament_data(self):
+            return {"tournaments": list(self.tournaments)}
+
+        async def get_archetype_analysis(self):
+            return {"archetypes": []}
+
+        def close(self):
+            pass
+
+    fake_module = types.ModuleType("integrations.integration_service")
+    fake_module.IntegrationService = FakeIntegrationService
+    monkeypatch.setitem(sys.modules, "integrations.integration_service", fake_module)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(BACKEND_DIR))
+    monkeypatch.delitem(sys.modules, "main_simple", raising=False)
+
+    import main_simple
+
+    with TestClient(main_simple.app) as client:
+        deadline = time.monotonic() + 10
+        while client.get("/ready").status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        response = client.post("/api/tournaments", json={"name": "Local", "date": "2024-01-06", "format": "Legacy"})
+        assert response.status_code == 201
+
+        client.portal.call(main_simple.sync_integration_data)
+        assert [t["name"] for t in client.get("/api/tournaments").json()["tournaments"]] == ["Local", "Live Challenge"]
+
+        # Une resynchronisation remplace les données des intégrations, pas celles créées via l'API
+        FakeIntegrationService.tournaments = [{"name": "Live League", "format": "Pauper"}]
+        client.portal.call(main_simple.sync_integration_data)
+        assert [t["name"] for t in client.get("/api/tournaments").json()["tournaments"]] == ["Local", "Live League"]
+
+        stats = client.get("/api/stats").json()
+        assert (stats["tournaments"], stats["formats"], stats["mode"]) == (2, {"Legacy": 1, "Pauper": 1}, "live")
+
+
+class FailingStore:
+    """Store dont les écritures échouent tant que `fail` est vrai"""
+
+    def __init__(self):
+        self.fail = True
+        self.appended: list = []
+
+    def append_many(self, name, records):
+        if self.fail:
+            return False
+        self.appended.extend(records)
+        return True
+
+
+def test_failed_flush_is_retried(monkeypatch):
+    monkeypatch.syspath_prepend(str(BACKEND_DIR))
+    from memory_model import MemoryModel
+
+    store = FailingStore()
+    model = MemoryModel(store, collections=("tournaments",))
+    model.add("tournaments", {"name": "Challenge 1"})
+
+    asyncio.run(model.flush())
+    assert store.appended == []
+
+    model.add("tournaments", {"name": "Challenge 2"})
+    store.fail = False
+    asyncio.run(model.flush())
+    assert [t["name"] for t in store.appended] == ["Challenge 1", "Challenge 2"]
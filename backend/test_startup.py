@@ -0,0 +1,99 @@
+"""
+Démarrage à froid de main_simple : l'import reste léger, les intégrations
+sont construites une seule fois, en tâche de fond
+"""
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent
+
+# Budget large : l'import ne doit faire que définir l'application
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def _import_profile(tmp_path: Path) -> Tuple[str, str]:
+    code = (
+        "import sys, main_simple\n"
+        "print('integration_module_loaded', 'integrations.integration_service' in sys.modules)\n"
+        "print('integration_service', main_simple.integration_service)\n"
+        "print('warmup', main_simple.warmup_status['status'])\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(BACKEND_DIR))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result.stdout, result.stderr
+
+
+def test_import_does_no_startup_work(tmp_path):
+    stdout, stderr = _import_profile(tmp_path)
+
+    assert "integration_module_loaded False" in stdout
+    assert "integration_service None" in stdout
+    assert "warmup pending" in stdout
+
+    # -X importtime : "import time: self [us] | cumulative | module"
+    cumulative = [
+        int(match.group(1))
+        for match in re.finditer(r"import time:\s+\d+ \|\s+(\d+) \|\s*main_simple$", stderr, re.MULTILINE)
+    ]
+    assert cumulative, "main_simple missing from the import profile"
+    assert cumulative[0] / 1e6 < IMPORT_BUDGET_SECONDS
+
+
+def test_integrations_built_once_by_background_warmup(tmp_path, monkeypatch):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    built = []
+
+    class SlowIntegrationService:
+        def __init__(self):
+            time.sleep(0.2)
+            built.append(self)
+
+        def create_sample_archetype_data(self, format_name):
+            pass
+
+        def close(self):
+            pass
+
+    fake_module = types.ModuleType("integrations.integration_service")
+    fake_module.IntegrationService = SlowIntegrationService
+    monkeypatch.setitem(sys.modules, "integrations.integration_service", fake_module)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(BACKEND_DIR))
+    monkeypatch.delitem(sys.modules, "main_simple", raising=False)
+
+    import main_simple
+
+    with TestClient(main_simple.app) as client:
+        # Le serveur répond pendant le warm-up
+        assert client.get("/health").status_code == 200
+
+        # Appels concurrents pendant le warm-up : une seule construction
+        threads = [threading.Thread(target=main_simple.init_integrations) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        deadline = time.monotonic() + 10
+        while client.get("/ready").status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        ready = client.get("/ready").json()
+        assert ready["ready"] and ready["integrations_available"]
+
+    assert len(built) == 1
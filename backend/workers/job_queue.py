@@ -0,0 +1,315 @@
+"""
+Durable job queue backed by a local SQLite database.
+
+A job (e.g. "populate") is split into work units (one per tournament file).
+Worker processes claim units atomically, optionally restricted to a set of
+formats, so several workers can ingest different formats concurrently.
+Job state and progress survive API restarts and are visible to every API
+worker. A unit whose worker died is re-queued once its lease expires (and
+failed once it has used max_attempts); a job whose planning worker died (no
+heartbeat for a lease) is planned again.
+"""
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_PATH = os.getenv("JOB_QUEUE_PATH", "data/job_queue.sqlite3")
+
+# Job lifecycle: pending -> planning -> running -> completed | failed
+ACTIVE_JOB_STATUSES = ("pending", "planning", "running")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    message TEXT NOT NULL DEFAULT '',
+    error TEXT,
+    worker TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_units (
+    unit_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL REFERENCES jobs(job_id),
+    format TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    leased_until REAL,
+    error TEXT,
+    UNIQUE (job_id, payload)
+);
+CREATE INDEX IF NOT EXISTS ix_job_units_claim ON job_units (status, format);
+CREATE INDEX IF NOT EXISTS ix_job_units_job ON job_units (job_id, status);
+"""
+
+class JobQueue:
+    """
+    SQLite job/unit tables. Each call opens its own short-lived connection,
+    so the queue can be shared by API threads and worker processes.
+    """
+    def __init__(self, path: str = DEFAULT_QUEUE_PATH, lease_seconds: int = 300, max_attempts: int = 3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction taking the database lock up front (atomic claims)."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    # --- Jobs ---
+
+    def create_job(self, kind: str, params: Dict[str, Any]) -> Optional[int]:
+        """
+        Creates a pending job. Returns None if a job of this kind is already active.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            active = conn.execute(
+                f"SELECT job_id FROM jobs WHERE kind = ? AND status IN ({','.join('?' * len(ACTIVE_JOB_STATUSES))})",
+                (kind, *ACTIVE_JOB_STATUSES)
+            ).fetchone()
+            if active:
+                return None
+            cursor = conn.execute(
+                "INSERT INTO jobs (kind, status, params, message, created_at, updated_at) VALUES (?, 'pending', ?, ?, ?, ?)",
+                (kind, json.dumps(params), "Waiting for a worker...", now, now)
+            )
+            return cursor.lastrowid
+
+    def claim_planning(self, worker: str) -> Optional[Dict[str, Any]]:
+        """
+        Claims a pending job so that this worker splits it into units.
+        A job left in 'planning' without a heartbeat for lease_seconds (its
+        worker crashed) is reclaimed; units it already added are kept.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT job_id, kind, params, status, worker FROM jobs "
+                "WHERE status = 'pending' OR (status = 'planning' AND updated_at < ?) "
+                "ORDER BY job_id LIMIT 1",
+                (now - self.lease_seconds,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row["status"] == "planning":
+                logger.warning(f"Reclaiming job {row['job_id']}: planning lease of {row['worker']} expired")
+            conn.execute(
+                "UPDATE jobs SET status = 'planning', worker = ?, message = ?, updated_at = ? WHERE job_id = ?",
+                (worker, "Listing tournaments...", now, row["job_id"])
+            )
+            return {"job_id": row["job_id"], "kind": row["kind"], "params": json.loads(row["params"])}
+
+    def add_units(self, job_id: int, units: Iterable[Tuple[str, str]], batch_size: int = 1000) -> int:
+        """
+        Adds (format, payload) work units to a job being planned.
+        """
+        added = 0
+        batch: List[Tuple[int, str, str]] = []
+        for format_name, payload in units:
+            batch.append((job_id, format_name, payload))
+            if len(batch) >= batch_size:
+                added += self._insert_units(batch)
+                batch = []
+        if batch:
+            added += self._insert_units(batch)
+        return added
+
+    def _insert_units(self, batch: List[Tuple[int, str, str]]) -> int:
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO job_units (job_id, format, payload) VALUES (?, ?, ?)",
+                batch
+            )
+            # Heartbeat: keeps the planning lease while the cache is being listed
+            conn.execute("UPDATE jobs SET updated_at = ? WHERE job_id = ?", (time.time(), batch[0][0]))
+        return len(batch)
+
+    def start_job(self, job_id: int):
+        """
+        Marks a planned job as running (or completed right away if it has no units).
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'running', message = ?, updated_at = ? WHERE job_id = ?",
+                ("Processing tournaments...", time.time(), job_id)
+            )
+            self._finish_if_done(conn, job_id)
+
+    def fail_job(self, job_id: int, error: str):
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, updated_at = ? WHERE job_id = ?",
+                (error, time.time(), job_id)
+            )
+
+    def _finish_if_done(self, conn: sqlite3.Connection, job_id: int):
+        remaining = conn.execute(
+            "SELECT COUNT(*) FROM job_units WHERE job_id = ? AND status IN ('queued', 'running')",
+            (job_id,)
+        ).fetchone()[0]
+        if remaining:
+            return
+        counts = self._unit_counts(conn, job_id)
+        conn.execute(
+            "UPDATE jobs SET status = 'completed', message = ?, updated_at = ? WHERE job_id = ? AND status = 'running'",
+            (f"Finished processing. Saved {counts.get('done', 0)}/{sum(counts.values())} tournaments "
+             f"({counts.get('failed', 0)} failed).", time.time(), job_id)
+        )
+
+    # --- Units ---
+
+    def claim_unit(self, worker: str, formats: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Claims the next queued unit (or one whose lease expired) of a running job.
+        Restricting `formats` partitions the work between workers. An expired
+        unit that already used max_attempts (it keeps crashing its worker) is
+        failed instead of being handed out again.
+        """
+        now = time.time()
+        query = (
+            "SELECT u.unit_id, u.job_id, u.format, u.payload, u.attempts FROM job_units u "
+            "JOIN jobs j ON j.job_id = u.job_id "
+            "WHERE j.status = 'running' "
+            "AND (u.status = 'queued' OR (u.status = 'running' AND u.leased_until < ? AND u.attempts < ?))"
+        )
+        params: List[Any] = [now, self.max_attempts]
+        if formats:
+            query += f" AND u.format IN ({','.join('?' * len(formats))})"
+            params.extend(formats)
+        query += " ORDER BY u.unit_id LIMIT 1"
+
+        with self._transaction() as conn:
+            self._fail_exhausted_leases(conn, now)
+            row = conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE job_units SET status = 'running', attempts = attempts + 1, worker = ?, leased_until = ? WHERE unit_id = ?",
+                (worker, now + self.lease_seconds, row["unit_id"])
+            )
+            unit = dict(row)
+            unit["attempts"] += 1
+            return unit
+
+    def _fail_exhausted_leases(self, conn: sqlite3.Connection, now: float):
+        """Fails expired units that reached max_attempts (and completes their jobs if done)."""
+        condition = "status = 'running' AND leased_until < ? AND attempts >= ?"
+        job_ids = [row[0] for row in conn.execute(
+            f"SELECT DISTINCT job_id FROM job_units WHERE {condition}", (now, self.max_attempts)
+        )]
+        if not job_ids:
+            return
+        conn.execute(
+            f"UPDATE job_units SET status = 'failed', leased_until = NULL, "
+            f"error = COALESCE(error, 'Worker lease expired after ' || attempts || ' attempts') WHERE {condition}",
+            (now, self.max_attempts)
+        )
+        for job_id in job_ids:
+            logger.warning(f"Failing units of job {job_id} whose worker lease expired {self.max_attempts} times")
+            self._finish_if_done(conn, job_id)
+
+    def complete_unit(self, unit: Dict[str, Any], skipped: bool = False):
+        """
+        Marks a unit as done ('skipped' when the tournament was already in the database).
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE job_units SET status = ?, leased_until = NULL, error = NULL WHERE unit_id = ?",
+                ("skipped" if skipped else "done", unit["unit_id"])
+            )
+            self._finish_if_done(conn, unit["job_id"])
+
+    def fail_unit(self, unit: Dict[str, Any], error: str):
+        """
+        Re-queues a unit after an error, or fails it once max_attempts is reached.
+        """
+        status = "failed" if unit["attempts"] >= self.max_attempts else "queued"
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE job_units SET status = ?, leased_until = NULL, error = ? WHERE unit_id = ?",
+                (status, error, unit["unit_id"])
+            )
+            self._finish_if_done(conn, unit["job_id"])
+
+    # --- Status ---
+
+    @staticmethod
+    def _unit_counts(conn: sqlite3.Connection, job_id: int) -> Dict[str, int]:
+        rows = conn.execute(
+            "SELECT status, COUNT(*) FROM job_units WHERE job_id = ? GROUP BY status",
+            (job_id,)
+        ).fetchall()
+        return {status: count for status, count in rows}
+
+    def job_status(self, job_id: Optional[int] = None, kind: str = "populate") -> Dict[str, Any]:
+        """
+        Status of a job (default: the latest job of `kind`), in the same shape
+        as the former in-memory task_status dict, plus per-format progress.
+        """
+        with self._connect() as conn:
+            if job_id is None:
+                job = conn.execute(
+                    "SELECT * FROM jobs WHERE kind = ? ORDER BY job_id DESC LIMIT 1", (kind,)
+                ).fetchone()
+            else:
+                job = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+
+            if job is None:
+                return {"status": "idle", "progress": 0, "total": 0, "message": "", "error": None}
+
+            counts = self._unit_counts(conn, job["job_id"])
+            by_format = conn.execute(
+                "SELECT format, SUM(status IN ('done', 'skipped', 'failed')), COUNT(*) "
+                "FROM job_units WHERE job_id = ? GROUP BY format",
+                (job["job_id"],)
+            ).fetchall()
+
+        total = sum(counts.values())
+        return {
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "progress": counts.get("done", 0) + counts.get("skipped", 0) + counts.get("failed", 0),
+            "total": total,
+            "saved": counts.get("done", 0),
+            "skipped": counts.get("skipped", 0),
+            "failed": counts.get("failed", 0),
+            "formats": {fmt: {"progress": progress, "total": count} for fmt, progress, count in by_format},
+            "params": json.loads(job["params"]),
+            "message": job["message"],
+            "error": job["error"],
+        }
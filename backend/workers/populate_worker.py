@@ -0,0 +1,165 @@
+"""
+Worker process for the populate-database job.
+
+Plans pending jobs (one unit per tournament file of the decklist cache) and
+ingests units into the database. Run one or more workers next to the API:
+
+    python -m workers.populate_worker --processes 4
+    python -m workers.populate_worker --format Modern --format Pioneer
+    python -m workers.populate_worker --format Legacy --drain
+
+Workers started with --format only claim units of those formats, so
+formats can be ingested concurrently by dedicated processes.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import re
+import socket
+import time
+from datetime import date
+from typing import Iterator, List, Optional, Tuple
+
+from workers.job_queue import DEFAULT_QUEUE_PATH, JobQueue
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_ROOT = "data/MTG_decklistcache"
+
+# Formats recognised in tournament file names (e.g. "modern-challenge-32-2024-01-06.json")
+KNOWN_FORMATS = [
+    "Standard", "Modern", "Legacy", "Vintage", "Pioneer", "Pauper", "Premodern", "Commander", "Limited"
+]
+
+# Whole words only, longest name first ("premodern-..." is Premodern, not Modern)
+FORMAT_PATTERNS = [
+    (format_name, re.compile(rf"(?<![a-z]){format_name.lower()}(?![a-z])"))
+    for format_name in sorted(KNOWN_FORMATS, key=len, reverse=True)
+]
+
+DATE_RE = re.compile(r"(\d{4})[/\\-](\d{2})[/\\-](\d{2})")
+
+def tournament_format(filepath: str) -> str:
+    name = os.path.basename(filepath).lower()
+    for format_name, pattern in FORMAT_PATTERNS:
+        if pattern.search(name):
+            return format_name
+    return "Unknown"
+
+def tournament_date(filepath: str) -> Optional[date]:
+    """Date from the cache layout (.../{yyyy}/{mm}/{dd}/...) or the file name."""
+    match = DATE_RE.search(filepath)
+    if not match:
+        return None
+    try:
+        return date(*(int(part) for part in match.groups()))
+    except ValueError:
+        return None
+
+def plan_units(reader, format_name: Optional[str] = None, start_date: Optional[date] = None) -> Iterator[Tuple[str, str]]:
+    """
+    (format, path) of every tournament file to ingest, without reading the files.
+    """
+    for filepath in reader.iter_tournament_files():
+        unit_format = tournament_format(filepath)
+        if format_name and unit_format.lower() != format_name.lower():
+            continue
+        if start_date:
+            file_date = tournament_date(filepath)
+            if file_date and file_date < start_date:
+                continue
+        yield unit_format, filepath
+
+class PopulateWorker:
+    def __init__(self, queue: JobQueue, cache_root: str = DEFAULT_CACHE_ROOT, formats: Optional[List[str]] = None,
+                 database_client=None):
+        # Imported here so that each worker process opens its own database connection pool
+        from database import DatabaseClient
+        from integrations.decklist_cache_reader import DecklistCacheReader
+        from services.metagame_service import MetagameService
+
+        self.queue = queue
+        self.formats = formats or None
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.reader = DecklistCacheReader(cache_root)
+        database_client = database_client or DatabaseClient()
+        database_client.init_db()
+        self.service = MetagameService(database_client=database_client, task_status_dict={}, cache_reader=self.reader)
+
+    def plan(self, job: dict):
+        params = job["params"]
+        start_date = date.fromisoformat(params["start_date"]) if params.get("start_date") else None
+        try:
+            count = self.queue.add_units(job["job_id"], plan_units(self.reader, params.get("format_name"), start_date))
+            logger.info(f"Planned job {job['job_id']}: {count} tournaments")
+            self.queue.start_job(job["job_id"])
+        except Exception as e:
+            logger.exception(f"Failed to plan job {job['job_id']}")
+            self.queue.fail_job(job["job_id"], str(e))
+
+    def process(self, unit: dict):
+        tournament_data = self.reader.read_tournament(unit["payload"])
+        if tournament_data is None:
+            self.queue.fail_unit(unit, "Could not read tournament file")
+            return
+        try:
+            saved = self.service.ingest_tournament(tournament_data, unit["format"])
+        except Exception as e:
+            logger.error(f"Error ingesting {unit['payload']}: {e}", exc_info=True)
+            self.queue.fail_unit(unit, str(e))
+            return
+        self.queue.complete_unit(unit, skipped=not saved)
+
+    def run(self, poll_interval: float = 2.0, drain: bool = False):
+        """
+        Processes units until stopped (or until no work is left with drain=True).
+        """
+        logger.info(f"Worker {self.worker_id} started (formats: {self.formats or 'all'})")
+        while True:
+            job = self.queue.claim_planning(self.worker_id)
+            if job:
+                self.plan(job)
+                continue
+
+            unit = self.queue.claim_unit(self.worker_id, self.formats)
+            if unit:
+                self.process(unit)
+                continue
+
+            if drain:
+                logger.info(f"Worker {self.worker_id}: no work left, exiting")
+                return
+            time.sleep(poll_interval)
+
+def run_worker(queue_path: str, cache_root: str, formats: Optional[List[str]], poll_interval: float, drain: bool):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(levelname)s %(message)s")
+    worker = PopulateWorker(JobQueue(queue_path), cache_root, formats)
+    worker.run(poll_interval=poll_interval, drain=drain)
+
+def main():
+    parser = argparse.ArgumentParser(description="Metalyzr populate-database worker")
+    parser.add_argument("--queue", default=DEFAULT_QUEUE_PATH, help="SQLite job queue path")
+    parser.add_argument("--cache-root", default=DEFAULT_CACHE_ROOT, help="Decklist cache directory")
+    parser.add_argument("--format", dest="formats", action="append", help="Only process this format (repeatable)")
+    parser.add_argument("--processes", type=int, default=1, help="Number of worker processes")
+    parser.add_argument("--poll-interval", type=float, default=2.0)
+    parser.add_argument("--drain", action="store_true", help="Exit when the queue is empty")
+    args = parser.parse_args()
+
+    worker_args = (args.queue, args.cache_root, args.formats, args.poll_interval, args.drain)
+    if args.processes <= 1:
+        run_worker(*worker_args)
+        return
+
+    processes = [
+        multiprocessing.Process(target=run_worker, args=worker_args, name=f"populate-worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Worker du job populate : construction réelle (DatabaseClient sur SQLite) et
+traitement d'une unité de bout en bout
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from database import DatabaseClient, analysis_tournaments_table, decks_table, deck_cards_table, formats_table  # noqa: E402
+from workers.job_queue import JobQueue  # noqa: E402
+from workers.populate_worker import PopulateWorker, tournament_format  # noqa: E402
+
+TOURNAMENT = {
+    "Tournament": {"Name": "Modern Challenge 32", "Date": "2024-01-06T15:00:00Z", "Uri": "https://www.mtgo.com/decklist/modern-challenge-32-2024-01-06"},
+    "Decks": [
+        {
+            "Player": "alice", "Result": "5-2",
+            "Mainboard": [{"Count": 4, "CardName": "Lightning Bolt"}, {"Count": 20, "CardName": "Mountain"}],
+            "Sideboard": [{"Count": 2, "CardName": "Smash to Smithereens"}],
+        },
+        {
+            "Player": "bob", "Result": "4-3",
+            "Mainboard": [{"Count": 4, "CardName": "Lightning Bolt"}, {"Count": 4, "CardName": "Ragavan, Nimble Pilferer"}],
+            "Sideboard": [],
+        },
+    ],
+}
+
+
+@pytest.fixture
+def cache_root(tmp_path):
+    directory = tmp_path / "MTG_decklistcache" / "Tournaments" / "mtgo.com" / "2024" / "01" / "06"
+    directory.mkdir(parents=True)
+    (directory / "modern-challenge-32-2024-01-06.json").write_text(json.dumps(TOURNAMENT))
+    return tmp_path / "MTG_decklistcache"
+
+
+def test_worker_processes_one_unit(tmp_path, cache_root, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # data/archetype_formats du moteur d'archétypes
+    engine = create_engine(f"sqlite:///{tmp_path / 'metalyzr.sqlite3'}")
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"))
+    job_id = queue.create_job("populate", {"format_name": "Modern", "start_date": None})
+
+    worker = PopulateWorker(queue, str(cache_root), formats=["Modern"], database_client=DatabaseClient(engine))
+    worker.run(drain=True)
+
+    status = queue.job_status(job_id)
+    assert status["status"] == "completed"
+    assert (status["saved"], status["failed"]) == (1, 0)
+
+    with engine.connect() as conn:
+        tournament = conn.execute(select(analysis_tournaments_table)).one()
+        assert tournament.tournament_uuid == "modern-challenge-32-2024-01-06"
+        assert conn.execute(select(formats_table.c.format_name)).scalar_one() == "Modern"
+        assert len(conn.execute(select(decks_table)).all()) == 2
+        assert len(conn.execute(select(deck_cards_table)).all()) == 5
+
+    # Une seconde passe ne réenregistre pas le tournoi
+    queue.create_job("populate", {"format_name": "Modern", "start_date": None})
+    worker.run(drain=True)
+    assert queue.job_status()["skipped"] == 1
+
+
+def test_tournament_format_prefers_longest_name():
+    assert tournament_format("/x/premodern-challenge-2024-01-01.json") == "Premodern"
+    assert tournament_format("/x/modern-challenge-2024-01-01.json") == "Modern"
+
+
+def test_stuck_planning_job_is_reclaimed(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=60)
+    job_id = queue.create_job("populate", {})
+    assert queue.claim_planning("crashed-worker")["job_id"] == job_id
+    assert queue.claim_planning("other-worker") is None
+    assert queue.create_job("populate", {}) is None
+
+    # Plus de heartbeat depuis plus d'un bail : le job est repris
+    expired = JobQueue(queue.path, lease_seconds=0)
+    assert expired.claim_planning("other-worker")["job_id"] == job_id
+    assert expired.job_status(job_id)["status"] == "planning"
+
+
+def test_unit_crashing_its_worker_is_failed_after_max_attempts(tmp_path):
+    # Bail nul : chaque bail a expiré dès le claim suivant (worker mort)
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0, max_attempts=2)
+    job_id = queue.create_job("populate", {})
+    queue.claim_planning("planner")
+    queue.add_units(job_id, [("Modern", "/x/modern-challenge.json")])
+    queue.start_job(job_id)
+
+    assert queue.claim_unit("worker-1")["attempts"] == 1
+    assert queue.claim_unit("worker-2")["attempts"] == 2
+    assert queue.claim_unit("worker-3") is None
+
+    status = queue.job_status(job_id)
+    assert (status["status"], status["failed"]) == ("completed", 1)
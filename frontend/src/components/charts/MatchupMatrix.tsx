@@ -6,7 +6,8 @@ interface MatchupMatrixProps {
 }
 
 // Helper function to get a color based on winrate
-const getColorForWinrate = (winrate: number): string => {
+const getColorForWinrate = (winrate: number | null): string => {
+  if (winrate === null) return '#fafafa'; // Not enough matches
   if (winrate > 0.6) return '#d4edda'; // Strong win
   if (winrate > 0.52) return '#e2f0d9'; // Slight edge
   if (winrate < 0.4) return '#f8d7da'; // Strong loss
@@ -15,7 +16,7 @@ const getColorForWinrate = (winrate: number): string => {
 };
 
 export const MatchupMatrix: React.FC<MatchupMatrixProps> = ({ data }) => {
-  const { archetypes, matrix } = data;
+  const { archetypes, matrix, matches, min_matches } = data;
 
   return (
     <div style={{ overflowX: 'auto' }}>
@@ -42,10 +43,15 @@ export const MatchupMatrix: React.FC<MatchupMatrixProps> = ({ data }) => {
                     border: '1px solid #ddd', 
                     textAlign: 'center',
                     backgroundColor: getColorForWinrate(winrate),
-                    color: rowIndex === colIndex ? '#999' : 'inherit'
+                    color: winrate === null ? '#999' : 'inherit'
                   }}
+                  title={
+                    rowIndex === colIndex
+                      ? undefined
+                      : `${matches[rowIndex][colIndex]} matches${winrate === null ? ` (fewer than ${min_matches})` : ''}`
+                  }
                 >
-                  {rowIndex === colIndex ? '—' : `${(winrate * 100).toFixed(0)}%`}
+                  {winrate === null ? '—' : `${(winrate * 100).toFixed(0)}%`}
                 </td>
               ))}
             </tr>
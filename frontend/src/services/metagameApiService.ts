@@ -9,6 +9,19 @@ export interface MetagameShare {
     prevalence: float;
 }
 
+// GET /api/v1/metagame/analysis/matchup_matrix/{format}
+// matrix[i][j] is the win rate (0-1) of archetypes[i] against archetypes[j],
+// null on the diagonal and when fewer than min_matches were played.
+export interface MatchupMatrixData {
+    format: string;
+    archetypes: string[];
+    matrix: (number | null)[][];
+    wins: number[][];
+    matches: number[][];
+    min_matches: number;
+    total_archetypes: number;
+}
+
 // --- API Service Functions ---
 
 export const metagameApiService = {